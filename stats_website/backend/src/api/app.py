@@ -1,9 +1,13 @@
 """Flask application factory and configuration."""
 
-from flask import Flask
+import psycopg2
+from flask import Flask, jsonify
 from flask_cors import CORS
 
+from src.api.compression import init_compression
+from src.api.json_provider import init_json
 from src.api.routes import register_routes
+from src.dal.unit_of_work import begin_unit_of_work, current_unit_of_work, end_unit_of_work
 
 
 def create_app() -> Flask:
@@ -14,6 +18,12 @@ def create_app() -> Flask:
     """
     app = Flask(__name__)
     
+    # Fast JSON for every response (dates, Decimals and dataclasses included)
+    init_json(app)
+    
+    # gzip/brotli for JSON bodies the client accepts compressed
+    init_compression(app)
+    
     # Configure secret key for sessions
     app.config["SECRET_KEY"] = "your-secret-key-change-in-production"
     
@@ -29,6 +39,37 @@ def create_app() -> Flask:
         ],
     )
     
+    # One connection and one transaction per request, opened on first DAO use
+    @app.before_request
+    def open_unit_of_work():
+        """Start the request's unit of work."""
+        begin_unit_of_work()
+
+    @app.after_request
+    def commit_unit_of_work(response):
+        """Commit before the response leaves, or roll back when the request failed.
+
+        A commit that fails turns the response into a 500.
+        """
+        uow = current_unit_of_work()
+        if uow is None:
+            return response
+        if response.status_code >= 400:
+            uow.rollback_only = True
+            return response
+        try:
+            uow.commit()
+        except psycopg2.Error as e:
+            uow.rollback_only = True
+            response = jsonify({"error": f"Internal server error: {str(e)}"})
+            response.status_code = 500
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(exc):
+        """Roll back whatever was not committed and return the connection to the pool."""
+        end_unit_of_work(success=exc is None)
+    
     # Register routes
     register_routes(app)
     
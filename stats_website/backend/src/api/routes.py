@@ -3,6 +3,7 @@
 from functools import wraps
 from flask import Flask, jsonify, request, session
 
+from src.dal.connection_pool import get_pool_stats
 from src.services.auth_service import AuthService
 from src.services.statistics_service import StatisticsService
 
@@ -26,8 +27,8 @@ def register_routes(app: Flask) -> None:
     
     @app.route("/health", methods=["GET"])
     def health_check():
-        """Health check endpoint."""
-        return jsonify({"status": "ok"}), 200
+        """Health check endpoint, including connection pool stats."""
+        return jsonify({"status": "ok", "pools": get_pool_stats()}), 200
     
     @app.route("/login", methods=["POST"])
     def login():
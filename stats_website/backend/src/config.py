@@ -36,3 +36,42 @@ def get_connection_kwargs() -> dict:
         "password": cfg.password,
     }
 
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool configuration dataclass."""
+    min_size: int
+    max_size: int
+    idle_timeout: float
+    checkout_timeout: float
+    health_check_interval: float
+
+    @staticmethod
+    def from_env() -> "PoolConfig":
+        """Create PoolConfig from environment variables."""
+        return PoolConfig(
+            min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+            max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+            checkout_timeout=float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "30")),
+            health_check_interval=float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30")),
+        )
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    """Response compression configuration dataclass."""
+    enabled: bool
+    min_size: int
+    gzip_level: int
+    brotli_quality: int
+
+    @staticmethod
+    def from_env() -> "CompressionConfig":
+        """Create CompressionConfig from environment variables."""
+        return CompressionConfig(
+            enabled=os.getenv("COMPRESSION_ENABLED", "true").lower() == "true",
+            min_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+            gzip_level=int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+            brotli_quality=int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5")),
+        )
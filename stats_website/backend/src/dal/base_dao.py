@@ -7,6 +7,8 @@ import psycopg2
 import psycopg2.extras
 
 from src.config import get_connection_kwargs
+from src.dal.connection_pool import get_pool
+from src.dal.unit_of_work import current_unit_of_work
 
 
 class BaseDAO:
@@ -18,14 +20,27 @@ class BaseDAO:
 
     @contextmanager
     def _cursor(self) -> Generator[psycopg2.extensions.cursor, None, None]:
-        """Context manager for database cursor."""
-        conn = psycopg2.connect(**self._conn_kwargs)
+        """Context manager for a cursor on a pooled database connection."""
+        uow = current_unit_of_work()
+        if uow is not None:
+            # Share the unit of work's connection; it commits once at the end
+            conn = uow.connection(self._conn_kwargs)
+            try:
+                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                    yield cur
+            except Exception:
+                uow.rollback_only = True
+                raise
+            return
+
+        pool = get_pool(self._conn_kwargs)
+        conn = pool.getconn()
         try:
             with conn:
                 with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                     yield cur
         finally:
-            conn.close()
+            pool.putconn(conn)
 
     # Generic CRUD signatures (to be overridden in concrete DAOs)
     def list_all(self) -> Iterable[dict]:
@@ -0,0 +1,315 @@
+"""Process-wide, thread-safe PostgreSQL connection pool used by BaseDAO."""
+
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+from src.config import PoolConfig
+
+
+class PoolTimeoutError(psycopg2.pool.PoolError):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time snapshot of a pool's state."""
+
+    size: int
+    in_use: int
+    idle: int
+    waiting: int
+    checkouts: int
+    created: int
+    discarded: int
+    total_wait_time: float
+    max_wait_time: float
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.total_wait_time / self.checkouts if self.checkouts else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "size": self.size,
+            "inUse": self.in_use,
+            "idle": self.idle,
+            "waiting": self.waiting,
+            "checkouts": self.checkouts,
+            "created": self.created,
+            "discarded": self.discarded,
+            "totalWaitTime": round(self.total_wait_time, 6),
+            "avgWaitTime": round(self.avg_wait_time, 6),
+            "maxWaitTime": round(self.max_wait_time, 6),
+        }
+
+
+class ConnectionPool:
+    """Bounded pool of psycopg2 connections.
+
+    Connections are opened lazily up to ``max_size``. Idle connections beyond
+    ``min_size`` are closed once they have been unused for ``idle_timeout``
+    seconds, by a daemon thread that checks every half timeout (so a pool
+    nobody uses any more still lets them go). A connection that sat idle
+    for longer than ``health_check_interval`` is pinged before being handed
+    out, and replaced if the ping fails.
+    """
+
+    def __init__(self, conn_kwargs: dict, config: PoolConfig) -> None:
+        if config.max_size < 1:
+            raise ValueError("Pool max size must be at least 1")
+        if config.min_size < 0 or config.min_size > config.max_size:
+            raise ValueError("Pool min size must be between 0 and max size")
+
+        self._conn_kwargs = dict(conn_kwargs)
+        self._config = config
+        self._cond = threading.Condition(threading.Lock())
+        # Idle connections as (connection, returned_at) pairs, most recent last
+        self._idle: list[tuple[psycopg2.extensions.connection, float]] = []
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+        self._checkouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+
+    @property
+    def config(self) -> PoolConfig:
+        return self._config
+
+    def getconn(self, timeout: Optional[float] = None) -> psycopg2.extensions.connection:
+        """Check out a healthy connection, waiting up to ``timeout`` seconds."""
+        if timeout is None:
+            timeout = self._config.checkout_timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            conn, idle_since = self._acquire_slot(deadline)
+            if conn is None:
+                # A slot was reserved for a brand new connection
+                try:
+                    conn = psycopg2.connect(**self._conn_kwargs)
+                except Exception:
+                    self._release_slot()
+                    raise
+                with self._cond:
+                    self._created += 1
+            elif not self._is_healthy(conn, idle_since):
+                self._discard(conn)
+                continue
+
+            self._record_wait(time.monotonic() - started)
+            return conn
+
+    def putconn(self, conn: psycopg2.extensions.connection) -> None:
+        """Return a connection to the pool, discarding it if it is unusable."""
+        if conn.closed:
+            self._discard(conn)
+            return
+
+        status = conn.info.transaction_status
+        if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            self._discard(conn)
+            return
+        if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                self._discard(conn)
+                return
+
+        with self._cond:
+            self._in_use -= 1
+            if self._closed:
+                self._size -= 1
+                to_close = [conn]
+            else:
+                self._idle.append((conn, time.monotonic()))
+                to_close = self._reap_idle_locked()
+                self._ensure_reaper_locked()
+            self._cond.notify()
+        self._close_quietly(to_close)
+
+    def stats(self) -> PoolStats:
+        """Return a snapshot of the pool counters."""
+        with self._cond:
+            return PoolStats(
+                size=self._size,
+                in_use=self._in_use,
+                idle=len(self._idle),
+                waiting=self._waiting,
+                checkouts=self._checkouts,
+                created=self._created,
+                discarded=self._discarded,
+                total_wait_time=self._total_wait,
+                max_wait_time=self._max_wait,
+            )
+
+    def reap_idle(self) -> int:
+        """Close idle connections past ``idle_timeout``. Returns how many were closed."""
+        with self._cond:
+            to_close = self._reap_idle_locked()
+        self._close_quietly(to_close)
+        return len(to_close)
+
+    def close(self) -> None:
+        """Close all idle connections; checked-out ones are closed when returned."""
+        with self._cond:
+            self._closed = True
+            self._reaper_stop.set()
+            to_close = [conn for conn, _ in self._idle]
+            self._size -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        self._close_quietly(to_close)
+
+    def _acquire_slot(
+        self, deadline: float
+    ) -> tuple[Optional[psycopg2.extensions.connection], float]:
+        """Pop an idle connection or reserve room for a new one, blocking if full."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise psycopg2.pool.PoolError("Connection pool is closed")
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    self._in_use += 1
+                    return conn, idle_since
+                if self._size < self._config.max_size:
+                    self._size += 1
+                    self._in_use += 1
+                    return None, 0.0
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No database connection available within "
+                        f"{self._config.checkout_timeout:g}s "
+                        f"(max size {self._config.max_size})"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._in_use -= 1
+            self._cond.notify()
+
+    def _discard(self, conn: psycopg2.extensions.connection) -> None:
+        with self._cond:
+            self._size -= 1
+            self._in_use -= 1
+            self._discarded += 1
+            self._cond.notify()
+        self._close_quietly([conn])
+
+    def _is_healthy(self, conn: psycopg2.extensions.connection, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self._config.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _reap_idle_locked(self) -> list:
+        """Detach expired idle connections; caller closes them outside the lock."""
+        if self._config.idle_timeout <= 0:
+            return []
+        cutoff = time.monotonic() - self._config.idle_timeout
+        reapable = self._size - self._config.min_size
+        expired = []
+        # Oldest idle connections sit at the front of the list
+        while reapable > 0 and self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.pop(0)
+            expired.append(conn)
+            self._size -= 1
+            reapable -= 1
+        return expired
+
+    def _ensure_reaper_locked(self) -> None:
+        if self._reaper is not None or self._config.idle_timeout <= 0:
+            return
+        self._reaper = threading.Thread(target=self._run_reaper, name="db-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _run_reaper(self) -> None:
+        interval = self._config.idle_timeout / 2
+        while not self._reaper_stop.wait(interval):
+            self.reap_idle()
+
+    def _record_wait(self, waited: float) -> None:
+        with self._cond:
+            self._checkouts += 1
+            self._total_wait += waited
+            if waited > self._max_wait:
+                self._max_wait = waited
+
+    @staticmethod
+    def _close_quietly(conns: list) -> None:
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+_pools: dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_pools_pid = os.getpid()
+
+
+def get_pool(conn_kwargs: dict) -> ConnectionPool:
+    """Return the process-wide pool for the given connection parameters."""
+    global _pools_pid
+    key = tuple(sorted(conn_kwargs.items()))
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            # Connections must never be shared across a fork
+            _pools.clear()
+            _pools_pid = os.getpid()
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(conn_kwargs, PoolConfig.from_env())
+            _pools[key] = pool
+        return pool
+
+
+def get_pool_stats() -> list[dict]:
+    """Return stats for every pool opened by this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats().to_dict() for pool in pools]
+
+
+def close_all_pools() -> None:
+    """Close every pool opened by this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
@@ -66,20 +66,20 @@ class LikeDAO(BaseDAO):
         return self.delete_by_user_and_vacation(user_id, vacation_id)
     
     def count_by_vacation(self, vacation_id: int) -> int:
-        """Count total likes for a specific vacation."""
+        """Count total likes for a specific vacation (reads the likes_count counter)."""
         with self._cursor() as cur:
             cur.execute(
-                "SELECT COUNT(*) FROM likes WHERE vacation_id = %s",
+                "SELECT likes_count FROM vacations WHERE id = %s",
                 (vacation_id,)
             )
             result = cur.fetchone()
-            return result["count"] if result else 0
+            return result["likes_count"] if result else 0
     
     def get_likes_count_by_vacation(self) -> dict[int, int]:
         """Get likes count for all vacations. Returns dict mapping vacation_id to count."""
         with self._cursor() as cur:
             cur.execute(
-                "SELECT vacation_id, COUNT(*) as count FROM likes GROUP BY vacation_id"
+                "SELECT id AS vacation_id, likes_count AS count FROM vacations WHERE likes_count > 0"
             )
             results = cur.fetchall()
             return {row["vacation_id"]: row["count"] for row in results}
@@ -98,13 +98,14 @@ class LikeDAO(BaseDAO):
             List of dicts with 'destination' and 'likes' keys, sorted by likes descending
         """
         with self._cursor() as cur:
+            # Sum the per-vacation likes_count counters instead of scanning likes
             cur.execute(
                 """SELECT 
                     c.name AS destination,
-                    COUNT(l.vacation_id) AS likes
-                   FROM likes l
-                   JOIN vacations v ON l.vacation_id = v.id
+                    SUM(v.likes_count) AS likes
+                   FROM vacations v
                    JOIN countries c ON v.country_id = c.id
+                   WHERE v.likes_count > 0
                    GROUP BY c.name
                    ORDER BY likes DESC"""
             )
@@ -0,0 +1,108 @@
+"""Unit of work: lets every DAO used in one scope share a connection and transaction."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Generator, Optional, TypeVar
+
+import psycopg2.extensions
+
+from src.config import get_connection_kwargs
+from src.dal.connection_pool import get_pool
+
+F = TypeVar("F", bound=Callable)
+
+
+class UnitOfWork:
+    """A lazily opened pooled connection whose transaction ends exactly once.
+
+    No connection is checked out until the first DAO asks for one, so scopes
+    that never touch the database cost nothing.
+    """
+
+    def __init__(self) -> None:
+        self._pool = None
+        self._conn: Optional[psycopg2.extensions.connection] = None
+        self.rollback_only = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def connection(self, conn_kwargs: Optional[dict] = None) -> psycopg2.extensions.connection:
+        """Return the shared connection, checking one out on first use."""
+        if self._conn is None:
+            self._pool = get_pool(conn_kwargs or get_connection_kwargs())
+            self._conn = self._pool.getconn()
+        return self._conn
+
+    def commit(self) -> None:
+        """Commit now; ``complete`` then only releases the connection."""
+        if self._conn is not None:
+            self._conn.commit()
+
+    def complete(self, success: bool = True) -> None:
+        """Commit (or roll back) the shared transaction and release the connection."""
+        conn, pool = self._conn, self._pool
+        self._conn, self._pool = None, None
+        if conn is None:
+            return
+        try:
+            if success and not self.rollback_only:
+                conn.commit()
+            else:
+                conn.rollback()
+        finally:
+            pool.putconn(conn)
+
+
+_current: ContextVar[Optional[UnitOfWork]] = ContextVar("unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Return the unit of work active in this context, if any."""
+    return _current.get()
+
+
+def begin_unit_of_work() -> UnitOfWork:
+    """Start a unit of work for the current context (e.g. an HTTP request)."""
+    uow = UnitOfWork()
+    _current.set(uow)
+    return uow
+
+
+def end_unit_of_work(success: bool = True) -> None:
+    """Finish the current unit of work, committing only if ``success``."""
+    uow = _current.get()
+    _current.set(None)
+    if uow is not None:
+        uow.complete(success)
+
+
+@contextmanager
+def unit_of_work() -> Generator[UnitOfWork, None, None]:
+    """Run a block in one transaction; joins an enclosing unit of work if present."""
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+
+    uow = UnitOfWork()
+    token = _current.set(uow)
+    try:
+        yield uow
+    except BaseException:
+        _current.reset(token)
+        uow.complete(success=False)
+        raise
+    _current.reset(token)
+    uow.complete(success=True)
+
+
+def transactional(func: F) -> F:
+    """Decorator running a service method inside a unit of work."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with unit_of_work():
+            return func(*args, **kwargs)
+    return wrapper
@@ -0,0 +1 @@
+"""Microbenchmarks for the Vacations backend hot paths."""
@@ -0,0 +1,61 @@
+"""Benchmark: stock Flask JSON provider vs FastJSONProvider on catalog-sized responses.
+
+Runs without a database, inside an app context, the way jsonify is called.
+
+    python -m benchmarks.bench_json [rows]
+"""
+
+import sys
+import timeit
+from datetime import date, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.api.encoders import CATALOG_VACATION_ENCODER
+from src.api.json_provider import FastJSONProvider, init_json, orjson, register_encoder
+from src.models.dtos import CatalogVacationDTO
+
+
+def make_items(count: int) -> list[CatalogVacationDTO]:
+    start = date(2030, 1, 1)
+    return [
+        CatalogVacationDTO(
+            i, i % 12 + 1, "France", f"A week in vacation spot number {i}",
+            start + timedelta(days=i % 365), start + timedelta(days=i % 365 + 7),
+            1000 + i % 9000 + 0.5, f"image_{i}.jpg", i % 50, bool(i % 2),
+        )
+        for i in range(count)
+    ]
+
+
+def time_ms(func) -> float:
+    return min(timeit.repeat(func, number=5, repeat=5)) / 5 * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    items = make_items(count)
+    dicts = [CATALOG_VACATION_ENCODER.from_dto(v) for v in items]
+
+    stock = Flask("stock")
+    stock.json = DefaultJSONProvider(stock)
+    fast = Flask("fast")
+    init_json(fast)
+    register_encoder(CatalogVacationDTO, CATALOG_VACATION_ENCODER.from_dto)
+
+    with stock.app_context():
+        baseline = time_ms(lambda: stock.json.response(dicts).get_data())
+    with fast.app_context():
+        from_dicts = time_ms(lambda: fast.json.response(dicts).get_data())
+        from_dtos = time_ms(lambda: fast.json.response(items).get_data())
+
+    backend = "orjson" if orjson is not None else "stdlib json (orjson not installed)"
+    print(f"{count} catalog rows, {FastJSONProvider.__name__} backed by {backend}")
+    print(f"{'stock jsonify, camelCase dicts':<40} {baseline:8.2f} ms  1.00x")
+    print(f"{'fast provider, camelCase dicts':<40} {from_dicts:8.2f} ms  {baseline / from_dicts:5.2f}x")
+    print(f"{'fast provider, DTOs directly':<40} {from_dtos:8.2f} ms  {baseline / from_dtos:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Microbenchmark: catalog rows to JSON, old dict/dataclass chain vs tuple rows and compiled encoders.
+
+Runs without a database. Each case starts from the raw column values a
+query returns. The legacy case then builds a RealDictRow per row, exactly as
+RealDictCursor does (one __setitem__ call per column); tuple cursors hand the
+values over as-is.
+
+    python -m benchmarks.bench_row_encoding [rows]
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from psycopg2.extras import RealDictRow
+
+from src.api.encoders import CATALOG_VACATION_ENCODER
+from src.models.dtos import CatalogVacationDTO
+
+
+@dataclass
+class LegacyCatalogVacationDTO:
+    """The catalog DTO as it was: a plain, dict-backed dataclass."""
+
+    id: int
+    country_id: int
+    country_name: str
+    description: str
+    start_date: date
+    end_date: date
+    price: float
+    image_name: Optional[str]
+    likes_count: int
+    is_liked: Optional[bool]
+
+
+COLUMNS = {
+    index: name
+    for index, name in enumerate((
+        "id", "country_id", "country_name", "description", "start_date",
+        "end_date", "price", "image_name", "likes_count", "is_liked",
+    ))
+}
+
+
+def make_rows(count: int) -> tuple[list[tuple], list[tuple]]:
+    """Raw values as psycopg2 decodes them: NUMERIC prices before, float8 after."""
+    start = date(2030, 1, 1)
+    numeric_rows, float_rows = [], []
+    for i in range(count):
+        values = (
+            i, i % 12 + 1, "France", f"A week in vacation spot number {i}",
+            start + timedelta(days=i % 365), start + timedelta(days=i % 365 + 7),
+            1000 + i % 9000 + 0.5, f"image_{i}.jpg", i % 50, bool(i % 2),
+        )
+        numeric_rows.append(values[:6] + (Decimal(str(values[6])),) + values[7:])
+        float_rows.append(values)
+    return numeric_rows, float_rows
+
+
+def real_dict_rows(raw_rows: list[tuple]) -> list[RealDictRow]:
+    """Build rows the way RealDictCursor does."""
+    rows = []
+    for values in raw_rows:
+        row = RealDictRow()
+        row[RealDictRow] = COLUMNS
+        for index, value in enumerate(values):
+            row[index] = value
+        rows.append(row)
+    return rows
+
+
+def legacy_to_dict(v: LegacyCatalogVacationDTO) -> dict:
+    item = {
+        "id": v.id,
+        "countryId": v.country_id,
+        "countryName": v.country_name,
+        "description": v.description,
+        "startDate": v.start_date.isoformat() if v.start_date else None,
+        "endDate": v.end_date.isoformat() if v.end_date else None,
+        "price": v.price,
+        "imageName": v.image_name,
+        "likesCount": v.likes_count,
+    }
+    if v.is_liked is not None:
+        item["isLiked"] = v.is_liked
+    return item
+
+
+def legacy(raw_rows: list[tuple]) -> bytes:
+    rows = real_dict_rows(raw_rows)
+    dtos = [
+        LegacyCatalogVacationDTO(
+            id=v["id"],
+            country_id=v["country_id"],
+            country_name=v["country_name"],
+            description=v["description"],
+            start_date=v["start_date"],
+            end_date=v["end_date"],
+            price=float(v["price"]),
+            image_name=v.get("image_name"),
+            likes_count=v["likes_count"],
+            is_liked=v["is_liked"],
+        )
+        for v in rows
+    ]
+    return json.dumps([legacy_to_dict(v) for v in dtos], separators=(",", ":")).encode()
+
+
+def compact(rows: list[tuple]) -> bytes:
+    dtos = [CatalogVacationDTO(*v) for v in rows]
+    encode = CATALOG_VACATION_ENCODER.from_dto
+    return json.dumps([encode(v) for v in dtos], separators=(",", ":")).encode()
+
+
+def direct(rows: list[tuple]) -> bytes:
+    encode = CATALOG_VACATION_ENCODER.from_row
+    return json.dumps([encode(r) for r in rows], separators=(",", ":")).encode()
+
+
+def peak_kib(func, rows) -> float:
+    tracemalloc.start()
+    func(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    numeric_rows, float_rows = make_rows(count)
+    assert legacy(numeric_rows) == compact(float_rows) == direct(float_rows)
+
+    cases = [
+        ("RealDictRow -> dataclass -> dict", legacy, numeric_rows),
+        ("tuple -> slotted DTO -> encoder", compact, float_rows),
+        ("tuple -> encoder (no DTO)", direct, float_rows),
+    ]
+    legacy_dto = LegacyCatalogVacationDTO(*float_rows[0])
+    print(f"{count} rows. Per row: RealDictRow {sys.getsizeof(real_dict_rows(numeric_rows[:1])[0])} B "
+          f"vs tuple {sys.getsizeof(float_rows[0])} B; legacy DTO "
+          f"{sys.getsizeof(legacy_dto) + sys.getsizeof(legacy_dto.__dict__)} B "
+          f"vs slotted DTO {sys.getsizeof(CatalogVacationDTO(*float_rows[0]))} B")
+    baseline = None
+    for label, func, rows in cases:
+        best = min(timeit.repeat(lambda: func(rows), number=5, repeat=5)) / 5
+        baseline = baseline or best
+        print(f"{label:<40} {best * 1000:8.2f} ms  {baseline / best:5.2f}x  "
+              f"peak {peak_kib(func, rows):,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Delete image files (and their variants) that no vacation references."""
+
+import argparse
+import sys
+
+from dotenv import load_dotenv
+from src.services.image_gc import get_image_gc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dry-run", action="store_true", help="list orphaned files without deleting them")
+    parser.add_argument(
+        "--grace-period", type=float, default=None,
+        help="only delete files older than this many seconds (default: IMAGE_GC_GRACE_PERIOD)",
+    )
+    args = parser.parse_args()
+
+    report = get_image_gc().collect(dry_run=args.dry_run, grace_period=args.grace_period)
+    for name in report.orphans:
+        print(name)
+    action = "Would delete" if report.dry_run else "Deleted"
+    print(
+        f"{action} {len(report.orphans)} orphaned image(s), {report.freed_bytes / 1024:.1f} KiB; "
+        f"scanned {report.scanned}, {report.recent} within the grace period"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    sys.exit(main())
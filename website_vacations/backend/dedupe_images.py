@@ -0,0 +1,60 @@
+"""Move vacation images to content-addressed names, collapsing identical copies.
+
+Every file in the images directory is hashed. Byte-identical files become a
+single "<sha256>.<ext>" object and vacations.image_name is pointed at it in
+one transaction; only after that commits are the old names and their
+variants removed, so the catalog never references a missing file. Safe to
+re-run: files already stored by content are skipped.
+
+The images shipped in images/ are already stored this way, and schema.sql
+seeds their content names; a database seeded before that is brought along
+by sql/migrations/004_content_addressed_images.sql.
+"""
+
+import argparse
+import sys
+
+from dotenv import load_dotenv
+from src.dal.vacation_dao import VacationDAO
+from src.services.image_pipeline import get_image_pipeline, remove_variants
+from src.services.image_store import get_image_store
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="print the plan without changing anything")
+    args = parser.parse_args()
+
+    store = get_image_store()
+    plan = store.plan_migration()
+    duplicates = sum(len(names) - 1 for names in plan.values())
+    for image_name, names in plan.items():
+        print(f"{image_name} <- {', '.join(names)}")
+    print(f"{sum(len(names) for names in plan.values())} file(s) -> {len(plan)} object(s), {duplicates} duplicate(s)")
+    if args.dry_run or not plan:
+        return 0
+
+    for image_name, names in plan.items():
+        store.adopt(image_name, names[0])
+    updated = VacationDAO().replace_image_names(plan)
+    print(f"Pointed {updated} vacation(s) at content-addressed images")
+
+    for names in plan.values():
+        for name in names:
+            store.remove(name)
+            remove_variants(store.directory, name)
+
+    pipeline = get_image_pipeline()
+    rendered, failed = pipeline.generate(plan)
+    pipeline.shutdown()
+    if pipeline.enabled:
+        print(f"Rendered variants for {rendered} image(s)")
+    if failed:
+        print(f"{failed} image(s) could not be processed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    sys.exit(main())
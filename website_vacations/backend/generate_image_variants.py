@@ -0,0 +1,42 @@
+"""Render card/detail/retina WebP and AVIF variants for vacation images."""
+
+import argparse
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+from src.dal.vacation_dao import VacationDAO
+from src.services.image_pipeline import get_image_pipeline
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--all-files", action="store_true",
+        help="process every file in the images directory, not only images vacations use",
+    )
+    args = parser.parse_args()
+
+    pipeline = get_image_pipeline()
+    if args.all_files:
+        names = sorted(
+            name for name in os.listdir(pipeline.images_dir)
+            if os.path.isfile(os.path.join(pipeline.images_dir, name)) and not name.startswith(".")
+        )
+    else:
+        names = VacationDAO().list_image_names()
+
+    started = time.monotonic()
+    rendered, failed = pipeline.generate(names)
+    pipeline.shutdown()
+    print(f"Rendered variants for {rendered} of {len(names)} image(s) in {time.monotonic() - started:.2f}s")
+    if failed:
+        print(f"{failed} image(s) could not be processed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    sys.exit(main())
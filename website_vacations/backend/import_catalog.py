@@ -0,0 +1,45 @@
+"""Bulk import vacations, countries or users from a CSV or JSONL file."""
+
+import argparse
+import sys
+
+from dotenv import load_dotenv
+from src.services.import_service import DEFAULT_BATCH_SIZE, IMPORT_KINDS, ImportService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("kind", choices=IMPORT_KINDS, help="what the file contains")
+    parser.add_argument("path", help="a .csv, .jsonl or .ndjson file")
+    parser.add_argument(
+        "--rejects",
+        help="write rejected rows here as JSON lines (default: <path>.rejects.jsonl)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help=f"rows validated and loaded per transaction (default: {DEFAULT_BATCH_SIZE})",
+    )
+    args = parser.parse_args()
+
+    rejects_path = args.rejects or f"{args.path}.rejects.jsonl"
+    try:
+        with open(rejects_path, "w", encoding="utf-8") as rejects:
+            report = ImportService().import_file(args.kind, args.path, rejects, args.batch_size)
+    except (OSError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 2
+
+    print(
+        f"Imported {report.imported} of {report.rows_read} {report.kind} "
+        f"in {report.batches} batch(es), {report.elapsed:.2f}s "
+        f"({report.rows_per_second:,.0f} rows/s)"
+    )
+    if report.rejected:
+        print(f"Rejected {report.rejected} row(s), see {rejects_path}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""Rebuild vacations.likes_count from the likes table."""
+
+from dotenv import load_dotenv
+from src.services.vacation_service import VacationService
+
+if __name__ == "__main__":
+    load_dotenv()
+    corrected = VacationService().reconcile_likes_count()
+    print(f"Reconciled likes counts: {corrected} vacation(s) corrected")
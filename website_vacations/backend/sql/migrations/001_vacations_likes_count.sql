@@ -0,0 +1,39 @@
+-- Add the denormalized vacations.likes_count counter to an existing database.
+-- Safe to run more than once. New databases get it from schema.sql.
+
+ALTER TABLE vacations ADD COLUMN IF NOT EXISTS likes_count INTEGER NOT NULL DEFAULT 0;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'check_likes_count') THEN
+    ALTER TABLE vacations ADD CONSTRAINT check_likes_count CHECK (likes_count >= 0);
+  END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION sync_vacation_likes_count() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    UPDATE vacations SET likes_count = likes_count + 1 WHERE id = NEW.vacation_id;
+  ELSIF TG_OP = 'DELETE' THEN
+    UPDATE vacations SET likes_count = likes_count - 1 WHERE id = OLD.vacation_id;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_likes_count ON likes;
+CREATE TRIGGER trg_likes_count
+  AFTER INSERT OR DELETE ON likes
+  FOR EACH ROW EXECUTE FUNCTION sync_vacation_likes_count();
+
+-- Backfill from the likes table (same query as reconcile_likes.py)
+BEGIN;
+LOCK TABLE likes IN SHARE MODE;
+UPDATE vacations v
+SET likes_count = COALESCE(l.likes, 0)
+FROM vacations v2
+LEFT JOIN (SELECT vacation_id, COUNT(*) AS likes FROM likes GROUP BY vacation_id) l
+  ON l.vacation_id = v2.id
+WHERE v.id = v2.id AND v.likes_count <> COALESCE(l.likes, 0);
+COMMIT;
@@ -0,0 +1,42 @@
+-- Add change versions and delete tombstones for catalog delta sync to an
+-- existing database. Safe to run more than once. New databases get them from
+-- schema.sql. Existing rows start at version 0, so a full sync (since=0)
+-- still returns them.
+
+ALTER TABLE vacations ADD COLUMN IF NOT EXISTS change_version BIGINT NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS vacation_tombstones (
+  vacation_id INTEGER PRIMARY KEY,
+  change_version BIGINT NOT NULL,
+  deleted_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION stamp_vacation_change_version() RETURNS trigger AS $$
+BEGIN
+  NEW.change_version := txid_current();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_vacations_change_version ON vacations;
+CREATE TRIGGER trg_vacations_change_version
+  BEFORE INSERT OR UPDATE ON vacations
+  FOR EACH ROW EXECUTE FUNCTION stamp_vacation_change_version();
+
+CREATE OR REPLACE FUNCTION record_vacation_tombstone() RETURNS trigger AS $$
+BEGIN
+  INSERT INTO vacation_tombstones (vacation_id, change_version)
+  VALUES (OLD.id, txid_current())
+  ON CONFLICT (vacation_id) DO UPDATE
+    SET change_version = EXCLUDED.change_version, deleted_at = now();
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_vacations_tombstone ON vacations;
+CREATE TRIGGER trg_vacations_tombstone
+  AFTER DELETE ON vacations
+  FOR EACH ROW EXECUTE FUNCTION record_vacation_tombstone();
+
+CREATE INDEX IF NOT EXISTS idx_vacations_change_version ON vacations (change_version);
+CREATE INDEX IF NOT EXISTS idx_vacation_tombstones_change_version ON vacation_tombstones (change_version);
@@ -0,0 +1,6 @@
+-- Add the inline image placeholder (a data: URI under 1 KB) to an existing
+-- database. Safe to run more than once. New databases get it from schema.sql.
+-- Existing rows start without one; run generate_image_variants.py afterwards
+-- to render placeholders for every image vacations already use.
+
+ALTER TABLE vacations ADD COLUMN IF NOT EXISTS image_placeholder TEXT;
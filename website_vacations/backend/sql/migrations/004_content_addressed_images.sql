@@ -0,0 +1,56 @@
+-- Point vacations of an existing database at the content-addressed names
+-- the tracked images now have (see dedupe_images.py). Safe to run more than
+-- once. New databases get these names from schema.sql.
+
+UPDATE vacations SET image_name = CASE image_name
+    WHEN 'australia.jpg' THEN '63476aea251b3063083da4fa5f0c3bb0b94665b644060de3a8b5c1f6377a0812.jpg'
+    WHEN 'australia_1765281005.jpg' THEN '63476aea251b3063083da4fa5f0c3bb0b94665b644060de3a8b5c1f6377a0812.jpg'
+    WHEN 'australia_1765281337.jpg' THEN '63476aea251b3063083da4fa5f0c3bb0b94665b644060de3a8b5c1f6377a0812.jpg'
+    WHEN 'australia_1765282174.jpg' THEN '63476aea251b3063083da4fa5f0c3bb0b94665b644060de3a8b5c1f6377a0812.jpg'
+    WHEN 'barcelona.jpg' THEN '56d959eadf6bc96765ed94c0538e07495aad4ae990acceae8529171039513eb9.jpg'
+    WHEN 'barcelona_1765281291.jpg' THEN '56d959eadf6bc96765ed94c0538e07495aad4ae990acceae8529171039513eb9.jpg'
+    WHEN 'brazil.jpg' THEN 'b8df42c274e681c0bdfa1e6d36fb0d1129b9052dce448d8e42b3f62f479b35eb.jpg'
+    WHEN 'brazil_1765280969.jpg' THEN 'b8df42c274e681c0bdfa1e6d36fb0d1129b9052dce448d8e42b3f62f479b35eb.jpg'
+    WHEN 'brazil_1765281302.jpg' THEN 'b8df42c274e681c0bdfa1e6d36fb0d1129b9052dce448d8e42b3f62f479b35eb.jpg'
+    WHEN 'brazil_1765282141.jpg' THEN 'b8df42c274e681c0bdfa1e6d36fb0d1129b9052dce448d8e42b3f62f479b35eb.jpg'
+    WHEN 'costa_rica_1765280867.jpg' THEN '7d2f812b0138c03a885a2c7b1865c6f27752f2d5b0b14c1ba19e23b572334e3f.jpg'
+    WHEN 'egypt.jpg' THEN '007553279de9ca034ac1c3c7db0a18c59cb74b245b98418db5692752a614fd83.jpg'
+    WHEN 'greece.jpg' THEN '6d73482c80ba29aeba93f4819d4a044b21a27edc57960671569dfbc2c0e874b3.jpg'
+    WHEN 'italy.jpg' THEN 'dc142b8a3b56835c02056a3936f6d013fa66b9554ec2a4b8b5f014de6fbe7323.jpg'
+    WHEN 'italy_1765282125.jpg' THEN 'dc142b8a3b56835c02056a3936f6d013fa66b9554ec2a4b8b5f014de6fbe7323.jpg'
+    WHEN 'mexico.jpg' THEN '83bd66af77559fc76dd7a147c3c27be36dab669d4d67ff7bea9a25bd76f65fcf.jpg'
+    WHEN 'nyc.jpg' THEN 'a93883892457b1cc431ed4563cf1288b2a21e88b3543bac2939b71c9c6507e29.jpg'
+    WHEN 'paris.jpg' THEN 'dbb6350b4770d4428fb8bdbe545a0b15c0620d2d1ae4053851dce2de67c4a787.jpg'
+    WHEN 'photo-1515898698999-18f625d67499_1763466206.avif' THEN '6b4310b41aa0964267398d7a203d23656618bf26f726a1673b304f8a4d02c424.avif'
+    WHEN 'photo-1559562591-6de6f7187f56_1763466215.avif' THEN 'f6ec7aea70ab722bfb49688b59cca494b91dbf7c3ea40b2ffbfbf36bcd252cd1.avif'
+    WHEN 'thailand.jpg' THEN 'c419b23d283f83079ee2fda054c09367da5bea086d1759db4ade5f6951dca454.jpg'
+    WHEN 'thailand_1765280959.jpg' THEN 'c419b23d283f83079ee2fda054c09367da5bea086d1759db4ade5f6951dca454.jpg'
+    WHEN 'tokyo.jpg' THEN '23f0ac1f43785b9d427b7a68049bc6b5a5e4bb335ea103601237d737f8dd3a64.jpg'
+    WHEN 'turkey.jpg' THEN 'f6c576ed641aaa98b2a73e769b3a4c71316b96d816e8d20a703c0bae50495271.jpg'
+    END
+WHERE image_name IN (
+    'australia.jpg',
+    'australia_1765281005.jpg',
+    'australia_1765281337.jpg',
+    'australia_1765282174.jpg',
+    'barcelona.jpg',
+    'barcelona_1765281291.jpg',
+    'brazil.jpg',
+    'brazil_1765280969.jpg',
+    'brazil_1765281302.jpg',
+    'brazil_1765282141.jpg',
+    'costa_rica_1765280867.jpg',
+    'egypt.jpg',
+    'greece.jpg',
+    'italy.jpg',
+    'italy_1765282125.jpg',
+    'mexico.jpg',
+    'nyc.jpg',
+    'paris.jpg',
+    'photo-1515898698999-18f625d67499_1763466206.avif',
+    'photo-1559562591-6de6f7187f56_1763466215.avif',
+    'thailand.jpg',
+    'thailand_1765280959.jpg',
+    'tokyo.jpg',
+    'turkey.jpg'
+);
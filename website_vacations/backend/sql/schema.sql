@@ -1,11 +1,15 @@
 -- Vacations project schema - Complete DDL with constraints and seed data
 
 -- Drop tables in reverse order of dependencies (for clean reset)
+DROP TABLE IF EXISTS vacation_tombstones CASCADE;
 DROP TABLE IF EXISTS likes CASCADE;
 DROP TABLE IF EXISTS vacations CASCADE;
 DROP TABLE IF EXISTS users CASCADE;
 DROP TABLE IF EXISTS countries CASCADE;
 DROP TABLE IF EXISTS roles CASCADE;
+DROP FUNCTION IF EXISTS sync_vacation_likes_count() CASCADE;
+DROP FUNCTION IF EXISTS stamp_vacation_change_version() CASCADE;
+DROP FUNCTION IF EXISTS record_vacation_tombstone() CASCADE;
 
 -- 1. Roles table
 CREATE TABLE roles (
@@ -41,9 +45,13 @@ CREATE TABLE vacations (
   end_date DATE NOT NULL,
   price DECIMAL(10, 2) NOT NULL,
   image_name VARCHAR(255),
+  image_placeholder TEXT,
+  likes_count INTEGER NOT NULL DEFAULT 0,
+  change_version BIGINT NOT NULL DEFAULT 0,
   CONSTRAINT fk_vacations_country FOREIGN KEY (country_id) REFERENCES countries(id) ON DELETE RESTRICT,
   CONSTRAINT check_price_range CHECK (price >= 0 AND price <= 10000),
-  CONSTRAINT check_dates CHECK (end_date >= start_date)
+  CONSTRAINT check_dates CHECK (end_date >= start_date),
+  CONSTRAINT check_likes_count CHECK (likes_count >= 0)
 );
 
 -- 5. Likes table (composite primary key)
@@ -55,6 +63,65 @@ CREATE TABLE likes (
   CONSTRAINT fk_likes_vacation FOREIGN KEY (vacation_id) REFERENCES vacations(id) ON DELETE CASCADE
 );
 
+-- Keep vacations.likes_count in step with the likes table
+CREATE FUNCTION sync_vacation_likes_count() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    UPDATE vacations SET likes_count = likes_count + 1 WHERE id = NEW.vacation_id;
+  ELSIF TG_OP = 'DELETE' THEN
+    UPDATE vacations SET likes_count = likes_count - 1 WHERE id = OLD.vacation_id;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_likes_count
+  AFTER INSERT OR DELETE ON likes
+  FOR EACH ROW EXECUTE FUNCTION sync_vacation_likes_count();
+
+-- 6. Tombstones of deleted vacations, read by delta sync
+CREATE TABLE vacation_tombstones (
+  vacation_id INTEGER PRIMARY KEY,
+  change_version BIGINT NOT NULL,
+  deleted_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Stamp every written vacation row with the writing transaction's ID. Like
+-- changes reach it too, through the likes_count update above.
+CREATE FUNCTION stamp_vacation_change_version() RETURNS trigger AS $$
+BEGIN
+  NEW.change_version := txid_current();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_vacations_change_version
+  BEFORE INSERT OR UPDATE ON vacations
+  FOR EACH ROW EXECUTE FUNCTION stamp_vacation_change_version();
+
+CREATE FUNCTION record_vacation_tombstone() RETURNS trigger AS $$
+BEGIN
+  INSERT INTO vacation_tombstones (vacation_id, change_version)
+  VALUES (OLD.id, txid_current())
+  ON CONFLICT (vacation_id) DO UPDATE
+    SET change_version = EXCLUDED.change_version, deleted_at = now();
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_vacations_tombstone
+  AFTER DELETE ON vacations
+  FOR EACH ROW EXECUTE FUNCTION record_vacation_tombstone();
+
+-- Indexes backing catalog listing, keyset pagination and filters
+CREATE INDEX idx_vacations_start_date_id ON vacations (start_date, id);
+CREATE INDEX idx_vacations_end_date ON vacations (end_date);
+CREATE INDEX idx_vacations_country_start_date ON vacations (country_id, start_date, id);
+CREATE INDEX idx_vacations_price ON vacations (price);
+CREATE INDEX idx_likes_vacation_id ON likes (vacation_id);
+CREATE INDEX idx_vacations_change_version ON vacations (change_version);
+CREATE INDEX idx_vacation_tombstones_change_version ON vacation_tombstones (change_version);
+
 -- Seed data
 
 -- Insert roles
@@ -88,18 +155,18 @@ ON CONFLICT (email) DO NOTHING;
 
 -- Insert vacations (at least 12 vacations with logical data)
 INSERT INTO vacations (country_id, description, start_date, end_date, price, image_name) VALUES
-  (2, 'Romantic Paris getaway with Eiffel Tower visit', CURRENT_DATE + INTERVAL '30 days', CURRENT_DATE + INTERVAL '37 days', 2500.00, 'paris.jpg'),
-  (3, 'Beautiful Italian Riviera experience', CURRENT_DATE + INTERVAL '45 days', CURRENT_DATE + INTERVAL '52 days', 3200.00, 'italy.jpg'),
-  (4, 'Sunny Barcelona beach vacation', CURRENT_DATE + INTERVAL '60 days', CURRENT_DATE + INTERVAL '67 days', 1800.00, 'barcelona.jpg'),
-  (5, 'Ancient Greek islands tour', CURRENT_DATE + INTERVAL '75 days', CURRENT_DATE + INTERVAL '82 days', 2100.00, 'greece.jpg'),
-  (6, 'Tokyo cultural immersion experience', CURRENT_DATE + INTERVAL '90 days', CURRENT_DATE + INTERVAL '97 days', 4500.00, 'tokyo.jpg'),
-  (7, 'Tropical Thailand paradise', CURRENT_DATE + INTERVAL '15 days', CURRENT_DATE + INTERVAL '22 days', 1500.00, 'thailand.jpg'),
-  (8, 'Sydney and Great Barrier Reef adventure', CURRENT_DATE + INTERVAL '120 days', CURRENT_DATE + INTERVAL '127 days', 3800.00, 'australia.jpg'),
-  (9, 'Rio de Janeiro carnival experience', CURRENT_DATE + INTERVAL '105 days', CURRENT_DATE + INTERVAL '112 days', 2800.00, 'brazil.jpg'),
-  (10, 'Cancun beach resort vacation', CURRENT_DATE + INTERVAL '20 days', CURRENT_DATE + INTERVAL '27 days', 2200.00, 'mexico.jpg'),
-  (11, 'Pyramids and Nile cruise', CURRENT_DATE + INTERVAL '135 days', CURRENT_DATE + INTERVAL '142 days', 1900.00, 'egypt.jpg'),
-  (12, 'Istanbul cultural tour', CURRENT_DATE + INTERVAL '50 days', CURRENT_DATE + INTERVAL '57 days', 1600.00, 'turkey.jpg'),
-  (1, 'New York City urban adventure', CURRENT_DATE + INTERVAL '100 days', CURRENT_DATE + INTERVAL '107 days', 3500.00, 'nyc.jpg')
+  (2, 'Romantic Paris getaway with Eiffel Tower visit', CURRENT_DATE + INTERVAL '30 days', CURRENT_DATE + INTERVAL '37 days', 2500.00, 'dbb6350b4770d4428fb8bdbe545a0b15c0620d2d1ae4053851dce2de67c4a787.jpg'),
+  (3, 'Beautiful Italian Riviera experience', CURRENT_DATE + INTERVAL '45 days', CURRENT_DATE + INTERVAL '52 days', 3200.00, 'dc142b8a3b56835c02056a3936f6d013fa66b9554ec2a4b8b5f014de6fbe7323.jpg'),
+  (4, 'Sunny Barcelona beach vacation', CURRENT_DATE + INTERVAL '60 days', CURRENT_DATE + INTERVAL '67 days', 1800.00, '56d959eadf6bc96765ed94c0538e07495aad4ae990acceae8529171039513eb9.jpg'),
+  (5, 'Ancient Greek islands tour', CURRENT_DATE + INTERVAL '75 days', CURRENT_DATE + INTERVAL '82 days', 2100.00, '6d73482c80ba29aeba93f4819d4a044b21a27edc57960671569dfbc2c0e874b3.jpg'),
+  (6, 'Tokyo cultural immersion experience', CURRENT_DATE + INTERVAL '90 days', CURRENT_DATE + INTERVAL '97 days', 4500.00, '23f0ac1f43785b9d427b7a68049bc6b5a5e4bb335ea103601237d737f8dd3a64.jpg'),
+  (7, 'Tropical Thailand paradise', CURRENT_DATE + INTERVAL '15 days', CURRENT_DATE + INTERVAL '22 days', 1500.00, 'c419b23d283f83079ee2fda054c09367da5bea086d1759db4ade5f6951dca454.jpg'),
+  (8, 'Sydney and Great Barrier Reef adventure', CURRENT_DATE + INTERVAL '120 days', CURRENT_DATE + INTERVAL '127 days', 3800.00, '63476aea251b3063083da4fa5f0c3bb0b94665b644060de3a8b5c1f6377a0812.jpg'),
+  (9, 'Rio de Janeiro carnival experience', CURRENT_DATE + INTERVAL '105 days', CURRENT_DATE + INTERVAL '112 days', 2800.00, 'b8df42c274e681c0bdfa1e6d36fb0d1129b9052dce448d8e42b3f62f479b35eb.jpg'),
+  (10, 'Cancun beach resort vacation', CURRENT_DATE + INTERVAL '20 days', CURRENT_DATE + INTERVAL '27 days', 2200.00, '83bd66af77559fc76dd7a147c3c27be36dab669d4d67ff7bea9a25bd76f65fcf.jpg'),
+  (11, 'Pyramids and Nile cruise', CURRENT_DATE + INTERVAL '135 days', CURRENT_DATE + INTERVAL '142 days', 1900.00, '007553279de9ca034ac1c3c7db0a18c59cb74b245b98418db5692752a614fd83.jpg'),
+  (12, 'Istanbul cultural tour', CURRENT_DATE + INTERVAL '50 days', CURRENT_DATE + INTERVAL '57 days', 1600.00, 'f6c576ed641aaa98b2a73e769b3a4c71316b96d816e8d20a703c0bae50495271.jpg'),
+  (1, 'New York City urban adventure', CURRENT_DATE + INTERVAL '100 days', CURRENT_DATE + INTERVAL '107 days', 3500.00, 'a93883892457b1cc431ed4563cf1288b2a21e88b3543bac2939b71c9c6507e29.jpg')
 ON CONFLICT DO NOTHING;
 
 -- Likes table starts empty (as per requirements)
@@ -1,28 +1,66 @@
 """Flask application for Vacations API."""
 
-import os
-from flask import Flask, send_from_directory
+import psycopg2
+from flask import Flask, jsonify
 from flask_cors import CORS
 
+from src.api.encoders import CATALOG_VACATION_ENCODER, COUNTRY_ENCODER, VACATION_ENCODER
+from src.api.compression import init_compression
+from src.api.images import init_images
+from src.api.json_provider import init_json, register_encoder
 from src.api.routes import register_routes
+from src.api.uploads import init_uploads
+from src.dal.unit_of_work import begin_unit_of_work, current_unit_of_work, end_unit_of_work
 
 
 def create_app() -> Flask:
     """Create and configure Flask application."""
     app = Flask(__name__)
     
+    # Fast JSON for every response, with the precompiled DTO encoders
+    init_json(app)
+    for encoder in (CATALOG_VACATION_ENCODER, VACATION_ENCODER, COUNTRY_ENCODER):
+        register_encoder(encoder.dto_type, encoder.from_dto)
+    
+    # gzip/brotli for JSON bodies the client accepts compressed
+    init_compression(app)
+    
     # Enable CORS for frontend
     CORS(app, origins=["http://localhost:5173" , "http://localhost:3000", "http://localhost:3001", "http://localhost:5174"], supports_credentials=True)
     
-    # Create images directory if it doesn't exist
-    images_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "images")
-    os.makedirs(images_dir, exist_ok=True)
+    # One connection and one transaction per request, opened on first DAO use
+    @app.before_request
+    def open_unit_of_work():
+        begin_unit_of_work()
+
+    @app.after_request
+    def commit_unit_of_work(response):
+        # Commit before the response leaves, so a failed commit is reported as one
+        uow = current_unit_of_work()
+        if uow is None:
+            return response
+        if response.status_code >= 400:
+            uow.rollback_only = True
+            return response
+        try:
+            uow.commit()
+        except psycopg2.Error as e:
+            uow.rollback_only = True
+            response = jsonify({"error": f"Internal server error: {str(e)}"})
+            response.status_code = 500
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(exc):
+        # Rolls back whatever was not committed and returns the connection
+        end_unit_of_work(success=exc is None)
+    
+    # Serve static images and their variants (variants/<image name>/<size>.<format>)
+    # with immutable caching for content-addressed names
+    init_images(app)
     
-    # Serve static images
-    @app.route("/images/<filename>")
-    def serve_image(filename):
-        """Serve vacation images."""
-        return send_from_directory(images_dir, filename)
+    # Multipart image uploads stream to disk, bounded and hashed as they arrive
+    init_uploads(app)
     
     # Register routes
     register_routes(app)
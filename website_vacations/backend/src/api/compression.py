@@ -0,0 +1,107 @@
+"""gzip/brotli response compression negotiated from Accept-Encoding."""
+
+import gzip
+from typing import Optional
+
+from flask import Flask, Response, current_app, request
+
+from src.config import CompressionConfig
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without brotli
+    brotli = None
+
+# Preferred first when the client weighs several encodings equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+COMPRESSIBLE_MIMETYPES = frozenset({"application/json", "text/plain", "text/html", "text/csv"})
+
+
+class Compressor:
+    """Chooses and applies a content encoding for response bodies.
+
+    Bodies smaller than ``min_size`` are sent as they are: below about a
+    kilobyte the headers and CPU cost outweigh the bytes saved.
+    """
+
+    def __init__(self, config: CompressionConfig) -> None:
+        self.config = config
+
+    def choose(self, size: int) -> Optional[str]:
+        """Return the encoding to use for a ``size``-byte body in this request, or None."""
+        if not self.config.enabled or size < self.config.min_size:
+            return None
+        accepted = request.accept_encodings
+        best, best_quality = None, 0.0
+        for encoding in ENCODINGS:
+            quality = accepted[encoding]
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        """Encode ``data`` with ``encoding`` ("br" or "gzip")."""
+        if encoding == "br":
+            return brotli.compress(data, quality=self.config.brotli_quality)
+        if encoding == "gzip":
+            return gzip.compress(data, compresslevel=self.config.gzip_level, mtime=0)
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def encode(
+        self,
+        response: Response,
+        data: bytes,
+        cache: Optional[dict[str, bytes]] = None,
+    ) -> Optional[str]:
+        """
+        Set ``response``'s body to ``data``, compressed when worthwhile, and
+        return the encoding used (None when sent as is).
+
+        ``cache`` maps encodings to already compressed forms of ``data``;
+        missing ones are compressed and stored in it. A strong ETag already
+        on the response gets the encoding appended, since each encoding is a
+        different byte sequence.
+        """
+        encoding = self.choose(len(data))
+        if self.config.enabled and len(data) >= self.config.min_size:
+            response.vary.add("Accept-Encoding")
+        if encoding is None:
+            response.set_data(data)
+            return None
+        body = cache.get(encoding) if cache is not None else None
+        if body is None:
+            body = self.compress(data, encoding)
+            if cache is not None:
+                cache[encoding] = body
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            response.set_etag(f"{etag}-{encoding}")
+        return encoding
+
+    def after_request(self, response: Response) -> Response:
+        """Compress buffered 200 responses of a compressible type."""
+        if (
+            response.status_code != 200
+            or response.is_streamed
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+        self.encode(response, response.get_data())
+        return response
+
+
+def get_compressor() -> Compressor:
+    """Return the current app's Compressor."""
+    return current_app.extensions["compression"]
+
+
+def init_compression(app: Flask, config: Optional[CompressionConfig] = None) -> Compressor:
+    """Compress JSON and text responses of ``app`` (streamed bodies are left alone)."""
+    compressor = Compressor(config or CompressionConfig.from_env())
+    app.extensions["compression"] = compressor
+    app.after_request(compressor.after_request)
+    return compressor
@@ -0,0 +1,59 @@
+"""ETags, Cache-Control and conditional (304) JSON responses."""
+
+import hashlib
+from typing import Optional
+
+from flask import Flask, Response, request
+
+from src.api.compression import get_compressor
+
+# Per-user data: browsers may keep it but must revalidate before each reuse
+REVALIDATE = "private, no-cache"
+# Reference data that only changes through imports and seeding
+REFERENCE_DATA = "public, max-age=3600, stale-while-revalidate=86400"
+
+
+def payload_etag(payload: bytes) -> str:
+    """Return a strong ETag value (unquoted) for a serialized response body."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def version_etag(*parts) -> str:
+    """Return a strong ETag value (unquoted) for the data ``parts`` pin down, e.g. a version and a query."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def not_modified(app: Flask, etag: str, cache_control: str = REVALIDATE) -> Optional[Response]:
+    """Return a bodiless 304 if the client's If-None-Match holds ``etag``, else None."""
+    if etag not in request.if_none_match:
+        return None
+    response = app.response_class(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    response.vary.update(("Accept", "Accept-Encoding"))
+    return response
+
+
+def json_response(
+    app: Flask,
+    payload: bytes,
+    etag: Optional[str] = None,
+    cache_control: str = REVALIDATE,
+    encoded: Optional[dict[str, bytes]] = None,
+) -> Response:
+    """
+    Build a 200 JSON response for ``payload`` with an ETag and Cache-Control,
+    compressed as the client accepts, or a bodiless 304 when the client's
+    If-None-Match matches.
+
+    Pass ``etag`` when it is already known (e.g. cached with the payload) to
+    skip hashing the body again, and ``encoded`` to reuse and keep the
+    compressed forms of ``payload``.
+    """
+    response = app.response_class(status=200, mimetype="application/json")
+    response.set_etag(etag or payload_etag(payload))
+    get_compressor().encode(response, payload, encoded)
+    response.headers["Cache-Control"] = cache_control
+    # The same URL streams NDJSON for Accept: application/x-ndjson
+    response.vary.add("Accept")
+    return response.make_conditional(request)
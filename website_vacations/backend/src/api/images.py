@@ -0,0 +1,212 @@
+"""Serving vacation images: immutable caching, ETags, byte ranges and a hot-image LRU."""
+
+import mimetypes
+import os
+import stat
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from flask import Flask, Response, current_app, request
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+from werkzeug.wsgi import wrap_file
+
+from src.config import ImageConfig
+from src.services.image_gc import get_image_gc
+from src.services.image_pipeline import FORMAT_OPTIONS, VARIANTS_DIR
+from src.services.image_store import is_content_name
+
+# Content-addressed names never change bytes, so browsers need never ask again
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Legacy names may be re-rendered in place; reuse only after a (cheap) 304
+REVALIDATE = "public, no-cache"
+
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("image/webp", ".webp")
+
+
+@dataclass(slots=True)
+class ImageFile:
+    """What is needed to answer a request for one file, and its bytes when cached."""
+    path: str
+    size: int
+    mtime_ns: int
+    etag: str
+    mimetype: str
+    immutable: bool
+    data: Optional[bytes] = None
+
+
+def is_immutable(filename: str) -> bool:
+    """True for originals and rendered variants whose name pins their content."""
+    parts = filename.split("/")
+    if len(parts) == 1:
+        return is_content_name(parts[0])
+    return (
+        len(parts) == 3
+        and parts[0] == VARIANTS_DIR
+        and is_content_name(parts[1])
+        and os.path.splitext(parts[2])[1].lstrip(".") in FORMAT_OPTIONS
+    )
+
+
+class ImageServer:
+    """Answers /images requests with as little per-hit work as possible.
+
+    Content-versioned files are sent with a year-long immutable
+    Cache-Control, so repeat views never reach the server. Every file gets a
+    strong ETag and Last-Modified; conditional requests are answered from
+    the file's metadata without opening it. Larger files are streamed with
+    ``wsgi.file_wrapper`` (sendfile under gunicorn) and support byte ranges.
+    Files up to ``cache_item_max_bytes`` are kept in an LRU of at most
+    ``cache_max_bytes``; cached content-addressed files are served without
+    touching the filesystem at all.
+    """
+
+    def __init__(self, config: ImageConfig) -> None:
+        self._config = config
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, ImageFile] = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def serve(self, filename: str) -> Response:
+        """Return the response for ``/images/<filename>``. Raises NotFound."""
+        image = self._lookup(filename)
+        if image.etag in request.if_none_match:
+            response = Response(status=304)
+            self._set_headers(response, image)
+            return response
+
+        if image.data is not None:
+            response = Response(image.data, mimetype=image.mimetype)
+        else:
+            try:
+                f = open(image.path, "rb")
+            except FileNotFoundError:
+                self.forget(filename)
+                raise NotFound()
+            response = Response(
+                wrap_file(request.environ, f), mimetype=image.mimetype, direct_passthrough=True
+            )
+            response.content_length = image.size
+        self._set_headers(response, image)
+        return response.make_conditional(request, accept_ranges=True, complete_length=image.size)
+
+    def forget(self, filename: Optional[str] = None) -> None:
+        """Drop one cached file (e.g. after it was deleted), or all of them."""
+        with self._lock:
+            if filename is None:
+                self._cache.clear()
+                self._cached_bytes = 0
+                return
+            image = self._cache.pop(filename, None)
+            if image is not None and image.data is not None:
+                self._cached_bytes -= len(image.data)
+
+    def forget_image(self, image_name: str) -> None:
+        """Drop a cached original and all of its cached variants."""
+        prefix = f"{VARIANTS_DIR}/{image_name}/"
+        with self._lock:
+            for filename in [f for f in self._cache if f == image_name or f.startswith(prefix)]:
+                image = self._cache.pop(filename)
+                if image.data is not None:
+                    self._cached_bytes -= len(image.data)
+
+    def stats(self) -> dict:
+        """Return LRU size and hit counters."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "bytes": self._cached_bytes,
+                "maxBytes": self._config.cache_max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def _lookup(self, filename: str) -> ImageFile:
+        with self._lock:
+            image = self._cache.get(filename)
+            if image is not None:
+                self._cache.move_to_end(filename)
+        if image is not None and image.immutable:
+            self._count(hit=True)
+            return image
+
+        path = safe_join(self._config.directory, filename)
+        if path is None or os.path.basename(path).startswith("."):
+            raise NotFound()
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.forget(filename)
+            raise NotFound()
+        if not stat.S_ISREG(st.st_mode):
+            raise NotFound()
+        if image is not None and image.mtime_ns == st.st_mtime_ns and image.size == st.st_size:
+            self._count(hit=True)
+            return image
+
+        self._count(hit=False)
+        immutable = is_immutable(filename)
+        image = ImageFile(
+            path=path,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            etag=filename.rsplit(".", 1)[0].replace("/", "-") if immutable
+            else f"{st.st_mtime_ns:x}-{st.st_size:x}",
+            mimetype=mimetypes.guess_type(path)[0] or "application/octet-stream",
+            immutable=immutable,
+        )
+        if 0 < image.size <= self._config.cache_item_max_bytes <= self._config.cache_max_bytes:
+            try:
+                with open(path, "rb") as f:
+                    image.data = f.read()
+            except OSError:
+                raise NotFound()
+            self._store(filename, image)
+        return image
+
+    def _store(self, filename: str, image: ImageFile) -> None:
+        with self._lock:
+            old = self._cache.pop(filename, None)
+            if old is not None and old.data is not None:
+                self._cached_bytes -= len(old.data)
+            self._cache[filename] = image
+            self._cached_bytes += len(image.data)
+            while self._cached_bytes > self._config.cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted.data)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    @staticmethod
+    def _set_headers(response: Response, image: ImageFile) -> None:
+        response.set_etag(image.etag)
+        response.last_modified = image.mtime_ns / 1e9
+        response.headers["Cache-Control"] = IMMUTABLE if image.immutable else REVALIDATE
+
+
+def get_image_server() -> ImageServer:
+    """Return the current app's ImageServer."""
+    return current_app.extensions["images"]
+
+
+def init_images(app: Flask, config: Optional[ImageConfig] = None) -> ImageServer:
+    """Serve ``/images/<filename>`` (originals and ``variants/...``) from the images directory."""
+    config = config or ImageConfig.from_env()
+    os.makedirs(config.directory, exist_ok=True)
+    server = ImageServer(config)
+    app.extensions["images"] = server
+    # Files the garbage collector deletes must not live on in memory
+    get_image_gc().subscribe(server.forget_image)
+    app.add_url_rule("/images/<path:filename>", "serve_image", server.serve)
+    return server
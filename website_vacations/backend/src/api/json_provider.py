@@ -0,0 +1,98 @@
+"""Fast JSON provider for Flask, backed by orjson when it is installed."""
+
+import dataclasses
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable
+
+from flask import Flask, Response
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# Encoders for specific dataclass types; other dataclasses get camelCase keys
+_dataclass_encoders: dict[type, Callable[[Any], Any]] = {}
+_field_names: dict[type, tuple[tuple[str, str], ...]] = {}
+
+
+def register_encoder(dto_type: type, encoder: Callable[[Any], Any]) -> None:
+    """Serialize instances of ``dto_type`` with ``encoder`` instead of the generic mapping."""
+    _dataclass_encoders[dto_type] = encoder
+
+
+def to_camel(name: str) -> str:
+    """Convert a snake_case field name to camelCase (the API's key style)."""
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+def _camel_fields(dto_type: type) -> tuple[tuple[str, str], ...]:
+    names = _field_names.get(dto_type)
+    if names is None:
+        names = tuple((f.name, to_camel(f.name)) for f in dataclasses.fields(dto_type))
+        _field_names[dto_type] = names
+    return names
+
+
+def _default(obj: Any) -> Any:
+    """Convert the types neither orjson nor json handle the way the API wants."""
+    encoder = _dataclass_encoders.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {key: getattr(obj, name) for name, key in _camel_fields(type(obj))}
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+    def loads(data: Any) -> Any:
+        return orjson.loads(data)
+else:  # pragma: no cover - exercised only without orjson
+    _stdlib_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        return _stdlib_encoder.encode(obj).encode("utf-8")
+
+    def loads(data: Any) -> Any:
+        return json.loads(data)
+
+
+class FastJSONProvider(JSONProvider):
+    """Flask JSON provider that writes compact UTF-8 bytes in one call.
+
+    Dates become ISO strings, Decimals floats and dataclasses camelCase
+    objects (or whatever encoder was registered for their type), so routes
+    can return DTOs and raw rows as they are. Keys keep their insertion
+    order.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype="application/json")
+
+
+def init_json(app: Flask) -> None:
+    """Install FastJSONProvider as ``app.json`` (used by jsonify and request.get_json)."""
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
@@ -1,13 +1,48 @@
 """API routes for Vacations application."""
 
-from datetime import datetime
+from datetime import date, datetime
 from flask import Flask, jsonify, request
 from typing import Dict, Any
+from werkzeug.exceptions import HTTPException
 
+from src.api.conditional import REFERENCE_DATA, json_response, not_modified, version_etag
+from src.api.encoders import CATALOG_VACATION_ENCODER, COUNTRY_ENCODER, VACATION_ENCODER
+from src.api.json_provider import dumps_bytes
+from src.api.streaming import stream_format, stream_response
+from src.api.uploads import accept_upload
+from src.dal.connection_pool import get_pool_stats
 from src.dal.country_dao import CountryDAO
+from src.dal.like_dao import LikeDAO
+from src.services.catalog_cache import CachedPayload, get_catalog_cache
+from src.services.image_gc import get_image_gc
+from src.services.image_pipeline import get_image_pipeline
+from src.services.like_buffer import get_like_buffer
+from src.services.like_feed import FeedFullError, get_like_feed
 from src.services.user_service import UserService
 from src.services.vacation_service import VacationService
-from src.models.dtos import RoleName
+from src.models.dtos import LikeResultDTO, RoleName, VacationFilters
+
+
+def like_result_to_dict(result: LikeResultDTO, message: str) -> Dict[str, Any]:
+    """Convert a like/unlike result to its camelCase JSON shape."""
+    return {
+        "message": message,
+        "vacationId": result.vacation_id,
+        "liked": result.liked,
+        "changed": result.changed,
+        "likesCount": result.likes_count,
+    }
+
+
+def parse_vacation_filters() -> VacationFilters:
+    """Read catalog filters from the query string."""
+    return VacationFilters(
+        liked_only=request.args.get("liked", "").lower() in ("1", "true"),
+        status=request.args.get("status") or None,
+        country_id=request.args.get("countryId", type=int),
+        min_price=request.args.get("minPrice", type=float),
+        max_price=request.args.get("maxPrice", type=float),
+    )
 
 
 def register_routes(app: Flask) -> None:
@@ -16,11 +51,33 @@ def register_routes(app: Flask) -> None:
     user_service = UserService()
     vacation_service = VacationService()
     country_dao = CountryDAO()
+    like_dao = LikeDAO()
+    catalog_cache = get_catalog_cache()
+    like_buffer = get_like_buffer()
+    like_feed = get_like_feed()
+    image_pipeline = get_image_pipeline()
+    
+    def catalog_item(vacation) -> Dict[str, Any]:
+        """Encode a catalog row, adding its image URLs (variants once ready)."""
+        item = CATALOG_VACATION_ENCODER.from_dto(vacation)
+        if vacation.image_name:
+            item["images"] = image_pipeline.urls(vacation.image_name)
+        return item
     
     @app.route("/api/health", methods=["GET"])
     def health_check():
-        """Health check endpoint."""
-        return jsonify({"status": "ok"}), 200
+        """Health check endpoint, including connection pool stats."""
+        return jsonify({
+            "status": "ok",
+            "pools": get_pool_stats(),
+            "catalogCache": catalog_cache.stats(),
+            "likeBuffer": like_buffer.stats(),
+            "likeFeed": like_feed.stats(),
+            "imagePipeline": image_pipeline.stats(),
+            "imageCache": app.extensions["images"].stats() if "images" in app.extensions else None,
+            "imageGc": get_image_gc().stats(),
+            "imageUploads": app.extensions["image_store"].stats() if "image_store" in app.extensions else None,
+        }), 200
     
     # User endpoints
     @app.route("/api/users/register", methods=["POST"])
@@ -64,10 +121,7 @@ def register_routes(app: Flask) -> None:
             )
             
             # Get role name to determine if admin
-            from src.dal.role_dao import RoleDAO
-            role_dao = RoleDAO()
-            role = role_dao.get_by_id(user.role_id)
-            is_admin = role and role["name"] == "Admin"
+            is_admin = user_service.is_admin(user.role_id)
             
             return jsonify({
                 "id": user.id,
@@ -84,10 +138,11 @@ def register_routes(app: Flask) -> None:
     
     @app.route("/api/users/<int:user_id>/likes/<int:vacation_id>", methods=["POST"])
     def like_vacation(user_id: int, vacation_id: int):
-        """Add a like to a vacation."""
+        """Add a like to a vacation. Idempotent: liking twice reports "already liked"."""
         try:
-            user_service.like_vacation(user_id, vacation_id)
-            return jsonify({"message": "Vacation liked successfully"}), 200
+            result = user_service.set_like(user_id, vacation_id, True)
+            message = "Vacation liked successfully" if result.changed else "Vacation already liked"
+            return jsonify(like_result_to_dict(result, message)), 200
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
@@ -95,10 +150,46 @@ def register_routes(app: Flask) -> None:
     
     @app.route("/api/users/<int:user_id>/likes/<int:vacation_id>", methods=["DELETE"])
     def unlike_vacation(user_id: int, vacation_id: int):
-        """Remove a like from a vacation."""
+        """Remove a like from a vacation. Idempotent: unliking twice reports "not liked"."""
+        try:
+            result = user_service.set_like(user_id, vacation_id, False)
+            message = "Vacation unliked successfully" if result.changed else "Vacation not liked"
+            return jsonify(like_result_to_dict(result, message)), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    @app.route("/api/users/<int:user_id>/likes/batch", methods=["POST"])
+    def batch_likes(user_id: int):
+        """Apply many likes/unlikes in one transaction.
+        
+        Body: {"operations": [{"vacationId": 1, "action": "like" | "unlike"}, ...]}
+        """
         try:
-            user_service.unlike_vacation(user_id, vacation_id)
-            return jsonify({"message": "Vacation unliked successfully"}), 200
+            data = request.get_json()
+            if not data or not isinstance(data.get("operations"), list):
+                return jsonify({"error": "A list of operations is required"}), 400
+            
+            operations = []
+            for op in data["operations"]:
+                action = op.get("action") if isinstance(op, dict) else None
+                if action not in ("like", "unlike") or not isinstance(op.get("vacationId"), int):
+                    return jsonify({"error": "Each operation needs an integer vacationId and an action of like or unlike"}), 400
+                operations.append((op["vacationId"], action == "like"))
+            
+            results = user_service.apply_like_batch(user_id, operations)
+            return jsonify({
+                "results": [
+                    {
+                        "vacationId": r.vacation_id,
+                        "action": "like" if r.liked else "unlike",
+                        "status": r.status,
+                        "likesCount": r.likes_count,
+                    }
+                    for r in results
+                ],
+            }), 200
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
@@ -107,27 +198,79 @@ def register_routes(app: Flask) -> None:
     # Vacation endpoints
     @app.route("/api/vacations", methods=["GET"])
     def list_vacations():
-        """Get all vacations sorted by start date with likes count."""
+        """Get vacations sorted by start date with country name, likes count
+        and, when userId is given, whether that user liked each vacation.
+        
+        Optional filters: liked, status (ongoing/upcoming), countryId,
+        minPrice, maxPrice. When limit is given the response is one keyset
+        page: {"items": [...], "nextCursor": ...}; pass nextCursor back as
+        cursor to get the following page. Without limit, stream=true or
+        format=ndjson streams the whole catalog straight from the database."""
         try:
-            from src.dal.like_dao import LikeDAO
-            like_dao = LikeDAO()
+            user_id = request.args.get("userId", type=int)
+            filters = parse_vacation_filters()
+            paged = "limit" in request.args
+            fmt = stream_format()
+            if fmt and not paged:
+                rows = vacation_service.iter_catalog(user_id, filters)
+                return stream_response(app, rows, catalog_item, fmt)
             
-            vacations = vacation_service.list_vacations()
-            likes_count = like_dao.get_likes_count_by_vacation()
+            cursor = request.args.get("cursor") or None
+            limit = (request.args.get("limit", type=int) or 0) if paged else None
+            
+            # The ETag follows the data versions writes bump (and the date,
+            # for the status filter), so a matching If-None-Match is answered
+            # before the cache or the database is touched
+            etag = version_etag(
+                catalog_cache.validator(),
+                like_buffer.version,
+                date.today(),
+                vacation_service.catalog_key(user_id, filters, cursor, limit),
+            )
+            unchanged = not_modified(app, etag)
+            if unchanged is not None:
+                return unchanged
+            entry = vacation_service.get_catalog_entry(user_id, filters, cursor=cursor, limit=limit)
             
-            vacations_list = []
-            for v in vacations:
-                vacations_list.append({
-                    "id": v.id,
-                    "countryId": v.country_id,
-                    "description": v.description,
-                    "startDate": v.start_date.isoformat() if v.start_date else None,
-                    "endDate": v.end_date.isoformat() if v.end_date else None,
-                    "price": v.price,
-                    "imageName": v.image_name,
-                    "likesCount": likes_count.get(v.id, 0),
-                })
-            return jsonify(vacations_list), 200
+            # Serialize and compress once per cached result; later hits reuse the bytes
+            payload = entry.payload
+            if payload is None:
+                items = entry.items
+                vacations_list = [catalog_item(v) for v in items]
+                if paged:
+                    body = {"items": vacations_list, "nextCursor": entry.next_cursor}
+                else:
+                    body = vacations_list
+                data = dumps_bytes(body)
+                payload = CachedPayload(data)
+                catalog_cache.attach_payload(entry, items, payload)
+            return json_response(app, payload.body, etag, encoded=payload.encoded)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    @app.route("/api/vacations/changes", methods=["GET"])
+    def list_vacation_changes():
+        """Get catalog rows changed, and vacation IDs deleted, since a version.
+        
+        Returns {"version": ..., "items": [...], "deletedIds": [...]}; pass
+        version back as since on the next poll. since=0 (the default) is a
+        full sync. userId works as for /api/vacations."""
+        try:
+            user_id = request.args.get("userId", type=int)
+            since = request.args.get("since", "0")
+            if not since.isdigit():
+                raise ValueError("Since must be a non-negative change version")
+            changes = vacation_service.get_catalog_changes(user_id, int(since))
+            payload = dumps_bytes({
+                "version": changes.version,
+                "items": [catalog_item(v) for v in changes.items],
+                "deletedIds": changes.deleted_ids,
+            })
+            return json_response(app, payload)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             return jsonify({"error": f"Internal server error: {str(e)}"}), 500
     
@@ -141,15 +284,20 @@ def register_routes(app: Flask) -> None:
             if not vacation:
                 return jsonify({"error": "Vacation not found"}), 404
             
-            return jsonify({
+            result = {
                 "id": vacation["id"],
                 "countryId": vacation["country_id"],
                 "description": vacation["description"],
-                "startDate": vacation["start_date"].isoformat() if vacation["start_date"] else None,
-                "endDate": vacation["end_date"].isoformat() if vacation["end_date"] else None,
-                "price": float(vacation["price"]),
+                "startDate": vacation["start_date"],
+                "endDate": vacation["end_date"],
+                "price": vacation["price"],
                 "imageName": vacation.get("image_name"),
-            }), 200
+            }
+            if vacation.get("image_placeholder"):
+                result["imagePlaceholder"] = vacation["image_placeholder"]
+            if vacation.get("image_name"):
+                result["images"] = image_pipeline.urls(vacation["image_name"])
+            return jsonify(result), 200
         except Exception as e:
             return jsonify({"error": f"Internal server error: {str(e)}"}), 500
     
@@ -157,9 +305,6 @@ def register_routes(app: Flask) -> None:
     def create_vacation():
         """Create a new vacation."""
         try:
-            import os
-            from werkzeug.utils import secure_filename
-            
             # Check if request has file (multipart/form-data) or JSON
             if request.files and "image" in request.files:
                 # Handle multipart/form-data with image upload
@@ -169,20 +314,9 @@ def register_routes(app: Flask) -> None:
                 # Save image if provided
                 image_name = None
                 if image_file and image_file.filename:
-                    # Create images directory
-                    images_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "images")
-                    os.makedirs(images_dir, exist_ok=True)
-                    
-                    # Secure filename and save
-                    filename = secure_filename(image_file.filename)
-                    # Add timestamp to avoid conflicts
-                    import time
-                    timestamp = int(time.time())
-                    name, ext = os.path.splitext(filename)
-                    filename = f"{name}_{timestamp}{ext}"
-                    filepath = os.path.join(images_dir, filename)
-                    image_file.save(filepath)
-                    image_name = filename
+                    # Already streamed to disk and hashed; stored under that
+                    # hash in the background, so re-uploads share one file
+                    image_name = accept_upload(image_file)
             else:
                 # Handle JSON request (backward compatibility)
                 data = request.get_json()
@@ -203,15 +337,10 @@ def register_routes(app: Flask) -> None:
                 image_name=image_name,
             )
             
-            return jsonify({
-                "id": vacation.id,
-                "countryId": vacation.country_id,
-                "description": vacation.description,
-                "startDate": vacation.start_date.isoformat(),
-                "endDate": vacation.end_date.isoformat(),
-                "price": vacation.price,
-                "imageName": vacation.image_name,
-            }), 201
+            return jsonify(VACATION_ENCODER.from_dto(vacation)), 201
+        except HTTPException as e:
+            # Upload refused while streaming (too large, not an image)
+            return jsonify({"error": e.description}), e.code
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
@@ -221,9 +350,6 @@ def register_routes(app: Flask) -> None:
     def update_vacation(vacation_id: int):
         """Update an existing vacation."""
         try:
-            import os
-            from werkzeug.utils import secure_filename
-            
             # Check if request has file (multipart/form-data) or JSON
             if request.files and "image" in request.files:
                 # Handle multipart/form-data with image upload
@@ -233,20 +359,9 @@ def register_routes(app: Flask) -> None:
                 # Save image if provided
                 image_name = None
                 if image_file and image_file.filename:
-                    # Create images directory
-                    images_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "images")
-                    os.makedirs(images_dir, exist_ok=True)
-                    
-                    # Secure filename and save
-                    filename = secure_filename(image_file.filename)
-                    # Add timestamp to avoid conflicts
-                    import time
-                    timestamp = int(time.time())
-                    name, ext = os.path.splitext(filename)
-                    filename = f"{name}_{timestamp}{ext}"
-                    filepath = os.path.join(images_dir, filename)
-                    image_file.save(filepath)
-                    image_name = filename
+                    # Already streamed to disk and hashed; stored under that
+                    # hash in the background, so re-uploads share one file
+                    image_name = accept_upload(image_file)
             else:
                 # Handle JSON request (backward compatibility)
                 data = request.get_json()
@@ -272,15 +387,10 @@ def register_routes(app: Flask) -> None:
                 image_name=image_name,
             )
             
-            return jsonify({
-                "id": vacation.id,
-                "countryId": vacation.country_id,
-                "description": vacation.description,
-                "startDate": vacation.start_date.isoformat(),
-                "endDate": vacation.end_date.isoformat(),
-                "price": vacation.price,
-                "imageName": vacation.image_name,
-            }), 200
+            return jsonify(VACATION_ENCODER.from_dto(vacation)), 200
+        except HTTPException as e:
+            # Upload refused while streaming (too large, not an image)
+            return jsonify({"error": e.description}), e.code
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
@@ -300,24 +410,67 @@ def register_routes(app: Flask) -> None:
     # Country endpoints
     @app.route("/api/countries", methods=["GET"])
     def list_countries():
-        """Get all countries."""
+        """Get all countries. stream=true or format=ndjson streams them.
+        
+        Countries are reference data, so the list may be cached publicly
+        and revalidated with its ETag."""
         try:
-            countries = country_dao.list_all()
-            countries_list = [{"id": c["id"], "name": c["name"]} for c in countries]
-            return jsonify(countries_list), 200
+            fmt = stream_format()
+            if fmt:
+                return stream_response(app, country_dao.iter_all(), COUNTRY_ENCODER.from_row, fmt)
+            encode = COUNTRY_ENCODER.from_row
+            payload = dumps_bytes([encode(c) for c in country_dao.list_all()])
+            return json_response(app, payload, cache_control=REFERENCE_DATA)
         except Exception as e:
             return jsonify({"error": f"Internal server error: {str(e)}"}), 500
     
+    @app.route("/api/likes/stream", methods=["GET"])
+    def stream_like_counts():
+        """Stream like-count changes as Server-Sent Events.
+        
+        Each "likes" event carries {"changes": [{"vacationId", "likesCount"}]}
+        for the vacations whose count changed in the last interval. A
+        "resync" event means changes were missed and the catalog should be
+        reloaded. Streams are only served by greenlet workers (gevent or
+        eventlet), never by a thread per client; past
+        LIKE_FEED_MAX_SUBSCRIBERS the request gets 503 and should retry."""
+        if not like_feed.enabled:
+            return jsonify({"error": "Like feed is disabled (it needs a gevent or eventlet worker)"}), 404
+        last_event_id = request.headers.get("Last-Event-ID", type=int)
+        try:
+            frames = like_feed.stream(last_event_id)
+        except FeedFullError as e:
+            response = jsonify({"error": str(e)})
+            response.headers["Retry-After"] = "30"
+            return response, 503
+        response = app.response_class(frames, mimetype="text/event-stream")
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+    
     # Likes endpoint - get likes for a user
     @app.route("/api/users/<int:user_id>/likes", methods=["GET"])
     def get_user_likes(user_id: int):
-        """Get all vacations liked by a user."""
+        """Get all vacations liked by a user.
+        
+        stream=true streams the same object; format=ndjson streams one
+        vacation ID per line."""
         try:
-            from src.dal.like_dao import LikeDAO
-            like_dao = LikeDAO()
-            likes = like_dao.get_by_user_id(user_id)
-            vacation_ids = [like["vacation_id"] for like in likes]
-            return jsonify({"likedVacationIds": vacation_ids}), 200
+            if like_buffer.has_pending(user_id):
+                # The list is read from the database; the user's own buffered likes must be in it
+                like_buffer.flush()
+            fmt = stream_format()
+            if fmt:
+                return stream_response(
+                    app,
+                    like_dao.iter_vacation_ids_by_user(user_id),
+                    int,
+                    fmt,
+                    prefix='{"likedVacationIds":[',
+                    suffix="]}",
+                )
+            payload = dumps_bytes({"likedVacationIds": like_dao.list_vacation_ids_by_user(user_id)})
+            return json_response(app, payload)
         except Exception as e:
             return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
@@ -0,0 +1,98 @@
+"""Incremental JSON and NDJSON responses for large collections."""
+
+import contextvars
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+
+from src.api.json_provider import dumps_bytes
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+# Items are grouped into chunks of about this many bytes before being written
+CHUNK_SIZE = 16 * 1024
+
+
+def stream_format() -> Optional[str]:
+    """
+    Return "ndjson" or "json" when the client asked for a streamed response,
+    else None.
+
+    NDJSON is chosen with ``?format=ndjson`` or ``Accept: application/x-ndjson``;
+    a streamed JSON array with ``?stream=true``.
+    """
+    if request.args.get("format", "").lower() == "ndjson":
+        return "ndjson"
+    if request.accept_mimetypes.best == NDJSON_MIMETYPE:
+        return "ndjson"
+    if request.args.get("stream", "").lower() in ("1", "true"):
+        return "json"
+    return None
+
+
+def _detached(rows: Iterable) -> Iterator:
+    """Iterate ``rows`` outside the request's context.
+
+    The request's unit of work has ended by the time the body is sent, so
+    each step runs in one fresh context and the DAO opens its own
+    connection for the duration of the stream.
+    """
+    context = contextvars.Context()
+    iterator = context.run(iter, rows)
+    while True:
+        try:
+            yield context.run(next, iterator)
+        except StopIteration:
+            return
+
+
+def _encode(
+    rows: Iterable,
+    to_dict: Callable[[Any], Any],
+    fmt: str,
+    prefix: str,
+    suffix: str,
+) -> Iterator[bytes]:
+    chunk: list[bytes] = [] if fmt == "ndjson" else [prefix.encode()]
+    size = 0
+    first = True
+    for row in _detached(rows):
+        data = dumps_bytes(to_dict(row))
+        if fmt == "ndjson":
+            data += b"\n"
+        elif not first:
+            data = b"," + data
+        first = False
+        chunk.append(data)
+        size += len(data)
+        if size >= CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk, size = [], 0
+    if fmt != "ndjson":
+        chunk.append(suffix.encode())
+    if chunk:
+        yield b"".join(chunk)
+
+
+def stream_response(
+    app: Flask,
+    rows: Iterable,
+    to_dict: Callable[[Any], Any],
+    fmt: str,
+    prefix: str = "[",
+    suffix: str = "]",
+) -> Response:
+    """
+    Build a response that encodes ``rows`` as they are produced.
+
+    ``fmt`` "json" writes one JSON document, ``prefix`` + items + ``suffix``
+    (a bare array by default); "ndjson" writes one item per line. Once the
+    first byte is sent the status cannot change, so a failure mid-stream
+    ends the body early and the client sees truncated output.
+    """
+    mimetype = NDJSON_MIMETYPE if fmt == "ndjson" else "application/json"
+    response = app.response_class(
+        _encode(rows, to_dict, fmt, prefix, suffix), status=200, mimetype=mimetype
+    )
+    # Let reverse proxies pass chunks through instead of buffering them
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
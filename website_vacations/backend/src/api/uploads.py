@@ -0,0 +1,145 @@
+"""Streaming, size-bounded image uploads, hashed while they arrive."""
+
+import hashlib
+import io
+import os
+from typing import Optional
+
+from flask import Flask, Request, current_app
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge, UnsupportedMediaType
+
+from src.config import ImageConfig
+from src.services.image_store import SNIFF_BYTES, ImageStore, get_image_store, sniff_image
+
+
+class IncomingImage(io.RawIOBase):
+    """The file Werkzeug's multipart parser writes an uploaded image into.
+
+    Each chunk goes straight to a temporary file in the images directory
+    and into a sha256, so the body is never held in memory and never read
+    twice. The first bytes must be a known image format and the total must
+    stay within ``max_bytes``; otherwise parsing stops at once and the
+    temporary file is removed. Unless ``accept_upload`` hands it on, the
+    file is removed when the request closes it.
+    """
+
+    def __init__(self, store: ImageStore, max_bytes: int) -> None:
+        super().__init__()
+        self._max_bytes = max_bytes
+        fd, self.path = store.temp_file()
+        self._file = os.fdopen(fd, "w+b")
+        self._digest = hashlib.sha256()
+        self._head = b""
+        self.size = 0
+        self.extension: Optional[str] = None
+        self.handed_off = False
+
+    def writable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        if self.size > self._max_bytes:
+            self._discard()
+            raise RequestEntityTooLarge(f"Image is larger than {self._max_bytes} bytes")
+        if self.extension is None:
+            self._head += data[:SNIFF_BYTES]
+            if len(self._head) >= SNIFF_BYTES:
+                self.extension = sniff_image(self._head)
+                if self.extension is None:
+                    self._discard()
+                    raise UnsupportedMediaType("Image must be a JPEG, PNG, GIF, WebP or AVIF file")
+        self._digest.update(data)
+        return self._file.write(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def readinto(self, buffer) -> int:
+        return self._file.readinto(buffer)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def finish(self) -> str:
+        """Close the temporary file and return the content name of what was written."""
+        if self.extension is None:
+            # Shorter than the signature of any accepted format
+            self._discard()
+            raise UnsupportedMediaType("Image must be a JPEG, PNG, GIF, WebP or AVIF file")
+        self._file.close()
+        self.handed_off = True
+        # The sniffed extension, never the one the client claimed
+        return self._digest.hexdigest() + self.extension
+
+    def close(self) -> None:
+        if not self.closed and not self.handed_off:
+            self._discard()
+        super().close()
+
+    def _discard(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class UploadRequest(Request):
+    """Request whose file fields stream into ``IncomingImage`` instead of memory or /tmp."""
+
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None,
+    ):
+        config: ImageConfig = current_app.extensions["uploads"]
+        limit = content_length or total_content_length
+        if limit and limit > config.upload_max_bytes + 64 * 1024:
+            # Refused from the headers, before a single byte is read
+            raise RequestEntityTooLarge(f"Image is larger than {config.upload_max_bytes} bytes")
+        return IncomingImage(current_app.extensions["image_store"], config.upload_max_bytes)
+
+
+def accept_upload(image_file: FileStorage) -> str:
+    """
+    Place an uploaded image in the store and return its content name; the
+    fsync and its variants follow on a background thread.
+    """
+    upload = image_file.stream
+    if not isinstance(upload, IncomingImage):
+        raise BadRequest("Image upload was not streamed")
+    image_name = upload.finish()
+    store: ImageStore = current_app.extensions["image_store"]
+    try:
+        # A rename, so the name exists before any row can refer to it
+        store.place(upload.path, image_name)
+    except BaseException:
+        upload.handed_off = False
+        upload.close()
+        raise
+    store.persist_async(image_name)
+    return image_name
+
+
+def init_uploads(
+    app: Flask,
+    config: Optional[ImageConfig] = None,
+    store: Optional[ImageStore] = None,
+) -> None:
+    """Stream multipart file fields of ``app`` into ``store``, at most ``upload_max_bytes`` each."""
+    app.extensions["uploads"] = config or ImageConfig.from_env()
+    app.extensions["image_store"] = store or get_image_store()
+    app.request_class = UploadRequest
@@ -1,6 +1,9 @@
 import os
 from dataclasses import dataclass
 
+# backend/images, next to src/
+DEFAULT_IMAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images")
+
 
 @dataclass(frozen=True)
 class DbConfig:
@@ -32,3 +35,111 @@ def get_connection_kwargs() -> dict:
     }
 
 
+@dataclass(frozen=True)
+class PoolConfig:
+    min_size: int
+    max_size: int
+    idle_timeout: float
+    checkout_timeout: float
+    health_check_interval: float
+
+    @staticmethod
+    def from_env() -> "PoolConfig":
+        return PoolConfig(
+            min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+            max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+            checkout_timeout=float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "30")),
+            health_check_interval=float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30")),
+        )
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    enabled: bool
+    max_entries: int
+    ttl: float
+
+    @staticmethod
+    def from_env() -> "CacheConfig":
+        return CacheConfig(
+            enabled=os.getenv("CATALOG_CACHE_ENABLED", "true").lower() == "true",
+            max_entries=int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "256")),
+            ttl=float(os.getenv("CATALOG_CACHE_TTL", "60")),
+        )
+
+
+@dataclass(frozen=True)
+class LikeBufferConfig:
+    enabled: bool
+    max_pending: int
+    flush_interval: float
+
+    @staticmethod
+    def from_env() -> "LikeBufferConfig":
+        return LikeBufferConfig(
+            enabled=os.getenv("LIKE_BUFFER_ENABLED", "false").lower() == "true",
+            max_pending=int(os.getenv("LIKE_BUFFER_MAX_PENDING", "500")),
+            flush_interval=float(os.getenv("LIKE_BUFFER_FLUSH_INTERVAL", "1.0")),
+        )
+
+
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    enabled: bool
+    min_size: int
+    gzip_level: int
+    brotli_quality: int
+
+    @staticmethod
+    def from_env() -> "CompressionConfig":
+        return CompressionConfig(
+            enabled=os.getenv("COMPRESSION_ENABLED", "true").lower() == "true",
+            min_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+            gzip_level=int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+            brotli_quality=int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5")),
+        )
+
+
+@dataclass(frozen=True)
+class LikeFeedConfig:
+    enabled: bool
+    interval: float
+    heartbeat: float
+    history: int
+    max_subscribers: int
+
+    @staticmethod
+    def from_env() -> "LikeFeedConfig":
+        return LikeFeedConfig(
+            enabled=os.getenv("LIKE_FEED_ENABLED", "true").lower() == "true",
+            interval=float(os.getenv("LIKE_FEED_INTERVAL", "0.5")),
+            heartbeat=float(os.getenv("LIKE_FEED_HEARTBEAT", "15")),
+            history=int(os.getenv("LIKE_FEED_HISTORY", "256")),
+            max_subscribers=int(os.getenv("LIKE_FEED_MAX_SUBSCRIBERS", "100")),
+        )
+
+
+@dataclass(frozen=True)
+class ImageConfig:
+    directory: str
+    variants_enabled: bool
+    variant_workers: int
+    cache_max_bytes: int
+    cache_item_max_bytes: int
+    gc_grace_period: float
+    upload_max_bytes: int
+
+    @staticmethod
+    def from_env() -> "ImageConfig":
+        return ImageConfig(
+            directory=os.getenv("IMAGES_DIR", DEFAULT_IMAGES_DIR),
+            variants_enabled=os.getenv("IMAGE_VARIANTS_ENABLED", "true").lower() == "true",
+            variant_workers=int(os.getenv("IMAGE_VARIANT_WORKERS", "2")),
+            cache_max_bytes=int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+            cache_item_max_bytes=int(os.getenv("IMAGE_CACHE_ITEM_MAX_BYTES", str(256 * 1024))),
+            gc_grace_period=float(os.getenv("IMAGE_GC_GRACE_PERIOD", "3600")),
+            upload_max_bytes=int(os.getenv("IMAGE_UPLOAD_MAX_BYTES", str(10 * 1024 * 1024))),
+        )
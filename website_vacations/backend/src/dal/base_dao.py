@@ -1,10 +1,63 @@
 from contextlib import contextmanager
-from typing import Generator, Any, Iterable, Optional
+from datetime import date
+from itertools import count, islice
+from typing import Generator, Any, Iterable, Iterator, Optional
 
 import psycopg2
 import psycopg2.extras
 
 from src.config import get_connection_kwargs
+from src.dal.connection_pool import get_pool
+from src.dal.unit_of_work import current_unit_of_work
+
+BULK_PAGE_SIZE = 1000
+STREAM_ITERSIZE = 2000
+
+# Server-side cursor names only need to be unique per connection
+_cursor_ids = count(1)
+
+# Characters that must be escaped in COPY's text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class _CopyStream:
+    """File-like object feeding rows to COPY ... FROM STDIN without building the whole input."""
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self._lines = ("\t".join(_copy_value(v) for v in row) + "\n" for row in rows)
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    readline = read
+
+
+def _chunks(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class BaseDAO:
@@ -12,14 +65,111 @@ class BaseDAO:
         self._conn_kwargs = get_connection_kwargs()
 
     @contextmanager
-    def _cursor(self) -> Generator[psycopg2.extensions.cursor, None, None]:
-        conn = psycopg2.connect(**self._conn_kwargs)
+    def _cursor(self, tuples: bool = False) -> Generator[psycopg2.extensions.cursor, None, None]:
+        """Yield a cursor on the current unit of work's connection, or a pooled one.
+
+        Rows are dicts by default; ``tuples=True`` returns plain tuples, which
+        hot paths map straight onto DTOs without building a dict per row.
+        """
+        factory = None if tuples else psycopg2.extras.RealDictCursor
+        uow = current_unit_of_work()
+        if uow is not None:
+            # Share the unit of work's connection; it commits once at the end
+            conn = uow.connection(self._conn_kwargs)
+            try:
+                with conn.cursor(cursor_factory=factory) as cur:
+                    yield cur
+            except Exception:
+                uow.rollback_only = True
+                raise
+            return
+
+        pool = get_pool(self._conn_kwargs)
+        conn = pool.getconn()
         try:
             with conn:
-                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                with conn.cursor(cursor_factory=factory) as cur:
                     yield cur
         finally:
-            conn.close()
+            pool.putconn(conn)
+
+    def _stream(
+        self,
+        sql: str,
+        params: Optional[tuple] = None,
+        itersize: int = STREAM_ITERSIZE,
+        tuples: bool = False,
+    ) -> Iterator:
+        """Yield rows from a server-side (named) cursor, ``itersize`` rows per round trip.
+
+        Memory stays constant whatever the table size. The connection stays
+        checked out until the generator is exhausted or closed.
+        """
+        if itersize < 1:
+            raise ValueError("itersize must be at least 1")
+        name = f"stream_{next(_cursor_ids)}"
+        factory = None if tuples else psycopg2.extras.RealDictCursor
+        uow = current_unit_of_work()
+        if uow is not None:
+            conn = uow.connection(self._conn_kwargs)
+            try:
+                with conn.cursor(name, cursor_factory=factory) as cur:
+                    cur.itersize = itersize
+                    cur.execute(sql, params)
+                    yield from cur
+            except Exception:
+                uow.rollback_only = True
+                raise
+            return
+
+        pool = get_pool(self._conn_kwargs)
+        conn = pool.getconn()
+        try:
+            with conn:
+                with conn.cursor(name, cursor_factory=factory) as cur:
+                    cur.itersize = itersize
+                    cur.execute(sql, params)
+                    yield from cur
+        finally:
+            pool.putconn(conn)
+
+    def _insert_many(
+        self,
+        sql: str,
+        rows: Iterable[tuple],
+        template: Optional[str] = None,
+        page_size: int = BULK_PAGE_SIZE,
+    ) -> list[dict]:
+        """Insert rows with multi-row VALUES, ``page_size`` rows per statement.
+
+        ``sql`` must contain a single ``VALUES %s`` placeholder and may end in
+        RETURNING, whose rows are returned in input order. All pages run in one
+        transaction, so either every row is inserted or none is.
+        """
+        fetch = "RETURNING" in sql.upper()
+        returned: list[dict] = []
+        with self._cursor() as cur:
+            for chunk in _chunks(rows, page_size):
+                result = psycopg2.extras.execute_values(
+                    cur, sql, chunk, template=template, page_size=len(chunk), fetch=fetch
+                )
+                if fetch:
+                    returned.extend(result)
+        return returned
+
+    def _copy_rows(self, table: str, columns: Iterable[str], rows: Iterable[tuple]) -> int:
+        """Stream rows into ``table`` with COPY FROM STDIN. Returns the number of rows copied.
+
+        COPY is the fastest way to load many rows but cannot return generated
+        IDs or skip conflicts; the whole load fails if any row is rejected.
+        """
+        column_list = ", ".join(columns)
+        with self._cursor() as cur:
+            cur.copy_expert(
+                f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT text)",
+                _CopyStream(rows),
+            )
+            return cur.rowcount
 
     # Generic CRUD signatures (to be overridden in concrete DAOs)
     def list_all(self) -> Iterable[dict]:
@@ -1,19 +1,26 @@
 """Data Access Object for Countries table."""
 
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
-from src.dal.base_dao import BaseDAO
+from src.dal.base_dao import STREAM_ITERSIZE, BaseDAO
 
 
 class CountryDAO(BaseDAO):
     """DAO for managing countries in the database."""
 
-    def list_all(self) -> Iterable[dict]:
-        """Retrieve all countries from the database."""
-        with self._cursor() as cur:
-            cur.execute("SELECT id, name FROM countries ORDER BY name")
+    # Columns follow CountryDTO's field order
+    LIST_ALL_SQL = "SELECT id, name FROM countries ORDER BY name"
+
+    def list_all(self) -> Iterable[tuple]:
+        """Retrieve all countries as (id, name) tuples, ordered by name."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(self.LIST_ALL_SQL)
             return cur.fetchall()
 
+    def iter_all(self, itersize: int = STREAM_ITERSIZE) -> Iterator[tuple]:
+        """Stream all countries as (id, name) tuples, ordered by name, in constant memory."""
+        return self._stream(self.LIST_ALL_SQL, itersize=itersize, tuples=True)
+
     def get_by_id(self, country_id: int) -> Optional[dict]:
         """Retrieve a country by its ID."""
         with self._cursor() as cur:
@@ -30,6 +37,18 @@ class CountryDAO(BaseDAO):
             result = cur.fetchone()
             return result["id"]
 
+    def insert_many(self, rows: Iterable[dict]) -> list[int]:
+        """Insert many countries with multi-row VALUES in one transaction. Returns their IDs in order."""
+        result = self._insert_many(
+            "INSERT INTO countries (name) VALUES %s RETURNING id",
+            ((data["name"],) for data in rows),
+        )
+        return [row["id"] for row in result]
+
+    def copy_from_iter(self, rows: Iterable[dict]) -> int:
+        """Stream many countries in with COPY. Returns the number of rows loaded."""
+        return self._copy_rows("countries", ("name",), ((data["name"],) for data in rows))
+
     def update_by_id(self, country_id: int, data: dict) -> int:
         """Update a country by its ID. Returns number of rows affected."""
         with self._cursor() as cur:
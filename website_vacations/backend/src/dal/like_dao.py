@@ -1,19 +1,25 @@
 """Data Access Object for Likes table."""
 
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
-from src.dal.base_dao import BaseDAO
+from src.dal.base_dao import STREAM_ITERSIZE, BaseDAO
 
 
 class LikeDAO(BaseDAO):
     """DAO for managing likes in the database."""
 
+    LIST_ALL_SQL = "SELECT user_id, vacation_id FROM likes ORDER BY user_id, vacation_id"
+
     def list_all(self) -> Iterable[dict]:
         """Retrieve all likes from the database."""
         with self._cursor() as cur:
-            cur.execute("SELECT user_id, vacation_id FROM likes ORDER BY user_id, vacation_id")
+            cur.execute(self.LIST_ALL_SQL)
             return cur.fetchall()
 
+    def iter_all(self, itersize: int = STREAM_ITERSIZE) -> Iterator[dict]:
+        """Stream all likes, ordered by user and vacation, in constant memory."""
+        return self._stream(self.LIST_ALL_SQL, itersize=itersize)
+
     def get_by_user_and_vacation(self, user_id: int, vacation_id: int) -> Optional[dict]:
         """Retrieve a like by user_id and vacation_id."""
         with self._cursor() as cur:
@@ -32,6 +38,25 @@ class LikeDAO(BaseDAO):
             )
             return cur.fetchall()
 
+    def list_vacation_ids_by_user(self, user_id: int) -> list[int]:
+        """Retrieve the IDs of all vacations a user liked, in ascending order."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(
+                "SELECT vacation_id FROM likes WHERE user_id = %s ORDER BY vacation_id",
+                (user_id,)
+            )
+            return [row[0] for row in cur.fetchall()]
+
+    def iter_vacation_ids_by_user(self, user_id: int, itersize: int = STREAM_ITERSIZE) -> Iterator[int]:
+        """Stream the IDs of all vacations a user liked, in ascending order."""
+        rows = self._stream(
+            "SELECT vacation_id FROM likes WHERE user_id = %s ORDER BY vacation_id",
+            (user_id,),
+            itersize,
+            tuples=True,
+        )
+        return (row[0] for row in rows)
+
     def get_by_id(self, composite_key: tuple[int, int]) -> Optional[dict]:
         """Retrieve a like by composite key (user_id, vacation_id)."""
         user_id, vacation_id = composite_key
@@ -47,6 +72,22 @@ class LikeDAO(BaseDAO):
             result = cur.fetchone()
             return (result["user_id"], result["vacation_id"])
 
+    def insert_many(self, rows: Iterable[dict]) -> list[tuple[int, int]]:
+        """Insert many likes with multi-row VALUES in one transaction. Returns their composite keys."""
+        result = self._insert_many(
+            "INSERT INTO likes (user_id, vacation_id) VALUES %s RETURNING user_id, vacation_id",
+            ((data["user_id"], data["vacation_id"]) for data in rows),
+        )
+        return [(row["user_id"], row["vacation_id"]) for row in result]
+
+    def copy_from_iter(self, rows: Iterable[dict]) -> int:
+        """Stream many likes in with COPY. Returns the number of rows loaded."""
+        return self._copy_rows(
+            "likes",
+            ("user_id", "vacation_id"),
+            ((data["user_id"], data["vacation_id"]) for data in rows),
+        )
+
     def delete_by_user_and_vacation(self, user_id: int, vacation_id: int) -> int:
         """Delete a like by user_id and vacation_id. Returns number of rows affected."""
         with self._cursor() as cur:
@@ -56,6 +97,147 @@ class LikeDAO(BaseDAO):
             )
             return cur.rowcount
 
+    def like(self, user_id: int, vacation_id: int) -> Optional[dict]:
+        """Insert a like if absent, in one statement.
+
+        Returns a dict with 'changed' (False if the like already existed) and
+        the vacation's new 'likes_count', or None if the vacation does not exist.
+        """
+        with self._cursor() as cur:
+            # The CTE cannot see the trigger's counter update, so add our own delta
+            cur.execute(
+                """WITH ins AS (
+                       INSERT INTO likes (user_id, vacation_id)
+                       SELECT %s, id FROM vacations WHERE id = %s
+                       ON CONFLICT DO NOTHING
+                       RETURNING vacation_id
+                   )
+                   SELECT v.likes_count + (SELECT COUNT(*) FROM ins) AS likes_count,
+                          EXISTS (SELECT 1 FROM ins) AS changed
+                   FROM vacations v WHERE v.id = %s""",
+                (user_id, vacation_id, vacation_id)
+            )
+            return cur.fetchone()
+
+    def unlike(self, user_id: int, vacation_id: int) -> Optional[dict]:
+        """Delete a like if present, in one statement.
+
+        Returns a dict with 'changed' (False if there was no like) and the
+        vacation's new 'likes_count', or None if the vacation does not exist.
+        """
+        with self._cursor() as cur:
+            cur.execute(
+                """WITH del AS (
+                       DELETE FROM likes WHERE user_id = %s AND vacation_id = %s
+                       RETURNING vacation_id
+                   )
+                   SELECT v.likes_count - (SELECT COUNT(*) FROM del) AS likes_count,
+                          EXISTS (SELECT 1 FROM del) AS changed
+                   FROM vacations v WHERE v.id = %s""",
+                (user_id, vacation_id, vacation_id)
+            )
+            return cur.fetchone()
+
+    def like_many(self, user_id: int, vacation_ids: list[int]) -> list[dict]:
+        """Insert likes for many vacations in one set-based statement.
+
+        Returns one dict per existing vacation with 'vacation_id', 'changed'
+        and the new 'likes_count'. Vacations that do not exist are omitted.
+        """
+        with self._cursor() as cur:
+            # Insert in id order so concurrent batches lock rows consistently
+            cur.execute(
+                """WITH ins AS (
+                       INSERT INTO likes (user_id, vacation_id)
+                       SELECT %s, v.id FROM vacations v WHERE v.id = ANY(%s) ORDER BY v.id
+                       ON CONFLICT DO NOTHING
+                       RETURNING vacation_id
+                   )
+                   SELECT v.id AS vacation_id,
+                          EXISTS (SELECT 1 FROM ins WHERE ins.vacation_id = v.id) AS changed,
+                          v.likes_count
+                              + (SELECT COUNT(*) FROM ins WHERE ins.vacation_id = v.id) AS likes_count
+                   FROM vacations v WHERE v.id = ANY(%s)""",
+                (user_id, vacation_ids, vacation_ids)
+            )
+            return cur.fetchall()
+
+    def unlike_many(self, user_id: int, vacation_ids: list[int]) -> list[dict]:
+        """Delete likes for many vacations in one set-based statement.
+
+        Returns one dict per existing vacation with 'vacation_id', 'changed'
+        and the new 'likes_count'. Vacations that do not exist are omitted.
+        """
+        with self._cursor() as cur:
+            cur.execute(
+                """WITH del AS (
+                       DELETE FROM likes WHERE user_id = %s AND vacation_id = ANY(%s)
+                       RETURNING vacation_id
+                   )
+                   SELECT v.id AS vacation_id,
+                          EXISTS (SELECT 1 FROM del WHERE del.vacation_id = v.id) AS changed,
+                          v.likes_count
+                              - (SELECT COUNT(*) FROM del WHERE del.vacation_id = v.id) AS likes_count
+                   FROM vacations v WHERE v.id = ANY(%s)""",
+                (user_id, vacation_ids, vacation_ids)
+            )
+            return cur.fetchall()
+
+    def get_like_state(self, user_id: int, vacation_id: int) -> Optional[dict]:
+        """
+        Return 'liked', 'likes_count' and 'user_exists' for a vacation in one
+        query, or None if the vacation does not exist.
+        """
+        with self._cursor() as cur:
+            cur.execute(
+                """SELECT v.likes_count,
+                          EXISTS (
+                              SELECT 1 FROM likes l WHERE l.user_id = %s AND l.vacation_id = v.id
+                          ) AS liked,
+                          EXISTS (SELECT 1 FROM users u WHERE u.id = %s) AS user_exists
+                   FROM vacations v WHERE v.id = %s""",
+                (user_id, user_id, vacation_id)
+            )
+            return cur.fetchone()
+
+    def insert_pairs(self, pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Insert many (user_id, vacation_id) likes in one statement.
+
+        Existing likes and pairs whose user or vacation no longer exists are
+        skipped. Returns the pairs that were actually inserted.
+        """
+        if not pairs:
+            return []
+        user_ids, vacation_ids = (list(column) for column in zip(*pairs))
+        with self._cursor() as cur:
+            cur.execute(
+                """INSERT INTO likes (user_id, vacation_id)
+                   SELECT d.user_id, d.vacation_id
+                   FROM unnest(%s::int[], %s::int[]) AS d(user_id, vacation_id)
+                   JOIN users u ON u.id = d.user_id
+                   JOIN vacations v ON v.id = d.vacation_id
+                   ORDER BY d.vacation_id, d.user_id
+                   ON CONFLICT DO NOTHING
+                   RETURNING user_id, vacation_id""",
+                (user_ids, vacation_ids)
+            )
+            return [(row["user_id"], row["vacation_id"]) for row in cur.fetchall()]
+
+    def delete_pairs(self, pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Delete many (user_id, vacation_id) likes in one statement. Returns the pairs deleted."""
+        if not pairs:
+            return []
+        user_ids, vacation_ids = (list(column) for column in zip(*pairs))
+        with self._cursor() as cur:
+            cur.execute(
+                """DELETE FROM likes l
+                   USING unnest(%s::int[], %s::int[]) AS d(user_id, vacation_id)
+                   WHERE l.user_id = d.user_id AND l.vacation_id = d.vacation_id
+                   RETURNING l.user_id, l.vacation_id""",
+                (user_ids, vacation_ids)
+            )
+            return [(row["user_id"], row["vacation_id"]) for row in cur.fetchall()]
+
     def update_by_id(self, composite_key: tuple[int, int], data: dict) -> int:
         """Update is not applicable for likes table (composite key only)."""
         raise NotImplementedError("Likes table does not support updates")
@@ -66,20 +248,20 @@ class LikeDAO(BaseDAO):
         return self.delete_by_user_and_vacation(user_id, vacation_id)
     
     def count_by_vacation(self, vacation_id: int) -> int:
-        """Count total likes for a specific vacation."""
+        """Count total likes for a specific vacation (reads the likes_count counter)."""
         with self._cursor() as cur:
             cur.execute(
-                "SELECT COUNT(*) FROM likes WHERE vacation_id = %s",
+                "SELECT likes_count FROM vacations WHERE id = %s",
                 (vacation_id,)
             )
             result = cur.fetchone()
-            return result["count"] if result else 0
+            return result["likes_count"] if result else 0
     
     def get_likes_count_by_vacation(self) -> dict[int, int]:
         """Get likes count for all vacations. Returns dict mapping vacation_id to count."""
         with self._cursor() as cur:
             cur.execute(
-                "SELECT vacation_id, COUNT(*) as count FROM likes GROUP BY vacation_id"
+                "SELECT id AS vacation_id, likes_count AS count FROM vacations WHERE likes_count > 0"
             )
             results = cur.fetchall()
             return {row["vacation_id"]: row["count"] for row in results}
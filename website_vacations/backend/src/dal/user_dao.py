@@ -1,21 +1,25 @@
 """Data Access Object for Users table."""
 
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
-from src.dal.base_dao import BaseDAO
+from src.dal.base_dao import STREAM_ITERSIZE, BaseDAO
 
 
 class UserDAO(BaseDAO):
     """DAO for managing users in the database."""
 
+    LIST_ALL_SQL = "SELECT id, first_name, last_name, email, username, role_id FROM users ORDER BY id"
+
     def list_all(self) -> Iterable[dict]:
         """Retrieve all users from the database."""
         with self._cursor() as cur:
-            cur.execute(
-                "SELECT id, first_name, last_name, email, username, role_id FROM users ORDER BY id"
-            )
+            cur.execute(self.LIST_ALL_SQL)
             return cur.fetchall()
 
+    def iter_all(self, itersize: int = STREAM_ITERSIZE) -> Iterator[dict]:
+        """Stream all users, ordered by ID, in constant memory."""
+        return self._stream(self.LIST_ALL_SQL, itersize=itersize)
+
     def get_by_id(self, user_id: int) -> Optional[dict]:
         """Retrieve a user by its ID."""
         with self._cursor() as cur:
@@ -50,6 +54,12 @@ class UserDAO(BaseDAO):
             result = cur.fetchone()
             return result["count"] > 0
 
+    def list_emails(self) -> list[str]:
+        """Retrieve every registered email address."""
+        with self._cursor() as cur:
+            cur.execute("SELECT email FROM users")
+            return [row["email"] for row in cur.fetchall()]
+
     def insert(self, data: dict) -> int:
         """Insert a new user and return its ID."""
         with self._cursor() as cur:
@@ -68,6 +78,33 @@ class UserDAO(BaseDAO):
             result = cur.fetchone()
             return result["id"]
 
+    def _bulk_row(self, data: dict) -> tuple:
+        return (
+            data["first_name"],
+            data["last_name"],
+            data["email"],
+            data["password"],
+            data.get("username"),
+            data["role_id"],
+        )
+
+    def insert_many(self, rows: Iterable[dict]) -> list[int]:
+        """Insert many users with multi-row VALUES in one transaction. Returns their IDs in order."""
+        result = self._insert_many(
+            """INSERT INTO users (first_name, last_name, email, password, username, role_id)
+               VALUES %s RETURNING id""",
+            (self._bulk_row(data) for data in rows),
+        )
+        return [row["id"] for row in result]
+
+    def copy_from_iter(self, rows: Iterable[dict]) -> int:
+        """Stream many users in with COPY. Returns the number of rows loaded."""
+        return self._copy_rows(
+            "users",
+            ("first_name", "last_name", "email", "password", "username", "role_id"),
+            (self._bulk_row(data) for data in rows),
+        )
+
     def update_by_id(self, user_id: int, data: dict) -> int:
         """Update a user by its ID. Returns number of rows affected."""
         with self._cursor() as cur:
@@ -1,28 +1,217 @@
 """Data Access Object for Vacations table."""
 
 from datetime import date
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
-from src.dal.base_dao import BaseDAO
+from src.dal.base_dao import STREAM_ITERSIZE, BaseDAO
 
 
 class VacationDAO(BaseDAO):
     """DAO for managing vacations in the database."""
 
-    def list_all(self) -> Iterable[dict]:
-        """Retrieve all vacations from the database, sorted by start_date ascending."""
+    # Columns follow VacationDTO's field order, so a row maps onto it positionally
+    LIST_ALL_SQL = """SELECT id, country_id, description, start_date, end_date,
+                             price::float8 AS price, image_name
+                      FROM vacations ORDER BY start_date ASC, id ASC"""
+
+    def list_all(self) -> Iterable[tuple]:
+        """Retrieve all vacations as tuples in VacationDTO field order, sorted by start_date ascending."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(self.LIST_ALL_SQL)
+            return cur.fetchall()
+
+    def iter_all(self, itersize: int = STREAM_ITERSIZE) -> Iterator[tuple]:
+        """Stream all vacations as tuples, sorted by start_date ascending, in constant memory."""
+        return self._stream(self.LIST_ALL_SQL, itersize=itersize, tuples=True)
+
+    def _catalog_query(
+        self,
+        user_id: Optional[int],
+        liked_only: bool,
+        status: Optional[str],
+        country_id: Optional[int],
+        min_price: Optional[float],
+        max_price: Optional[float],
+        after: Optional[tuple[date, int]],
+        limit: Optional[int],
+        changed_since: Optional[int] = None,
+    ) -> tuple[str, list]:
+        """Build the catalog SELECT and its parameters.
+
+        Columns follow CatalogVacationDTO's field order; is_liked is NULL
+        when no user is given."""
+        conditions = []
+        values: list = [user_id, user_id]
+
+        if liked_only:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM likes fl WHERE fl.vacation_id = v.id AND fl.user_id = %s)"
+            )
+            values.append(user_id)
+        if status == "ongoing":
+            conditions.append("v.start_date <= CURRENT_DATE AND v.end_date >= CURRENT_DATE")
+        elif status == "upcoming":
+            conditions.append("v.start_date > CURRENT_DATE")
+        if country_id is not None:
+            conditions.append("v.country_id = %s")
+            values.append(country_id)
+        if min_price is not None:
+            conditions.append("v.price >= %s")
+            values.append(min_price)
+        if max_price is not None:
+            conditions.append("v.price <= %s")
+            values.append(max_price)
+        if after is not None:
+            conditions.append("(v.start_date, v.id) > (%s, %s)")
+            values.extend(after)
+        if changed_since is not None:
+            conditions.append("v.change_version >= %s")
+            values.append(changed_since)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT %s"
+            values.append(limit)
+
+        sql = f"""SELECT v.id, v.country_id, c.name AS country_name, v.description,
+                         v.start_date, v.end_date, v.price::float8 AS price, v.image_name,
+                         v.likes_count,
+                         CASE WHEN %s::int IS NULL THEN NULL ELSE EXISTS (
+                             SELECT 1 FROM likes ul
+                             WHERE ul.vacation_id = v.id AND ul.user_id = %s
+                         ) END AS is_liked,
+                         v.image_placeholder
+                  FROM vacations v
+                  JOIN countries c ON c.id = v.country_id
+                  {where}
+                  ORDER BY v.start_date ASC, v.id ASC
+                  {limit_clause}"""
+        return sql, values
+
+    def list_catalog(
+        self,
+        user_id: Optional[int] = None,
+        *,
+        liked_only: bool = False,
+        status: Optional[str] = None,
+        country_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        after: Optional[tuple[date, int]] = None,
+        limit: Optional[int] = None,
+        changed_since: Optional[int] = None,
+    ) -> Iterable[tuple]:
+        """Retrieve vacations with country name, likes count and whether the
+        given user liked each one, in a single query sorted by (start_date, id).
+        Rows are tuples in CatalogVacationDTO field order.
+
+        Filters are applied in SQL. ``after`` is a keyset cursor: only rows
+        strictly after that (start_date, id) pair are returned. ``status`` is
+        'ongoing' (started, not ended) or 'upcoming' (not yet started).
+        ``changed_since`` keeps only rows whose change_version is at least
+        that value."""
+        sql, values = self._catalog_query(
+            user_id, liked_only, status, country_id, min_price, max_price, after, limit,
+            changed_since,
+        )
+        with self._cursor(tuples=True) as cur:
+            cur.execute(sql, values)
+            return cur.fetchall()
+
+    def iter_catalog(
+        self,
+        user_id: Optional[int] = None,
+        *,
+        liked_only: bool = False,
+        status: Optional[str] = None,
+        country_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        itersize: int = STREAM_ITERSIZE,
+    ) -> Iterator[tuple]:
+        """Stream the same rows as ``list_catalog`` from a server-side cursor."""
+        sql, values = self._catalog_query(
+            user_id, liked_only, status, country_id, min_price, max_price, None, None
+        )
+        return self._stream(sql, tuple(values), itersize, tuples=True)
+
+    def list_image_names(self) -> list[str]:
+        """Return every distinct image_name referenced by a vacation."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(
+                "SELECT DISTINCT image_name FROM vacations WHERE image_name IS NOT NULL ORDER BY image_name"
+            )
+            return [row[0] for row in cur.fetchall()]
+
+    def list_referenced_image_names(self, image_names: Iterable[str]) -> list[str]:
+        """Return which of ``image_names`` at least one vacation still uses."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(
+                "SELECT DISTINCT image_name FROM vacations WHERE image_name = ANY(%s)",
+                (list(image_names),)
+            )
+            return [row[0] for row in cur.fetchall()]
+
+    def replace_image_names(self, replacements: dict[str, list[str]]) -> int:
+        """Point vacations using any of the old names at the new one ({new: [old, ...]}).
+        Returns number of rows affected."""
+        updated = 0
+        with self._cursor() as cur:
+            for new_name, old_names in replacements.items():
+                cur.execute(
+                    "UPDATE vacations SET image_name = %s WHERE image_name = ANY(%s)",
+                    (new_name, list(old_names))
+                )
+                updated += cur.rowcount
+        return updated
+
+    def set_image_placeholder(self, image_name: str, placeholder: str) -> int:
+        """Store the placeholder of an image on every vacation using it. Returns number of rows changed."""
         with self._cursor() as cur:
             cur.execute(
-                """SELECT id, country_id, description, start_date, end_date, price, image_name
-                   FROM vacations ORDER BY start_date ASC"""
+                """UPDATE vacations SET image_placeholder = %s
+                   WHERE image_name = %s AND image_placeholder IS DISTINCT FROM %s""",
+                (placeholder, image_name, placeholder)
+            )
+            return cur.rowcount
+
+    def get_likes_counts(self, vacation_ids: Iterable[int]) -> list[tuple[int, int]]:
+        """Return (id, likes_count) for the given vacations that still exist."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(
+                "SELECT id, likes_count FROM vacations WHERE id = ANY(%s) ORDER BY id",
+                (list(vacation_ids),)
             )
             return cur.fetchall()
 
+    def current_change_version(self) -> int:
+        """Return the delta-sync watermark: every transaction below it has finished.
+
+        Rows carry the ID of the transaction that last wrote them. Anything
+        written by a transaction still open now stamps an ID at or above the
+        watermark, so reading ``changed_since=watermark`` later cannot miss
+        it, whatever order the writers commit in."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute("SELECT txid_snapshot_xmin(txid_current_snapshot())")
+            return cur.fetchone()[0]
+
+    def list_deleted_ids_since(self, since: int) -> list[int]:
+        """Return IDs of vacations deleted at or after change version ``since``."""
+        with self._cursor(tuples=True) as cur:
+            cur.execute(
+                """SELECT vacation_id FROM vacation_tombstones
+                   WHERE change_version >= %s ORDER BY vacation_id""",
+                (since,)
+            )
+            return [row[0] for row in cur.fetchall()]
+
     def get_by_id(self, vacation_id: int) -> Optional[dict]:
         """Retrieve a vacation by its ID."""
         with self._cursor() as cur:
             cur.execute(
-                """SELECT id, country_id, description, start_date, end_date, price, image_name
+                """SELECT id, country_id, description, start_date, end_date, price, image_name,
+                          image_placeholder
                    FROM vacations WHERE id = %s""",
                 (vacation_id,)
             )
@@ -46,6 +235,33 @@ class VacationDAO(BaseDAO):
             result = cur.fetchone()
             return result["id"]
 
+    def _bulk_row(self, data: dict) -> tuple:
+        return (
+            data["country_id"],
+            data["description"],
+            data["start_date"],
+            data["end_date"],
+            data["price"],
+            data.get("image_name"),
+        )
+
+    def insert_many(self, rows: Iterable[dict]) -> list[int]:
+        """Insert many vacations with multi-row VALUES in one transaction. Returns their IDs in order."""
+        result = self._insert_many(
+            """INSERT INTO vacations (country_id, description, start_date, end_date, price, image_name)
+               VALUES %s RETURNING id""",
+            (self._bulk_row(data) for data in rows),
+        )
+        return [row["id"] for row in result]
+
+    def copy_from_iter(self, rows: Iterable[dict]) -> int:
+        """Stream many vacations in with COPY. Returns the number of rows loaded."""
+        return self._copy_rows(
+            "vacations",
+            ("country_id", "description", "start_date", "end_date", "price", "image_name"),
+            (self._bulk_row(data) for data in rows),
+        )
+
     def update_by_id(self, vacation_id: int, data: dict) -> int:
         """Update a vacation by its ID. Returns number of rows affected."""
         # Build dynamic UPDATE query based on provided fields
@@ -70,6 +286,12 @@ class VacationDAO(BaseDAO):
         if "image_name" in data:
             updates.append("image_name = %s")
             values.append(data["image_name"])
+            # A placeholder belongs to one image; a new one gets its own once rendered
+            updates.append(
+                "image_placeholder = CASE WHEN image_name IS DISTINCT FROM %s"
+                " THEN NULL ELSE image_placeholder END"
+            )
+            values.append(data["image_name"])
         
         if not updates:
             return 0
@@ -81,9 +303,26 @@ class VacationDAO(BaseDAO):
             cur.execute(query, values)
             return cur.rowcount
 
+    def reconcile_likes_count(self) -> int:
+        """Rebuild likes_count from the likes table. Returns number of vacations corrected."""
+        with self._cursor() as cur:
+            # Block like writes so the rebuilt counts cannot race with the trigger
+            cur.execute("LOCK TABLE likes IN SHARE MODE")
+            cur.execute(
+                """UPDATE vacations v
+                   SET likes_count = COALESCE(l.likes, 0)
+                   FROM vacations v2
+                   LEFT JOIN (
+                       SELECT vacation_id, COUNT(*) AS likes FROM likes GROUP BY vacation_id
+                   ) l ON l.vacation_id = v2.id
+                   WHERE v.id = v2.id AND v.likes_count <> COALESCE(l.likes, 0)"""
+            )
+            return cur.rowcount
+
     def delete_by_id(self, vacation_id: int) -> int:
         """Delete a vacation by its ID. Returns number of rows affected.
-        Note: Likes are automatically deleted due to CASCADE constraint."""
+        Note: Likes are automatically deleted due to CASCADE constraint, and
+        trg_vacations_tombstone records the deletion for delta sync."""
         with self._cursor() as cur:
             cur.execute("DELETE FROM vacations WHERE id = %s", (vacation_id,))
             return cur.rowcount
@@ -11,13 +11,13 @@ class RoleName(str, Enum):
     USER = "User"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoleDTO:
     id: int
     name: RoleName
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserDTO:
     id: int
     first_name: str
@@ -27,13 +27,13 @@ class UserDTO:
     role_id: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CountryDTO:
     id: int
     name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VacationDTO:
     id: int
     country_id: int
@@ -44,9 +44,75 @@ class VacationDTO:
     image_name: Optional[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CatalogVacationDTO:
+    id: int
+    country_id: int
+    country_name: str
+    description: str
+    start_date: date
+    end_date: date
+    price: float
+    image_name: Optional[str]
+    likes_count: int
+    is_liked: Optional[bool]
+    image_placeholder: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class VacationFilters:
+    liked_only: bool = False
+    status: Optional[str] = None
+    country_id: Optional[int] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True)
+class VacationPageDTO:
+    items: list[CatalogVacationDTO]
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogChangesDTO:
+    version: int
+    items: list[CatalogVacationDTO]
+    deleted_ids: list[int]
+
+
+@dataclass(frozen=True, slots=True)
 class LikeDTO:
     user_id: int
     vacation_id: int
 
 
+@dataclass(frozen=True, slots=True)
+class LikeResultDTO:
+    user_id: int
+    vacation_id: int
+    liked: bool
+    changed: bool
+    likes_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class LikeBatchItemDTO:
+    vacation_id: int
+    liked: bool
+    status: str
+    likes_count: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportReportDTO:
+    kind: str
+    rows_read: int
+    imported: int
+    rejected: int
+    batches: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed if self.elapsed > 0 else 0.0
@@ -0,0 +1,171 @@
+"""In-process cache for built vacation catalog results."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable, Optional
+
+from src.config import CacheConfig
+from src.models.dtos import CatalogVacationDTO
+
+
+@dataclass
+class CachedPayload:
+    """A catalog result serialized for HTTP: JSON body and its compressed forms."""
+
+    body: bytes
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+
+@dataclass
+class CatalogEntry:
+    """One cached catalog result, plus its serialized payload once a route built it."""
+
+    items: list[CatalogVacationDTO]
+    next_cursor: Optional[str]
+    user_id: Optional[int]
+    liked_only: bool
+    expires_at: float = 0.0
+    payload: Optional[CachedPayload] = None
+    positions: dict[int, int] = field(default_factory=dict)
+    # LikeBuffer.watermark() once the items were read
+    like_mark: int = 0
+
+    def __post_init__(self) -> None:
+        self.positions = {item.id: index for index, item in enumerate(self.items)}
+
+
+class CatalogCache:
+    """Thread-safe LRU of catalog results with a TTL and hit/miss counters.
+
+    Writes keep it exact: vacation changes drop every entry, and like changes
+    drop the entries showing the affected vacation. ``version`` increases
+    with every change, so a result computed before a write is never stored
+    after it, and ``validator`` turns it into an HTTP validator.
+    """
+
+    def __init__(self, config: CacheConfig) -> None:
+        self._config = config
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, CatalogEntry]" = OrderedDict()
+        self._version = 0
+        # Versions restart with the process; validators from before a restart must not match
+        self._epoch = os.urandom(4).hex()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled and self._config.max_entries > 0
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def validator(self) -> tuple:
+        """
+        Return what a response built from the cache now is current for: it
+        changes with every write in this process, and at least every ``ttl``
+        seconds so writes made elsewhere show up as they would through the cache.
+        """
+        window = int(time.time() // self._config.ttl) if self._config.ttl > 0 else 0
+        with self._lock:
+            return self._epoch, self._version, window
+
+    def get(self, key: Hashable) -> Optional[CatalogEntry]:
+        """Return a live entry for ``key`` or None, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: CatalogEntry, version: int) -> bool:
+        """Store ``entry`` unless the data changed since ``version`` was read."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            if version != self._version:
+                return False
+            entry.expires_at = time.monotonic() + self._config.ttl
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._config.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def attach_payload(self, entry: CatalogEntry, items: list, payload: CachedPayload) -> None:
+        """Remember the serialized form of ``items`` if the entry still holds them."""
+        with self._lock:
+            if entry.items is items:
+                entry.payload = payload
+
+    def invalidate_all(self) -> None:
+        """Drop every entry, e.g. after a vacation was added, changed or deleted."""
+        with self._lock:
+            self._version += 1
+            self._invalidations += 1
+            self._entries.clear()
+
+    def invalidate_like_change(self, user_id: int, vacation_id: int) -> None:
+        """Drop the results a like or unlike by ``user_id`` of ``vacation_id`` made stale.
+
+        That is every result showing the vacation (its count changed) and
+        the acting user's liked-only results (their rows changed). They are
+        rebuilt from the database rather than patched: a result read after
+        the like committed but stored before this runs already counts it.
+        """
+        with self._lock:
+            self._version += 1
+            self._invalidations += 1
+            for key in list(self._entries):
+                entry = self._entries[key]
+                if vacation_id in entry.positions or (entry.liked_only and entry.user_id == user_id):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry without counting it as an invalidation."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return cache counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "maxEntries": self._config.max_entries,
+                "ttl": self._config.ttl,
+                "version": self._version,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+_catalog_cache: Optional[CatalogCache] = None
+_catalog_cache_lock = threading.Lock()
+
+
+def get_catalog_cache() -> CatalogCache:
+    """Return the process-wide catalog cache."""
+    global _catalog_cache
+    with _catalog_cache_lock:
+        if _catalog_cache is None:
+            _catalog_cache = CatalogCache(CacheConfig.from_env())
+        return _catalog_cache
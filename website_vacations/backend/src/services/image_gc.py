@@ -0,0 +1,198 @@
+"""Garbage collection of image files no vacation references any more."""
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from src.config import ImageConfig
+from src.dal.vacation_dao import VacationDAO
+from src.services.image_pipeline import VARIANTS_DIR, get_image_pipeline, is_plain_name, remove_variants
+from src.services.image_store import TEMP_PREFIX
+
+# Files this fresh may belong to an upload whose vacation is not committed yet
+RECENT_UPLOAD_SECONDS = 300.0
+
+
+@dataclass
+class GcReport:
+    """Outcome of one sweep of the images directory."""
+    dry_run: bool
+    scanned: int = 0
+    recent: int = 0
+    orphans: list[str] = field(default_factory=list)
+    freed_bytes: int = 0
+
+
+class ImageGarbageCollector:
+    """Deletes originals, their variants and abandoned uploads nobody uses.
+
+    ``collect`` sweeps the whole directory and only touches files older than
+    the grace period. A re-upload of an existing object refreshes its mtime,
+    and every candidate is stat'ed again right before it is unlinked, so an
+    upload that lands during the sweep keeps its file; only one arriving in
+    the instant between that stat and the unlink could lose it. ``schedule`` is
+    called after a vacation's image was replaced or deleted; it re-checks
+    the references and removes the old file on a background thread right
+    away. Images are content-addressed and shared, so a file goes only when
+    no vacation refers to it.
+    """
+
+    def __init__(
+        self,
+        config: ImageConfig,
+        vacation_dao: Optional[VacationDAO] = None,
+        on_removed: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self._config = config
+        self._vacation_dao = vacation_dao or VacationDAO()
+        self._listeners: list[Callable[[str], None]] = [on_removed] if on_removed else []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduled = 0
+        self._removed = 0
+        self._errors = 0
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        """Call ``callback`` with the name of every image removed from now on."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def collect(self, dry_run: bool = False, grace_period: Optional[float] = None) -> GcReport:
+        """Remove unreferenced files older than the grace period (or only report them)."""
+        grace = self._config.gc_grace_period if grace_period is None else grace_period
+        cutoff = time.time() - grace
+        report = GcReport(dry_run=dry_run)
+        directory = self._config.directory
+        if not os.path.isdir(directory):
+            return report
+
+        # Listed before the references are read: anything referenced by then is kept
+        candidates: dict[str, int] = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.startswith(".") and not entry.name.startswith(TEMP_PREFIX):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                report.scanned += 1
+                if st.st_mtime > cutoff:
+                    report.recent += 1
+                else:
+                    candidates[entry.name] = st.st_size
+        variants = os.path.join(directory, VARIANTS_DIR)
+        if os.path.isdir(variants):
+            with os.scandir(variants) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir(follow_symlinks=False)
+                        and entry.name not in candidates
+                        and not os.path.exists(os.path.join(directory, entry.name))
+                        and entry.stat(follow_symlinks=False).st_mtime <= cutoff
+                    ):
+                        candidates[entry.name] = 0
+
+        referenced = set(self._vacation_dao.list_image_names())
+        for name in sorted(candidates):
+            if name in referenced:
+                continue
+            if not self._older_than(name, grace):
+                # Touched since it was listed: a re-upload of the same bytes
+                report.recent += 1
+                continue
+            report.orphans.append(name)
+            report.freed_bytes += candidates[name]
+            if not dry_run:
+                self._remove(name)
+        return report
+
+    def release(self, image_names: Iterable[str]) -> list[str]:
+        """Remove those of ``image_names`` no vacation uses any more. Returns what was removed."""
+        names = {name for name in image_names if name and is_plain_name(name)}
+        if not names:
+            return []
+        unused = names - set(self._vacation_dao.list_referenced_image_names(sorted(names)))
+        removed = []
+        for name in sorted(unused):
+            if not self._older_than(name, RECENT_UPLOAD_SECONDS):
+                # Left to the next sweep
+                continue
+            self._remove(name)
+            removed.append(name)
+        return removed
+
+    def schedule(self, image_names: Iterable[str]) -> Future:
+        """Run ``release`` on the collector's background thread."""
+        names = list(image_names)
+        with self._lock:
+            self._scheduled += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-gc")
+                atexit.register(self.shutdown)
+            executor = self._executor
+        future = executor.submit(self.release, names)
+        future.add_done_callback(self._finished)
+        return future
+
+    def shutdown(self) -> None:
+        """Finish scheduled removals and stop the background thread."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """Return removal counters."""
+        with self._lock:
+            return {
+                "gracePeriod": self._config.gc_grace_period,
+                "scheduled": self._scheduled,
+                "removed": self._removed,
+                "errors": self._errors,
+            }
+
+    def _older_than(self, image_name: str, seconds: float) -> bool:
+        """Stat ``image_name`` again now; True if it (or, without it, its variants) is older."""
+        path = os.path.join(self._config.directory, image_name)
+        if not os.path.exists(path):
+            path = os.path.join(self._config.directory, VARIANTS_DIR, image_name)
+        try:
+            return os.stat(path).st_mtime <= time.time() - seconds
+        except FileNotFoundError:
+            return True
+
+    def _remove(self, image_name: str) -> None:
+        try:
+            os.unlink(os.path.join(self._config.directory, image_name))
+        except FileNotFoundError:
+            pass
+        remove_variants(self._config.directory, image_name)
+        with self._lock:
+            self._removed += 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(image_name)
+
+    def _finished(self, future: Future) -> None:
+        if future.exception() is not None:
+            with self._lock:
+                self._errors += 1
+
+
+_image_gc: Optional[ImageGarbageCollector] = None
+_image_gc_lock = threading.Lock()
+
+
+def get_image_gc() -> ImageGarbageCollector:
+    """Return the process-wide image garbage collector."""
+    global _image_gc
+    with _image_gc_lock:
+        if _image_gc is None:
+            _image_gc = ImageGarbageCollector(
+                ImageConfig.from_env(), on_removed=get_image_pipeline().forget
+            )
+        return _image_gc
@@ -0,0 +1,314 @@
+"""Resized WebP/AVIF variants of vacation images, rendered in a process pool."""
+
+import atexit
+import base64
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from src.config import ImageConfig
+from src.dal.vacation_dao import VacationDAO
+from src.services.catalog_cache import get_catalog_cache
+
+IMAGE_URL_PREFIX = "/images/"
+VARIANTS_DIR = "variants"
+MANIFEST_NAME = "manifest.json"
+# Target widths; an image is never scaled up, so small originals share files
+VARIANT_WIDTHS = {"card": 480, "detail": 1280, "retina": 2560}
+# Encoder settings per format, best compression first
+FORMAT_OPTIONS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+}
+# Longest side of the inline placeholder, tried in turn until it fits the budget
+PLACEHOLDER_SIZES = (16, 12, 8)
+PLACEHOLDER_MAX_LENGTH = 1024
+# How long "no variants yet" is trusted before the manifest is looked up again
+MISSING_TTL = 30.0
+
+
+def is_plain_name(image_name: str) -> bool:
+    """True for a bare file name that cannot point outside the images directory."""
+    return bool(image_name) and os.path.basename(image_name) == image_name and not image_name.startswith(".")
+
+
+def variant_dir(images_dir: str, image_name: str) -> str:
+    """Directory holding the variants and manifest of one original."""
+    return os.path.join(images_dir, VARIANTS_DIR, image_name)
+
+
+def read_manifest(images_dir: str, image_name: str) -> Optional[dict]:
+    """Return the variant manifest of ``image_name``, or None until it is complete."""
+    try:
+        with open(os.path.join(variant_dir(images_dir, image_name), MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def remove_variants(images_dir: str, image_name: str) -> bool:
+    """Delete every variant of ``image_name``. Returns whether there were any."""
+    if not is_plain_name(image_name):
+        return False
+    path = variant_dir(images_dir, image_name)
+    if not os.path.isdir(path):
+        return False
+    shutil.rmtree(path, ignore_errors=True)
+    return True
+
+
+def render_placeholder(image) -> Optional[str]:
+    """
+    Return a ``data:`` URI of a thumbnail of a Pillow image, at most
+    PLACEHOLDER_MAX_LENGTH characters, or None if none fits.
+
+    Clients stretch it over the image's box (which blurs it) and paint it
+    before the image itself arrives.
+    """
+    from PIL import Image, features
+
+    fmt, mimetype, options = (
+        ("WEBP", "image/webp", {"quality": 40, "method": 6})
+        if features.check("webp") else ("JPEG", "image/jpeg", {"quality": 40, "optimize": True})
+    )
+    for size in PLACEHOLDER_SIZES:
+        thumb = image.convert("RGB")
+        thumb.thumbnail((size, size), Image.LANCZOS)
+        buffer = io.BytesIO()
+        thumb.save(buffer, format=fmt, **options)
+        uri = f"data:{mimetype};base64,{base64.b64encode(buffer.getvalue()).decode('ascii')}"
+        if len(uri) <= PLACEHOLDER_MAX_LENGTH:
+            return uri
+    return None
+
+
+def render_variants(images_dir: str, image_name: str) -> dict:
+    """
+    Write every size and format of one original and return its manifest.
+
+    Runs in a worker process. Files are written under temporary names and
+    renamed into place, and the manifest is renamed last, so a manifest on
+    disk always describes complete files. An up-to-date manifest is
+    returned without rendering anything.
+    """
+    from PIL import Image, ImageOps, features
+
+    source = os.path.join(images_dir, image_name)
+    out_dir = variant_dir(images_dir, image_name)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    if os.path.exists(manifest_path) and os.path.getmtime(manifest_path) >= os.path.getmtime(source):
+        existing = read_manifest(images_dir, image_name)
+        # Manifests from before placeholders existed are rendered again
+        if existing is not None and "placeholder" in existing:
+            return existing
+
+    os.makedirs(out_dir, exist_ok=True)
+    formats = [fmt for fmt in FORMAT_OPTIONS if features.check(fmt)]
+    sizes: dict[str, dict] = {}
+    rendered: dict[int, dict] = {}
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        for size, target in VARIANT_WIDTHS.items():
+            width = min(target, image.width)
+            if width not in rendered:
+                height = max(round(image.height * width / image.width), 1)
+                resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                entry = {"width": width, "height": height}
+                for fmt in formats:
+                    name = f"{size}.{fmt}"
+                    tmp = os.path.join(out_dir, f".{name}.tmp")
+                    resized.save(tmp, format=fmt.upper(), **FORMAT_OPTIONS[fmt])
+                    os.replace(tmp, os.path.join(out_dir, name))
+                    entry[fmt] = name
+                rendered[width] = entry
+            sizes[size] = rendered[width]
+        placeholder = render_placeholder(image)
+
+    manifest = {"source": image_name, "sizes": sizes, "placeholder": placeholder}
+    tmp = os.path.join(out_dir, f".{MANIFEST_NAME}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, manifest_path)
+    return manifest
+
+
+class ImagePipeline:
+    """Generates image variants off the request thread and maps them to URLs.
+
+    ``submit`` queues an original for a pool of worker processes; image
+    decoding and encoding are CPU-bound and would otherwise hold the GIL
+    that request threads share. Until an original's variants are ready,
+    ``urls`` returns the original alone and clients show that.
+    ``on_ready`` is called with the image name when its variants land.
+    """
+
+    def __init__(
+        self,
+        config: ImageConfig,
+        on_ready: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self._config = config
+        self._on_ready = on_ready
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Ready manifests, and when originals without one were last looked up
+        self._manifests: dict[str, dict] = {}
+        self._missing: dict[str, float] = {}
+        self._pending: set[str] = set()
+        self._submitted = 0
+        self._completed = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.variants_enabled
+
+    @property
+    def images_dir(self) -> str:
+        return self._config.directory
+
+    def submit(self, image_name: Optional[str]) -> Optional[Future]:
+        """Queue variant generation for an original. Returns None when there is nothing to do."""
+        if not self.enabled or not image_name or not is_plain_name(image_name):
+            return None
+        if not os.path.isfile(os.path.join(self._config.directory, image_name)):
+            return None
+        with self._lock:
+            if image_name in self._pending:
+                return None
+            self._pending.add(image_name)
+            self._submitted += 1
+            executor = self._ensure_executor()
+        future = executor.submit(render_variants, self._config.directory, image_name)
+        future.add_done_callback(lambda f, name=image_name: self._finished(name, f))
+        return future
+
+    def generate(self, image_names: Iterable[str]) -> tuple[int, int]:
+        """Render variants for many originals and wait. Returns (rendered, failed)."""
+        futures = [f for f in (self.submit(name) for name in image_names) if f is not None]
+        failed = sum(1 for f in futures if f.exception() is not None)
+        return len(futures) - failed, failed
+
+    def manifest(self, image_name: str) -> Optional[dict]:
+        """Return the ready manifest of ``image_name``, or None."""
+        with self._lock:
+            manifest = self._manifests.get(image_name)
+            if manifest is not None:
+                return manifest
+            checked = self._missing.get(image_name)
+            if checked is not None and time.monotonic() - checked < MISSING_TTL:
+                return None
+        manifest = read_manifest(self._config.directory, image_name) if is_plain_name(image_name) else None
+        with self._lock:
+            if manifest is not None:
+                self._manifests[image_name] = manifest
+                self._missing.pop(image_name, None)
+            else:
+                self._missing[image_name] = time.monotonic()
+        return manifest
+
+    def urls(self, image_name: str) -> dict:
+        """
+        Return {"original": url} plus, once ready, one entry per size:
+        {"width", "height", and a URL per format}.
+        """
+        urls: dict = {"original": IMAGE_URL_PREFIX + image_name}
+        manifest = self.manifest(image_name) if self.enabled else None
+        if manifest is not None:
+            base = f"{IMAGE_URL_PREFIX}{VARIANTS_DIR}/{image_name}/"
+            for size, entry in manifest["sizes"].items():
+                urls[size] = {
+                    key: base + value if key in FORMAT_OPTIONS else value
+                    for key, value in entry.items()
+                }
+        return urls
+
+    def forget(self, image_name: str) -> None:
+        """Drop what is known about ``image_name`` (e.g. after its files were removed)."""
+        with self._lock:
+            self._manifests.pop(image_name, None)
+            self._missing.pop(image_name, None)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, abandoning queued work."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """Return queue and completion counters."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "workers": self._config.variant_workers,
+                "pending": len(self._pending),
+                "ready": len(self._manifests),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "errors": self._errors,
+            }
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        # Called with the lock held
+        if self._executor is None:
+            # Spawned, not forked: workers must not inherit the server's
+            # threads, locks or database connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=max(self._config.variant_workers, 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(self.shutdown)
+        return self._executor
+
+    def _finished(self, image_name: str, future: Future) -> None:
+        manifest = None
+        if not future.cancelled() and future.exception() is None:
+            manifest = future.result()
+        with self._lock:
+            self._pending.discard(image_name)
+            if manifest is None:
+                self._errors += 1
+                return
+            self._completed += 1
+            self._manifests[image_name] = manifest
+            self._missing.pop(image_name, None)
+        if self._on_ready is not None:
+            self._on_ready(image_name)
+
+
+_image_pipeline: Optional[ImagePipeline] = None
+_image_pipeline_lock = threading.Lock()
+
+
+def get_image_pipeline() -> ImagePipeline:
+    """Return the process-wide image pipeline.
+
+    When an image's variants are ready its placeholder is stored on every
+    vacation using it, and cached catalog results (which embed variant URLs
+    and placeholders) are dropped.
+    """
+    global _image_pipeline
+    with _image_pipeline_lock:
+        if _image_pipeline is None:
+            cache = get_catalog_cache()
+            vacation_dao = VacationDAO()
+
+            def on_ready(image_name: str) -> None:
+                try:
+                    placeholder = _image_pipeline.manifest(image_name).get("placeholder")
+                    if placeholder:
+                        vacation_dao.set_image_placeholder(image_name, placeholder)
+                finally:
+                    cache.invalidate_all()
+
+            _image_pipeline = ImagePipeline(ImageConfig.from_env(), on_ready=on_ready)
+        return _image_pipeline
@@ -0,0 +1,216 @@
+"""Content-addressed storage for vacation images."""
+
+import atexit
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Optional
+
+from src.config import ImageConfig
+from src.services.image_pipeline import get_image_pipeline
+
+CHUNK_SIZE = 64 * 1024
+# "<sha256 hex>.<ext>"; such a name can only ever hold one sequence of bytes
+CONTENT_NAME = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]{1,8})?$")
+TEMP_PREFIX = ".upload-"
+# Enough leading bytes to recognise every accepted format
+SNIFF_BYTES = 12
+
+logger = logging.getLogger(__name__)
+
+
+def sniff_image(head: bytes) -> Optional[str]:
+    """Return the extension of the image format ``head`` starts with, or None."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    if head[4:12] in (b"ftypavif", b"ftypavis"):
+        return ".avif"
+    return None
+
+
+def is_content_name(image_name: str) -> bool:
+    """True for a name produced by ``ImageStore`` (its bytes never change)."""
+    return bool(CONTENT_NAME.match(image_name or ""))
+
+
+def content_name(digest: str, filename: Optional[str]) -> str:
+    """Build the stored name of a file with sha256 ``digest``, keeping its extension."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if not re.fullmatch(r"\.[a-z0-9]{1,8}", ext):
+        ext = ""
+    return digest + ext
+
+
+def hash_file(path: str) -> str:
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageStore:
+    """Stores images under the sha256 of their bytes.
+
+    Identical uploads resolve to the same name and are kept once, whatever
+    they were called on the client. Bytes are hashed as they are copied to a
+    temporary file next to the final location, which is then renamed into
+    place, so a stored name never points at a partly written file.
+    """
+
+    def __init__(self, directory: str, on_stored: Optional[Callable[[str], None]] = None) -> None:
+        self.directory = directory
+        self._on_stored = on_stored
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._stored = 0
+        self._errors = 0
+
+    def path(self, image_name: str) -> str:
+        return os.path.join(self.directory, image_name)
+
+    def temp_file(self) -> tuple[int, str]:
+        """Open a temporary file that ``place`` can later rename (same filesystem)."""
+        os.makedirs(self.directory, exist_ok=True)
+        return tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+
+    def save(self, stream: BinaryIO, filename: Optional[str] = None) -> str:
+        """Copy ``stream`` into the store and return its content name."""
+        digest = hashlib.sha256()
+        fd, tmp = self.temp_file()
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    out.write(chunk)
+            return self.place(tmp, content_name(digest.hexdigest(), filename))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def place(self, tmp: str, image_name: str) -> str:
+        """Move a fully written file to ``image_name``, or drop it if that object exists."""
+        target = self.path(image_name)
+        if os.path.exists(target):
+            os.unlink(tmp)
+            # A fresh mtime keeps the garbage collector's grace period from
+            # deleting an old orphan that is about to be referenced again
+            os.utime(target)
+        else:
+            os.chmod(tmp, 0o644)
+            # Concurrent identical uploads both rename over the same bytes
+            os.replace(tmp, target)
+        return image_name
+
+    def persist(self, image_name: str) -> str:
+        """Flush a placed image to disk and pass its name to ``on_stored`` (e.g. variant rendering)."""
+        try:
+            with open(self.path(image_name), "rb") as f:
+                os.fsync(f.fileno())
+            if self._on_stored is not None:
+                self._on_stored(image_name)
+        except Exception:
+            # The file is in place either way; its variants are rendered on the next upload of it
+            logger.exception("Finishing stored image %s failed", image_name)
+            raise
+        return image_name
+
+    def persist_async(self, image_name: str) -> Future:
+        """Run ``persist`` on the store's background thread."""
+        with self._lock:
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-store")
+                atexit.register(self.shutdown)
+            executor = self._executor
+        future = executor.submit(self.persist, image_name)
+        future.add_done_callback(self._finished)
+        return future
+
+    def shutdown(self) -> None:
+        """Finish queued placements and stop the background thread."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """Return background placement counters."""
+        with self._lock:
+            return {"pending": self._pending, "stored": self._stored, "errors": self._errors}
+
+    def plan_migration(self) -> dict[str, list[str]]:
+        """
+        Group files not yet stored by content: {content name: [current names]}.
+
+        Byte-identical copies land in the same group. Hidden files and
+        subdirectories (such as generated variants) are ignored.
+        """
+        plan: dict[str, list[str]] = {}
+        if not os.path.isdir(self.directory):
+            return plan
+        for name in sorted(os.listdir(self.directory)):
+            path = self.path(name)
+            if name.startswith(".") or is_content_name(name) or not os.path.isfile(path):
+                continue
+            plan.setdefault(content_name(hash_file(path), name), []).append(name)
+        return plan
+
+    def adopt(self, image_name: str, source: str) -> None:
+        """Make ``image_name`` hold the bytes of the existing file ``source``, keeping ``source``."""
+        if os.path.exists(self.path(image_name)):
+            return
+        fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+        os.close(fd)
+        try:
+            shutil.copyfile(self.path(source), tmp)
+            self.place(tmp, image_name)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def remove(self, image_name: str) -> bool:
+        """Delete a stored file. Returns whether it existed."""
+        try:
+            os.unlink(self.path(image_name))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future.exception() is None:
+                self._stored += 1
+            else:
+                self._errors += 1
+
+
+_image_store: Optional[ImageStore] = None
+_image_store_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore:
+    """Return the process-wide image store; stored images get their variants rendered."""
+    global _image_store
+    with _image_store_lock:
+        if _image_store is None:
+            _image_store = ImageStore(
+                ImageConfig.from_env().directory, on_stored=get_image_pipeline().submit
+            )
+        return _image_store
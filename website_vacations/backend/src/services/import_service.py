@@ -0,0 +1,272 @@
+"""Business Logic Layer for bulk catalog imports."""
+
+import csv
+import json
+import time
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator, Optional, TextIO
+
+import psycopg2
+
+from src.dal.country_dao import CountryDAO
+from src.dal.role_dao import RoleDAO
+from src.dal.user_dao import UserDAO
+from src.dal.vacation_dao import VacationDAO
+from src.models.dtos import ImportReportDTO, RoleName
+from src.services.catalog_cache import get_catalog_cache
+from src.services.user_service import validate_registration
+from src.services.vacation_service import validate_new_vacation
+
+IMPORT_KINDS = ("vacations", "countries", "users")
+DEFAULT_BATCH_SIZE = 1000
+
+
+def read_records(path: Path) -> Iterator[tuple[int, object]]:
+    """
+    Stream (line number, record) pairs from a CSV or JSONL file.
+
+    A JSONL line that is not valid JSON is yielded as an error message
+    instead of a dict, so it can be rejected like any other bad row.
+    """
+    suffix = path.suffix.lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+        elif suffix in (".jsonl", ".ndjson"):
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, f"Invalid JSON: {e.msg}"
+                    continue
+                if not isinstance(record, dict):
+                    yield line_number, "Each line must be a JSON object"
+                    continue
+                yield line_number, record
+        else:
+            raise ValueError("Import file must be .csv, .jsonl or .ndjson")
+
+
+def _field(record: dict, name: str) -> Optional[object]:
+    """Read a snake_case field, also accepting the API's camelCase spelling."""
+    value = record.get(name)
+    if value is None:
+        head, *rest = name.split("_")
+        value = record.get(head + "".join(part.title() for part in rest))
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+    return value
+
+
+def _text(record: dict, name: str) -> Optional[str]:
+    value = _field(record, name)
+    return None if value is None else str(value)
+
+
+def _parse_date(value: object, label: str) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"{label} must be a date in YYYY-MM-DD format")
+
+
+class ImportService:
+    """Service for validating and bulk-loading vacations, countries and users."""
+
+    def __init__(self) -> None:
+        """Initialize ImportService with required DAOs."""
+        self._vacation_dao = VacationDAO()
+        self._country_dao = CountryDAO()
+        self._user_dao = UserDAO()
+        self._role_dao = RoleDAO()
+
+    def import_file(
+        self,
+        kind: str,
+        path: Path,
+        reject_file: Optional[TextIO] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ImportReportDTO:
+        """
+        Import a CSV or JSONL file of vacations, countries or users.
+
+        Rows are validated in memory with the same rules as the services,
+        against lookup tables loaded once up front, and each batch of valid
+        rows is loaded with COPY in its own transaction.
+
+        Args:
+            kind: One of "vacations", "countries" or "users"
+            path: The .csv, .jsonl or .ndjson file to import
+            reject_file: Optional text stream receiving one JSON line per
+                rejected row: its line number, error and original record
+            batch_size: Rows validated and loaded per transaction
+
+        Returns:
+            ImportReportDTO: Row counts and elapsed time
+
+        Raises:
+            ValueError: If the kind, file type or batch size is invalid
+        """
+        if kind not in IMPORT_KINDS:
+            raise ValueError(f"Import kind must be one of: {', '.join(IMPORT_KINDS)}")
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        prepare, load, commit_keys = getattr(self, f"_{kind}_importer")()
+        started = time.monotonic()
+        rows_read = imported = rejected = batches = 0
+
+        records = read_records(Path(path))
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            rows_read += len(batch)
+            batches += 1
+
+            valid: list[dict] = []
+            accepted: list[tuple[int, dict]] = []
+            keys: set = set()
+            for line_number, record in batch:
+                try:
+                    if not isinstance(record, dict):
+                        raise ValueError(record)
+                    data, key = prepare(record, keys)
+                except ValueError as e:
+                    rejected += 1
+                    self._reject(reject_file, line_number, str(e), record)
+                    continue
+                valid.append(data)
+                accepted.append((line_number, record))
+                if key is not None:
+                    keys.add(key)
+
+            if not valid:
+                continue
+            try:
+                imported += load(valid)
+            except psycopg2.Error as e:
+                # The batch rolled back as a whole; report every row in it
+                message = f"Database rejected batch: {str(e).strip()}"
+                rejected += len(accepted)
+                for line_number, record in accepted:
+                    self._reject(reject_file, line_number, message, record)
+                continue
+            commit_keys(keys)
+
+        if kind == "vacations" and imported:
+            get_catalog_cache().invalidate_all()
+        return ImportReportDTO(
+            kind=kind,
+            rows_read=rows_read,
+            imported=imported,
+            rejected=rejected,
+            batches=batches,
+            elapsed=time.monotonic() - started,
+        )
+
+    @staticmethod
+    def _reject(reject_file: Optional[TextIO], line_number: int, error: str, record: object) -> None:
+        if reject_file is None:
+            return
+        entry = {"line": line_number, "error": error}
+        if isinstance(record, dict):
+            entry["record"] = record
+        reject_file.write(json.dumps(entry, default=str) + "\n")
+
+    def _vacations_importer(self) -> tuple[Callable, Callable, Callable]:
+        countries = {name.lower(): country_id for country_id, name in self._country_dao.list_all()}
+        country_ids = set(countries.values())
+
+        def prepare(record: dict, _keys: set) -> tuple[dict, None]:
+            country_id = _field(record, "country_id")
+            if country_id is not None:
+                try:
+                    country_id = int(country_id)
+                except (TypeError, ValueError):
+                    raise ValueError("Country ID must be an integer")
+                if country_id not in country_ids:
+                    raise ValueError(f"Country with ID {country_id} does not exist")
+            else:
+                name = _field(record, "country")
+                if name is None:
+                    raise ValueError("Country is mandatory")
+                country_id = countries.get(str(name).lower())
+                if country_id is None:
+                    raise ValueError(f"Country '{name}' does not exist")
+
+            price = _field(record, "price")
+            if price is not None:
+                try:
+                    price = float(price)
+                except (TypeError, ValueError):
+                    raise ValueError("Price must be a number")
+            description = _text(record, "description")
+            start_date = _parse_date(_field(record, "start_date"), "Start date")
+            end_date = _parse_date(_field(record, "end_date"), "End date")
+            validate_new_vacation(description, start_date, end_date, price)
+
+            image_name = _text(record, "image_name")
+            return {
+                "country_id": country_id,
+                "description": description,
+                "start_date": start_date,
+                "end_date": end_date,
+                "price": price,
+                "image_name": image_name,
+            }, None
+
+        return prepare, self._vacation_dao.copy_from_iter, lambda keys: None
+
+    def _countries_importer(self) -> tuple[Callable, Callable, Callable]:
+        existing = {name.lower() for _, name in self._country_dao.list_all()}
+
+        def prepare(record: dict, batch_keys: set) -> tuple[dict, str]:
+            name = _text(record, "name")
+            if name is None:
+                raise ValueError("Country name is mandatory")
+            key = name.lower()
+            if key in existing or key in batch_keys:
+                raise ValueError(f"Country '{name}' already exists")
+            return {"name": name}, key
+
+        return prepare, self._country_dao.copy_from_iter, existing.update
+
+    def _users_importer(self) -> tuple[Callable, Callable, Callable]:
+        existing = {email.lower() for email in self._user_dao.list_emails()}
+        user_role = self._role_dao.get_by_name(RoleName.USER.value)
+        if not user_role:
+            raise ValueError("User role not found in database")
+
+        def prepare(record: dict, batch_keys: set) -> tuple[dict, str]:
+            first_name = _text(record, "first_name")
+            last_name = _text(record, "last_name")
+            email = _text(record, "email")
+            password = record.get("password")
+            password = None if password is None else str(password)
+            username = _text(record, "username")
+            validate_registration(first_name, last_name, email, password)
+            email = email.lower()
+            if email in existing or email in batch_keys:
+                raise ValueError("Email already exists in the system")
+            # Only regular users can be imported, like registration
+            return {
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "password": password,
+                "username": username,
+                "role_id": user_role["id"],
+            }, email
+
+        return prepare, self._user_dao.copy_from_iter, existing.update
@@ -0,0 +1,321 @@
+"""Optional write-behind buffer that absorbs like/unlike storms."""
+
+import atexit
+import contextvars
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from src.config import LikeBufferConfig
+from src.dal.like_dao import LikeDAO
+from src.dal.unit_of_work import unit_of_work
+from src.models.dtos import CatalogVacationDTO
+from src.services.catalog_cache import get_catalog_cache
+
+
+@dataclass
+class PendingLike:
+    """A like state waiting to be written: ``base`` is what the database holds."""
+
+    base: bool
+    desired: bool
+
+
+class LikeBuffer:
+    """Coalesces like changes per (user, vacation) and writes them in batches.
+
+    Only the last state per key is kept, and a toggle back to the stored state
+    cancels the pending write. Buffered changes are flushed as two set-based
+    statements once ``max_pending`` keys are waiting or every
+    ``flush_interval`` seconds, and once more at shutdown. Until then readers
+    see them through ``effective_state``, ``pending_delta`` and ``overlay``.
+
+    Counts read while a batch commits may or may not include it. Readers
+    take a ``watermark`` right after reading counts and pass it back as
+    ``since``: the committing batch is added only to counts read before its
+    commit began, so no change is counted twice (a read that overlaps the
+    commit may briefly miss it). A flush that fails puts its changes back so the
+    next one retries them. Pairs whose user or vacation was deleted in the
+    meantime are dropped.
+    """
+
+    def __init__(self, config: LikeBufferConfig, like_dao: Optional[LikeDAO] = None) -> None:
+        self._config = config
+        self._like_dao = like_dao or LikeDAO()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Serializes flushes so batches reach the database in order
+        self._flush_lock = threading.Lock()
+        self._pending: dict[tuple[int, int], PendingLike] = {}
+        # Changes taken by the running flush, still visible to readers
+        self._in_flight: dict[tuple[int, int], PendingLike] = {}
+        self._deltas: dict[int, int] = {}
+        self._in_flight_deltas: dict[int, int] = {}
+        # Batches whose commit has begun, and the number of the running one
+        self._commits = 0
+        self._commit_seq: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._recorded = 0
+        self._cancelled = 0
+        self._flushes = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._errors = 0
+        self._total_flush_time = 0.0
+        self._last_flush_time = 0.0
+        self._max_flush_time = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    def record(self, user_id: int, vacation_id: int, stored: bool, liked: bool) -> bool:
+        """Buffer ``liked`` for the pair; ``stored`` is the state read from the database.
+
+        Returns whether the effective state changed.
+        """
+        key = (user_id, vacation_id)
+        with self._lock:
+            entry = self._pending.get(key)
+            in_flight = self._in_flight.get(key)
+            if entry is not None:
+                current = entry.desired
+            elif in_flight is not None:
+                current = in_flight.desired
+            else:
+                current = stored
+            if current == liked:
+                return False
+
+            self._recorded += 1
+            self._add_delta(self._deltas, vacation_id, 1 if liked else -1)
+            if entry is None:
+                self._pending[key] = PendingLike(base=current, desired=liked)
+            elif entry.base == liked:
+                # Toggled back: nothing left to write
+                del self._pending[key]
+                self._cancelled += 1
+            else:
+                entry.desired = liked
+
+            if len(self._pending) >= self._config.max_pending:
+                self._wakeup.notify()
+        self._ensure_flusher()
+        return True
+
+    def effective_state(self, user_id: int, vacation_id: int) -> Optional[bool]:
+        """Return the buffered state for the pair, or None if nothing is pending."""
+        key = (user_id, vacation_id)
+        with self._lock:
+            entry = self._pending.get(key) or self._in_flight.get(key)
+            return entry.desired if entry is not None else None
+
+    @property
+    def version(self) -> int:
+        """Increases with every buffered change readers can see."""
+        with self._lock:
+            return self._recorded
+
+    def watermark(self) -> int:
+        """Return the mark to pass as ``since`` for counts just read."""
+        with self._lock:
+            return self._commits
+
+    def pending_delta(self, vacation_id: int, since: Optional[int] = None) -> int:
+        """Return how much buffered changes move a count read at watermark ``since``."""
+        with self._lock:
+            return sum(deltas.get(vacation_id, 0) for deltas in self._visible_deltas(since))
+
+    def has_pending(self, user_id: Optional[int] = None) -> bool:
+        """Return whether anything (for ``user_id``, if given) is waiting to be written."""
+        with self._lock:
+            if user_id is None:
+                return bool(self._pending or self._in_flight)
+            return any(
+                key[0] == user_id
+                for entries in (self._pending, self._in_flight)
+                for key in entries
+            )
+
+    def overlay(
+        self, items: list[CatalogVacationDTO], user_id: Optional[int], since: Optional[int] = None
+    ) -> list[CatalogVacationDTO]:
+        """Return ``items`` (read at watermark ``since``) with buffered counts and likes applied."""
+        with self._lock:
+            if not (self._pending or self._in_flight):
+                return items
+            states = {}
+            if user_id is not None:
+                for entries in (self._in_flight, self._pending):
+                    for (owner, vacation_id), entry in entries.items():
+                        if owner == user_id:
+                            states[vacation_id] = entry.desired
+            deltas: dict[int, int] = {}
+            for visible in self._visible_deltas(since):
+                for vacation_id, delta in visible.items():
+                    deltas[vacation_id] = deltas.get(vacation_id, 0) + delta
+
+        result = []
+        for item in items:
+            delta = deltas.get(item.id, 0)
+            liked = states.get(item.id)
+            if delta or liked is not None:
+                changes = {"likes_count": max(item.likes_count + delta, 0)}
+                if liked is not None:
+                    changes["is_liked"] = liked
+                item = replace(item, **changes)
+            result.append(item)
+        return result
+
+    def flush(self) -> int:
+        """Write every buffered change now. Returns how many rows changed."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._in_flight = batch
+                # Pending changes are exactly the batch, so their deltas are its deltas
+                self._in_flight_deltas, self._deltas = self._deltas, {}
+
+            to_like = sorted(key for key, entry in batch.items() if entry.desired)
+            to_unlike = sorted(key for key, entry in batch.items() if not entry.desired)
+            started = time.monotonic()
+            try:
+                # A fresh context, so a flush triggered inside a request never
+                # joins (or waits on) that request's transaction
+                liked, unliked = contextvars.Context().run(self._write, to_like, to_unlike)
+            except Exception:
+                with self._lock:
+                    self._errors += 1
+                    self._requeue(batch)
+                raise
+            elapsed = time.monotonic() - started
+
+            changed = len(liked) + len(unliked)
+            with self._lock:
+                # Committed: the stored counts hold the batch from now on
+                self._in_flight = {}
+                self._in_flight_deltas = {}
+                self._commit_seq = None
+                self._flushes += 1
+                self._flushed += len(batch)
+                self._dropped += len(batch) - changed
+                self._total_flush_time += elapsed
+                self._last_flush_time = elapsed
+                self._max_flush_time = max(self._max_flush_time, elapsed)
+            # Outside the buffer lock, so readers never wait on the cache's
+            cache = get_catalog_cache()
+            for user_id, vacation_id in liked + unliked:
+                cache.invalidate_like_change(user_id, vacation_id)
+            return changed
+
+    def stop(self) -> None:
+        """Stop the background flusher and write whatever is still buffered."""
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def stats(self) -> dict:
+        """Return buffer depth and flush counters."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "depth": len(self._pending),
+                "inFlight": len(self._in_flight),
+                "maxPending": self._config.max_pending,
+                "flushInterval": self._config.flush_interval,
+                "recorded": self._recorded,
+                "cancelled": self._cancelled,
+                "flushes": self._flushes,
+                "flushed": self._flushed,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "lastFlushTime": round(self._last_flush_time, 6),
+                "avgFlushTime": round(self._total_flush_time / self._flushes, 6) if self._flushes else 0.0,
+                "maxFlushTime": round(self._max_flush_time, 6),
+            }
+
+    def _write(
+        self, to_like: list[tuple[int, int]], to_unlike: list[tuple[int, int]]
+    ) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        with unit_of_work():
+            liked = self._like_dao.insert_pairs(to_like)
+            unliked = self._like_dao.delete_pairs(to_unlike)
+            with self._lock:
+                # Counts read from here on may already include the batch
+                self._commits += 1
+                self._commit_seq = self._commits
+        return liked, unliked
+
+    def _visible_deltas(self, since: Optional[int]) -> list[dict[int, int]]:
+        """Deltas to add to counts read at watermark ``since``. Called with ``_lock`` held."""
+        if self._commit_seq is None or (since is not None and since < self._commit_seq):
+            return [self._in_flight_deltas, self._deltas]
+        return [self._deltas]
+
+    @staticmethod
+    def _add_delta(deltas: dict[int, int], vacation_id: int, delta: int) -> None:
+        total = deltas.get(vacation_id, 0) + delta
+        if total:
+            deltas[vacation_id] = total
+        else:
+            deltas.pop(vacation_id, None)
+
+    def _requeue(self, batch: dict[tuple[int, int], PendingLike]) -> None:
+        """Merge a failed batch back under any changes recorded while it ran."""
+        for key, entry in batch.items():
+            newer = self._pending.get(key)
+            if newer is None:
+                self._pending[key] = entry
+            elif entry.base == newer.desired:
+                del self._pending[key]
+            else:
+                newer.base = entry.base
+        for vacation_id, delta in self._in_flight_deltas.items():
+            self._add_delta(self._deltas, vacation_id, delta)
+        self._in_flight = {}
+        self._in_flight_deltas = {}
+        self._commit_seq = None
+
+    def _ensure_flusher(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stopped:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="like-buffer-flusher", daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._stopped and len(self._pending) < self._config.max_pending:
+                    self._wakeup.wait(self._config.flush_interval)
+                if self._stopped:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                # Counted in stats; the changes were requeued for the next round
+                pass
+
+
+_like_buffer: Optional[LikeBuffer] = None
+_like_buffer_lock = threading.Lock()
+
+
+def get_like_buffer() -> LikeBuffer:
+    """Return the process-wide like buffer."""
+    global _like_buffer
+    with _like_buffer_lock:
+        if _like_buffer is None:
+            _like_buffer = LikeBuffer(LikeBufferConfig.from_env())
+        return _like_buffer
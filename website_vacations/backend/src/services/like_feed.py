@@ -0,0 +1,236 @@
+"""Server-Sent Events feed of vacation like counts."""
+
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+from typing import Iterator, Optional
+
+from src.api.json_provider import dumps_bytes
+from src.config import LikeFeedConfig
+from src.dal.vacation_dao import VacationDAO
+from src.services.like_buffer import LikeBuffer, get_like_buffer
+
+RETRY_FRAME = b"retry: 3000\n\n"
+HEARTBEAT_FRAME = b": keep-alive\n\n"
+# Sent when a reconnecting client missed more events than the history holds
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+
+
+class FeedFullError(Exception):
+    """Raised when ``max_subscribers`` streams are already open."""
+
+
+def greenlet_workers() -> bool:
+    """
+    True when requests run on greenlets (threading monkey-patched by gevent
+    or eventlet), so an open stream costs no OS thread.
+    """
+    gevent_monkey = sys.modules.get("gevent.monkey")
+    if gevent_monkey is not None and gevent_monkey.is_module_patched("threading"):
+        return True
+    eventlet_patcher = sys.modules.get("eventlet.patcher")
+    return eventlet_patcher is not None and eventlet_patcher.is_monkey_patched("thread")
+
+
+class LikeFeed:
+    """Broadcasts coalesced like-count changes to any number of SSE clients.
+
+    Like writes only mark their vacation dirty. One dispatcher thread wakes
+    at most every ``interval`` seconds, reads the current counts of every
+    dirty vacation in one query (plus buffered likes), encodes a single
+    event and appends it to a short history shared by all clients. Client
+    streams wait on one condition and write the already encoded bytes, so
+    the feed keeps no per-client queue or encoding work.
+
+    Each open stream does hold the worker serving it, so the feed is only
+    enabled under greenlet workers (e.g. gunicorn's gevent worker); on a
+    plain threaded server every idle client would take a request thread.
+    At most ``max_subscribers`` streams are accepted at a time.
+
+    Counts are read back rather than carried with the change, so concurrent
+    likes committing out of order can never leave a client on a stale count.
+    """
+
+    def __init__(
+        self,
+        config: LikeFeedConfig,
+        vacation_dao: Optional[VacationDAO] = None,
+        like_buffer: Optional[LikeBuffer] = None,
+    ) -> None:
+        self._config = config
+        self._vacation_dao = vacation_dao or VacationDAO()
+        self._like_buffer = like_buffer or get_like_buffer()
+        self._lock = threading.Lock()
+        self._dirty_ready = threading.Condition(self._lock)
+        self._event_ready = threading.Condition(self._lock)
+        self._dirty: set[int] = set()
+        self._history: deque[tuple[int, bytes]] = deque(maxlen=max(config.history, 1))
+        self._seq = 0
+        self._subscribers = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._published = 0
+        self._events = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled and greenlet_workers()
+
+    def publish(self, vacation_id: int) -> None:
+        """Note that a vacation's likes count changed. Free when nobody listens."""
+        with self._lock:
+            if not self._subscribers or self._stopped:
+                return
+            self._published += 1
+            if not self._dirty:
+                self._dirty_ready.notify()
+            self._dirty.add(vacation_id)
+
+    def stream(self, last_event_id: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Return SSE frames until the feed stops or the client goes away.
+
+        ``last_event_id`` is the Last-Event-ID a reconnecting EventSource
+        sends; events it missed are replayed from the history, or a
+        ``resync`` event tells it to reload the catalog.
+
+        Raises:
+            FeedFullError: If ``max_subscribers`` streams are already open
+        """
+        resync = False
+        with self._lock:
+            if self._subscribers >= self._config.max_subscribers:
+                raise FeedFullError(f"The like feed is full ({self._config.max_subscribers} subscribers)")
+            self._subscribers += 1
+            self._ensure_dispatcher()
+            seen = self._seq
+            if last_event_id is not None:
+                # IDs restart with the process; a larger one predates a restart
+                resync = last_event_id > seen
+                if not resync:
+                    seen = max(last_event_id, 0)
+        frames = self._frames(seen, resync)
+        # Started, so closing it releases the slot even before its first frame
+        next(frames)
+        return frames
+
+    def stop(self) -> None:
+        """Stop the dispatcher and end every open stream."""
+        with self._lock:
+            self._stopped = True
+            self._dirty_ready.notify_all()
+            self._event_ready.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> dict:
+        """Return subscriber and event counters."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "subscribers": self._subscribers,
+                "maxSubscribers": self._config.max_subscribers,
+                "dirty": len(self._dirty),
+                "interval": self._config.interval,
+                "lastEventId": self._seq,
+                "published": self._published,
+                "events": self._events,
+                "errors": self._errors,
+            }
+
+    def dispatch(self) -> bool:
+        """Send one event for the vacations marked dirty so far. Returns whether one was sent."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return False
+        try:
+            rows = self._vacation_dao.get_likes_counts(sorted(dirty))
+        except Exception:
+            with self._lock:
+                self._errors += 1
+                self._dirty |= dirty
+            raise
+        since = self._like_buffer.watermark()
+        changes = [
+            {
+                "vacationId": vacation_id,
+                "likesCount": max(likes_count + self._like_buffer.pending_delta(vacation_id, since), 0),
+            }
+            for vacation_id, likes_count in rows
+        ]
+        if not changes:
+            return False
+        data = dumps_bytes({"changes": changes})
+        with self._lock:
+            self._seq += 1
+            self._events += 1
+            frame = b"id: %d\nevent: likes\ndata: %s\n\n" % (self._seq, data)
+            self._history.append((self._seq, frame))
+            self._event_ready.notify_all()
+        return True
+
+    def _frames(self, seen: int, resync: bool) -> Iterator[bytes]:
+        try:
+            yield b""
+            yield RETRY_FRAME + (RESYNC_FRAME if resync else b"")
+            while True:
+                with self._lock:
+                    if self._seq == seen and not self._stopped:
+                        self._event_ready.wait(self._config.heartbeat)
+                    if self._stopped:
+                        return
+                    lost = bool(self._history) and self._history[0][0] > seen + 1
+                    frames = [data for seq, data in self._history if seq > seen]
+                    seen = self._seq
+                if lost:
+                    frames.insert(0, RESYNC_FRAME)
+                yield b"".join(frames) if frames else HEARTBEAT_FRAME
+        finally:
+            with self._lock:
+                self._subscribers -= 1
+
+    def _ensure_dispatcher(self) -> None:
+        # Called with the lock held
+        if self._thread is not None or self._stopped:
+            return
+        self._thread = threading.Thread(target=self._run, name="like-feed-dispatcher", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._dirty and not self._stopped:
+                    self._dirty_ready.wait()
+                # Let changes to the same vacations pile up, then send them as one
+                deadline = time.monotonic() + self._config.interval
+                while not self._stopped:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._dirty_ready.wait(remaining)
+                if self._stopped:
+                    return
+            try:
+                self.dispatch()
+            except Exception:
+                # Counted in stats; the vacations stay dirty for the next round
+                pass
+
+
+_like_feed: Optional[LikeFeed] = None
+_like_feed_lock = threading.Lock()
+
+
+def get_like_feed() -> LikeFeed:
+    """Return the process-wide like feed."""
+    global _like_feed
+    with _like_feed_lock:
+        if _like_feed is None:
+            _like_feed = LikeFeed(LikeFeedConfig.from_env())
+        return _like_feed
@@ -3,10 +3,46 @@
 import re
 from typing import Optional
 
+import psycopg2.errors
+
 from src.dal.like_dao import LikeDAO
 from src.dal.role_dao import RoleDAO
+from src.dal.unit_of_work import run_after_commit, transactional
 from src.dal.user_dao import UserDAO
-from src.models.dtos import RoleName, UserDTO
+from src.models.dtos import LikeBatchItemDTO, LikeResultDTO, RoleName, UserDTO
+from src.services.catalog_cache import get_catalog_cache
+from src.services.like_buffer import get_like_buffer
+from src.services.like_feed import get_like_feed
+
+MAX_LIKE_BATCH_SIZE = 500
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+def validate_registration(first_name: str, last_name: str, email: str, password: str) -> None:
+    """
+    Apply the rules every new user must pass, apart from the unique email check.
+    
+    Raises:
+        ValueError: If a field is missing, the email is malformed or the
+            password is shorter than 4 characters
+    """
+    # Validate all mandatory fields
+    if not first_name or not first_name.strip():
+        raise ValueError("First name is mandatory")
+    if not last_name or not last_name.strip():
+        raise ValueError("Last name is mandatory")
+    if not email or not email.strip():
+        raise ValueError("Email is mandatory")
+    if not password:
+        raise ValueError("Password is mandatory")
+
+    # Validate email format
+    if not EMAIL_PATTERN.match(email):
+        raise ValueError("Invalid email format")
+
+    # Validate password length
+    if len(password) < 4:
+        raise ValueError("Password must be at least 4 characters")
 
 
 class UserService:
@@ -17,16 +53,19 @@ class UserService:
         self._user_dao = UserDAO()
         self._role_dao = RoleDAO()
         self._like_dao = LikeDAO()
+        self._catalog_cache = get_catalog_cache()
+        self._like_buffer = get_like_buffer()
+        self._like_feed = get_like_feed()
 
     def _validate_email(self, email: str) -> bool:
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(EMAIL_PATTERN.match(email))
 
     def _validate_password(self, password: str) -> bool:
         """Validate password (minimum 4 characters)."""
         return len(password) >= 4
 
+    @transactional
     def register_user(
         self,
         first_name: str,
@@ -58,23 +97,7 @@ class UserService:
         Raises:
             ValueError: If validation fails
         """
-        # Validate all mandatory fields
-        if not first_name or not first_name.strip():
-            raise ValueError("First name is mandatory")
-        if not last_name or not last_name.strip():
-            raise ValueError("Last name is mandatory")
-        if not email or not email.strip():
-            raise ValueError("Email is mandatory")
-        if not password:
-            raise ValueError("Password is mandatory")
-
-        # Validate email format
-        if not self._validate_email(email):
-            raise ValueError("Invalid email format")
-
-        # Validate password length
-        if not self._validate_password(password):
-            raise ValueError("Password must be at least 4 characters")
+        validate_registration(first_name, last_name, email, password)
 
         # Check if email already exists
         if self._user_dao.email_exists(email):
@@ -154,7 +177,93 @@ class UserService:
             role_id=user["role_id"],
         )
 
-    def like_vacation(self, user_id: int, vacation_id: int) -> None:
+    def is_admin(self, role_id: int) -> bool:
+        """
+        Check whether a role ID belongs to the Admin role.
+        
+        Args:
+            role_id: ID of the role to check
+            
+        Returns:
+            bool: True if the role is Admin
+        """
+        role = self._role_dao.get_by_id(role_id)
+        return bool(role) and role["name"] == RoleName.ADMIN.value
+
+    def _apply_like(self, user_id: int, vacation_id: int, liked: bool) -> Optional[LikeResultDTO]:
+        """Like or unlike in one atomic statement; None if the vacation does not exist."""
+        if self._like_buffer.enabled:
+            return self._apply_like_buffered(user_id, vacation_id, liked)
+        try:
+            if liked:
+                row = self._like_dao.like(user_id, vacation_id)
+            else:
+                row = self._like_dao.unlike(user_id, vacation_id)
+        except psycopg2.errors.ForeignKeyViolation:
+            raise ValueError(f"User with ID {user_id} does not exist")
+        if row is None:
+            return None
+
+        if row["changed"]:
+            run_after_commit(
+                lambda: self._catalog_cache.invalidate_like_change(user_id, vacation_id)
+            )
+            run_after_commit(lambda: self._like_feed.publish(vacation_id))
+        return LikeResultDTO(
+            user_id=user_id,
+            vacation_id=vacation_id,
+            liked=liked,
+            changed=row["changed"],
+            likes_count=row["likes_count"],
+        )
+
+    def _apply_like_buffered(
+        self, user_id: int, vacation_id: int, liked: bool
+    ) -> Optional[LikeResultDTO]:
+        """Record a like change in the write-behind buffer instead of writing it now."""
+        state = self._like_dao.get_like_state(user_id, vacation_id)
+        since = self._like_buffer.watermark()
+        if state is None:
+            return None
+        if not state["user_exists"]:
+            # As the unbuffered path reports its foreign key violation
+            raise ValueError(f"User with ID {user_id} does not exist")
+        changed = self._like_buffer.record(user_id, vacation_id, state["liked"], liked)
+        if changed:
+            # Readers already see buffered likes, so listeners may too
+            self._like_feed.publish(vacation_id)
+        return LikeResultDTO(
+            user_id=user_id,
+            vacation_id=vacation_id,
+            liked=liked,
+            changed=changed,
+            likes_count=max(state["likes_count"] + self._like_buffer.pending_delta(vacation_id, since), 0),
+        )
+
+    @transactional
+    def set_like(self, user_id: int, vacation_id: int, liked: bool) -> LikeResultDTO:
+        """
+        Idempotently set whether a user likes a vacation.
+        
+        Args:
+            user_id: ID of the user
+            vacation_id: ID of the vacation
+            liked: True to like, False to unlike
+            
+        Returns:
+            LikeResultDTO: The resulting state, whether anything changed and
+            the vacation's new likes count
+            
+        Raises:
+            ValueError: If the user or vacation does not exist
+        """
+        result = self._apply_like(user_id, vacation_id, liked)
+        if result is None:
+            raise ValueError(f"Vacation with ID {vacation_id} does not exist")
+        return result
+
+    @transactional
+    def like_vacation(self, user_id: int, vacation_id: int) -> LikeResultDTO:
         """
         Add a like for a vacation by a user.
         
@@ -162,22 +271,21 @@ class UserService:
             user_id: ID of the user
             vacation_id: ID of the vacation
             
+        Returns:
+            LikeResultDTO: The new like state and likes count
+            
         Raises:
             ValueError: If the like already exists or IDs are invalid
         """
-        # Check if like already exists
-        existing_like = self._like_dao.get_by_user_and_vacation(user_id, vacation_id)
-        if existing_like:
+        result = self._apply_like(user_id, vacation_id, True)
+        if result is None:
+            raise ValueError(f"Vacation with ID {vacation_id} does not exist")
+        if not result.changed:
             raise ValueError("User has already liked this vacation")
+        return result
 
-        # Insert new like
-        like_data = {
-            "user_id": user_id,
-            "vacation_id": vacation_id,
-        }
-        self._like_dao.insert(like_data)
-
-    def unlike_vacation(self, user_id: int, vacation_id: int) -> None:
+    @transactional
+    def unlike_vacation(self, user_id: int, vacation_id: int) -> LikeResultDTO:
         """
         Remove a like for a vacation by a user.
         
@@ -185,17 +293,87 @@ class UserService:
             user_id: ID of the user
             vacation_id: ID of the vacation
             
+        Returns:
+            LikeResultDTO: The new like state and likes count
+            
         Raises:
             ValueError: If the like does not exist
         """
-        # Check if like exists
-        existing_like = self._like_dao.get_by_user_and_vacation(user_id, vacation_id)
-        if not existing_like:
+        result = self._apply_like(user_id, vacation_id, False)
+        if result is None or not result.changed:
             raise ValueError("User has not liked this vacation")
+        return result
+
+    @transactional
+    def apply_like_batch(
+        self, user_id: int, operations: list[tuple[int, bool]]
+    ) -> list[LikeBatchItemDTO]:
+        """
+        Apply many like/unlike operations for one user in a single transaction.
+        
+        Likes and unlikes each run as one set-based statement. When the same
+        vacation appears more than once, the last operation wins and the
+        earlier ones are reported as "superseded".
+        
+        Args:
+            user_id: ID of the user
+            operations: (vacation_id, liked) pairs; liked=True likes, False unlikes
+            
+        Returns:
+            list[LikeBatchItemDTO]: One result per operation, in request order.
+            Status is one of: liked, already_liked, unliked, not_liked,
+            not_found, superseded
+            
+        Raises:
+            ValueError: If the batch is empty, too large or the user does not exist
+        """
+        if not operations:
+            raise ValueError("At least one like operation is required")
+        if len(operations) > MAX_LIKE_BATCH_SIZE:
+            raise ValueError(f"A batch cannot contain more than {MAX_LIKE_BATCH_SIZE} operations")
+        if self._like_buffer.has_pending(user_id):
+            # Buffered changes must not land after (and undo) this batch
+            self._like_buffer.flush()
+
+        # Last operation per vacation wins
+        final: dict[int, int] = {}
+        for index, (vacation_id, _) in enumerate(operations):
+            final[vacation_id] = index
+        to_like = sorted(v for v, i in final.items() if operations[i][1])
+        to_unlike = sorted(v for v, i in final.items() if not operations[i][1])
+
+        rows: dict[int, dict] = {}
+        try:
+            if to_like:
+                rows.update({r["vacation_id"]: r for r in self._like_dao.like_many(user_id, to_like)})
+        except psycopg2.errors.ForeignKeyViolation:
+            raise ValueError(f"User with ID {user_id} does not exist")
+        if to_unlike:
+            rows.update({r["vacation_id"]: r for r in self._like_dao.unlike_many(user_id, to_unlike)})
 
-        # Delete the like
-        rows_affected = self._like_dao.delete_by_user_and_vacation(user_id, vacation_id)
-        if rows_affected == 0:
-            raise ValueError("Failed to unlike vacation")
+        results = []
+        for index, (vacation_id, liked) in enumerate(operations):
+            row = rows.get(vacation_id)
+            if final[vacation_id] != index:
+                status = "superseded"
+            elif row is None:
+                status = "not_found"
+            elif liked:
+                status = "liked" if row["changed"] else "already_liked"
+            else:
+                status = "unliked" if row["changed"] else "not_liked"
+            results.append(LikeBatchItemDTO(
+                vacation_id=vacation_id,
+                liked=liked,
+                status=status,
+                likes_count=row["likes_count"] if row else None,
+            ))
 
+        for vacation_id, row in rows.items():
+            if row["changed"]:
+                run_after_commit(
+                    lambda v=vacation_id: self._catalog_cache.invalidate_like_change(user_id, v)
+                )
+                run_after_commit(lambda v=vacation_id: self._like_feed.publish(v))
+        return results
 
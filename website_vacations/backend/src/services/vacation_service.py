@@ -1,11 +1,80 @@
 """Business Logic Layer for Vacation operations."""
 
+import base64
+import binascii
+from dataclasses import astuple
 from datetime import date
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
+from src.dal.base_dao import STREAM_ITERSIZE
 from src.dal.country_dao import CountryDAO
+from src.dal.unit_of_work import run_after_commit, transactional
 from src.dal.vacation_dao import VacationDAO
-from src.models.dtos import VacationDTO
+from src.models.dtos import (
+    CatalogChangesDTO,
+    CatalogVacationDTO,
+    VacationDTO,
+    VacationFilters,
+    VacationPageDTO,
+)
+from src.services.catalog_cache import CatalogEntry, get_catalog_cache
+from src.services.image_gc import get_image_gc
+from src.services.image_pipeline import get_image_pipeline
+from src.services.like_buffer import get_like_buffer
+
+CATALOG_STATUSES = ("ongoing", "upcoming")
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(start_date: date, vacation_id: int) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    raw = f"{start_date.isoformat()}|{vacation_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    """Decode a token produced by encode_cursor back into (start_date, id)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start, vacation_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return date.fromisoformat(start), int(vacation_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def validate_new_vacation(
+    description: str, start_date: date, end_date: date, price: float
+) -> None:
+    """
+    Apply the rules every new vacation must pass, apart from the country check.
+    
+    Raises:
+        ValueError: If a field is missing, the price is outside 0-10,000,
+            the end date is before the start date or the start date is past
+    """
+    # Validate mandatory fields
+    if not description or not description.strip():
+        raise ValueError("Description is mandatory")
+    if not start_date:
+        raise ValueError("Start date is mandatory")
+    if not end_date:
+        raise ValueError("End date is mandatory")
+    if price is None:
+        raise ValueError("Price is mandatory")
+
+    # Validate price range
+    if price < 0 or price > 10000:
+        raise ValueError("Price must be between 0 and 10,000")
+
+    # Validate dates
+    if end_date < start_date:
+        raise ValueError("End date cannot be earlier than start date")
+
+    # Validate that start_date is not in the past
+    today = date.today()
+    if start_date < today:
+        raise ValueError("Past dates cannot be selected for vacation period")
 
 
 class VacationService:
@@ -15,6 +84,10 @@ class VacationService:
         """Initialize VacationService with required DAOs."""
         self._vacation_dao = VacationDAO()
         self._country_dao = CountryDAO()
+        self._catalog_cache = get_catalog_cache()
+        self._like_buffer = get_like_buffer()
+        self._image_pipeline = get_image_pipeline()
+        self._image_gc = get_image_gc()
 
     def list_vacations(self) -> Iterable[VacationDTO]:
         """
@@ -24,20 +97,284 @@ class VacationService:
         Returns:
             Iterable[VacationDTO]: List of all vacations
         """
-        vacations = self._vacation_dao.list_all()
-        return [
-            VacationDTO(
-                id=v["id"],
-                country_id=v["country_id"],
-                description=v["description"],
-                start_date=v["start_date"],
-                end_date=v["end_date"],
-                price=float(v["price"]),
-                image_name=v.get("image_name"),
-            )
-            for v in vacations
+        return [VacationDTO(*v) for v in self._vacation_dao.list_all()]
+
+    def iter_vacations(self, itersize: int = STREAM_ITERSIZE) -> Iterator[VacationDTO]:
+        """
+        Stream all vacations, sorted by start_date in ascending order, in
+        constant memory, for exports and other full-table reads.
+        
+        Args:
+            itersize: Rows fetched from the server-side cursor per round trip
+            
+        Returns:
+            Iterator[VacationDTO]: Vacations, produced as they are read
+        """
+        for v in self._vacation_dao.iter_all(itersize):
+            yield VacationDTO(*v)
+
+    def _validate_filters(self, user_id: Optional[int], filters: VacationFilters) -> None:
+        """Validate catalog filters before they reach the database."""
+        if filters.liked_only and user_id is None:
+            raise ValueError("User ID is required to filter liked vacations")
+        if filters.status is not None and filters.status not in CATALOG_STATUSES:
+            raise ValueError("Status must be one of: " + ", ".join(CATALOG_STATUSES))
+        if filters.min_price is not None and filters.min_price < 0:
+            raise ValueError("Minimum price cannot be negative")
+        if (
+            filters.min_price is not None
+            and filters.max_price is not None
+            and filters.max_price < filters.min_price
+        ):
+            raise ValueError("Maximum price cannot be lower than minimum price")
+
+    def _query_catalog(
+        self,
+        user_id: Optional[int],
+        filters: VacationFilters,
+        after: Optional[tuple[date, int]] = None,
+        limit: Optional[int] = None,
+    ) -> list[CatalogVacationDTO]:
+        """Run the catalog query and map its tuple rows straight onto DTOs."""
+        vacations = self._vacation_dao.list_catalog(
+            user_id,
+            liked_only=filters.liked_only,
+            status=filters.status,
+            country_id=filters.country_id,
+            min_price=filters.min_price,
+            max_price=filters.max_price,
+            after=after,
+            limit=limit,
+        )
+        return [CatalogVacationDTO(*v) for v in vacations]
+
+    def iter_catalog(
+        self,
+        user_id: Optional[int] = None,
+        filters: Optional[VacationFilters] = None,
+        itersize: int = STREAM_ITERSIZE,
+    ) -> Iterator[CatalogVacationDTO]:
+        """
+        Stream the whole catalog from a server-side cursor, bypassing the
+        catalog cache, so arbitrarily large catalogs use constant memory.
+        
+        Filters are validated before this returns; rows are only read once
+        the iterator is consumed.
+        
+        Args:
+            user_id: Optional ID of the viewing user
+            filters: Optional server-side filters
+            itersize: Rows fetched per round trip
+            
+        Returns:
+            Iterator[CatalogVacationDTO]: Catalog rows sorted by start_date
+            
+        Raises:
+            ValueError: If the filters are invalid
+        """
+        filters = filters or VacationFilters()
+        self._validate_filters(user_id, filters)
+        return self._iter_catalog_rows(user_id, filters, itersize)
+
+    def _iter_catalog_rows(
+        self, user_id: Optional[int], filters: VacationFilters, itersize: int
+    ) -> Iterator[CatalogVacationDTO]:
+        if filters.liked_only and self._like_buffer.has_pending(user_id):
+            self._like_buffer.flush()
+        rows = self._vacation_dao.iter_catalog(
+            user_id,
+            liked_only=filters.liked_only,
+            status=filters.status,
+            country_id=filters.country_id,
+            min_price=filters.min_price,
+            max_price=filters.max_price,
+            itersize=itersize,
+        )
+        since = None
+        for v in rows:
+            if since is None:
+                # The cursor's snapshot is taken once the first row arrives
+                since = self._like_buffer.watermark()
+            item = CatalogVacationDTO(*v)
+            if self._like_buffer.has_pending():
+                item = self._like_buffer.overlay([item], user_id, since)[0]
+            yield item
+
+    def get_catalog_changes(
+        self, user_id: Optional[int] = None, since: int = 0
+    ) -> CatalogChangesDTO:
+        """
+        Retrieve catalog rows added or changed, and IDs of vacations deleted,
+        since change version ``since``, for clients that keep a local copy.
+        
+        Pass the returned version as ``since`` on the next call. since=0
+        returns the whole catalog and no deletions. Rows near the version
+        boundary may be sent twice; applying a row again is harmless.
+        Like changes count as changes to the vacation, so its new likes
+        count (and the user's liked flag) are in the next delta.
+        
+        Args:
+            user_id: Optional ID of the viewing user, for is_liked
+            since: Version returned by the previous call, or 0
+            
+        Returns:
+            CatalogChangesDTO: Next version, changed rows and deleted IDs
+            
+        Raises:
+            ValueError: If since is negative
+        """
+        if since < 0:
+            raise ValueError("Since must be a non-negative change version")
+        # Read the watermark first: rows committed after it are in this
+        # result or, failing that, in the next one
+        version = self._vacation_dao.current_change_version()
+        items = [
+            CatalogVacationDTO(*v)
+            for v in self._vacation_dao.list_catalog(user_id, changed_since=since)
         ]
+        if self._like_buffer.has_pending():
+            items = self._like_buffer.overlay(items, user_id, self._like_buffer.watermark())
+        deleted_ids = self._vacation_dao.list_deleted_ids_since(since) if since else []
+        return CatalogChangesDTO(version=version, items=items, deleted_ids=deleted_ids)
 
+    def get_catalog_entry(
+        self,
+        user_id: Optional[int] = None,
+        filters: Optional[VacationFilters] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> CatalogEntry:
+        """
+        Retrieve a catalog result through the in-process catalog cache.
+        
+        The returned entry can also carry the serialized JSON for its items,
+        so repeated hits skip both the SQL and the serialization.
+        
+        Args:
+            user_id: Optional ID of the viewing user
+            filters: Optional server-side filters
+            cursor: Keyset cursor from a previous page, when paging
+            limit: Page size (1-100), or None for the whole catalog
+            
+        Returns:
+            CatalogEntry: The matching items and, when paging, the next cursor
+            
+        Raises:
+            ValueError: If the filters, cursor or limit are invalid
+        """
+        if limit is not None and (limit < 1 or limit > MAX_PAGE_SIZE):
+            raise ValueError(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+        filters = filters or VacationFilters()
+        self._validate_filters(user_id, filters)
+        after = decode_cursor(cursor) if cursor else None
+
+        if filters.liked_only and self._like_buffer.has_pending(user_id):
+            # Buffered likes change which rows match, so write them first
+            self._like_buffer.flush()
+
+        key = self.catalog_key(user_id, filters, cursor, limit)
+        entry = self._catalog_cache.get(key)
+        if entry is None:
+            entry = self._build_catalog_entry(key, user_id, filters, after, limit)
+        if not self._like_buffer.has_pending():
+            return entry
+        # Show buffered likes without touching the cached entry
+        return CatalogEntry(
+            items=self._like_buffer.overlay(entry.items, user_id, entry.like_mark),
+            next_cursor=entry.next_cursor,
+            user_id=user_id,
+            liked_only=filters.liked_only,
+        )
+
+    @staticmethod
+    def catalog_key(
+        user_id: Optional[int], filters: VacationFilters, cursor: Optional[str], limit: Optional[int]
+    ) -> tuple:
+        """Return the key a catalog result is cached (and versioned) under."""
+        return (user_id, astuple(filters), cursor, limit)
+
+    def _build_catalog_entry(
+        self,
+        key: tuple,
+        user_id: Optional[int],
+        filters: VacationFilters,
+        after: Optional[tuple[date, int]],
+        limit: Optional[int],
+    ) -> CatalogEntry:
+        """Query a catalog result and store it in the cache."""
+        version = self._catalog_cache.version
+        if limit is None:
+            items = self._query_catalog(user_id, filters, after=after)
+            next_cursor = None
+        else:
+            # Fetch one extra row to learn whether another page exists
+            items = self._query_catalog(user_id, filters, after=after, limit=limit + 1)
+            next_cursor = None
+            if len(items) > limit:
+                items = items[:limit]
+                last = items[-1]
+                next_cursor = encode_cursor(last.start_date, last.id)
+
+        entry = CatalogEntry(
+            items=items,
+            next_cursor=next_cursor,
+            user_id=user_id,
+            liked_only=filters.liked_only,
+            like_mark=self._like_buffer.watermark(),
+        )
+        self._catalog_cache.put(key, entry, version)
+        return entry
+
+    def list_catalog(
+        self,
+        user_id: Optional[int] = None,
+        filters: Optional[VacationFilters] = None,
+    ) -> Iterable[CatalogVacationDTO]:
+        """
+        Retrieve the vacation catalog in one query: every vacation with its
+        country name and likes count, sorted by start_date ascending.
+        
+        Args:
+            user_id: Optional ID of the viewing user; when given, each vacation
+                says whether that user liked it
+            filters: Optional server-side filters
+            
+        Returns:
+            Iterable[CatalogVacationDTO]: List of matching vacations with catalog data
+            
+        Raises:
+            ValueError: If the filters are invalid
+        """
+        return self.get_catalog_entry(user_id, filters).items
+
+    def list_catalog_page(
+        self,
+        user_id: Optional[int] = None,
+        filters: Optional[VacationFilters] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> VacationPageDTO:
+        """
+        Retrieve one page of the vacation catalog using keyset pagination on
+        (start_date, id), so deep pages cost the same as the first one.
+        
+        Args:
+            user_id: Optional ID of the viewing user
+            filters: Optional server-side filters
+            cursor: Token from a previous page's next_cursor, or None for the first page
+            limit: Page size (1-100)
+            
+        Returns:
+            VacationPageDTO: The page items and the cursor for the next page
+            (None when this is the last page)
+            
+        Raises:
+            ValueError: If the filters, cursor or limit are invalid
+        """
+        entry = self.get_catalog_entry(user_id, filters, cursor, limit)
+        return VacationPageDTO(items=entry.items, next_cursor=entry.next_cursor)
+
+    @transactional
     def add_vacation(
         self,
         country_id: int,
@@ -71,28 +408,7 @@ class VacationService:
         Raises:
             ValueError: If validation fails
         """
-        # Validate mandatory fields
-        if not description or not description.strip():
-            raise ValueError("Description is mandatory")
-        if not start_date:
-            raise ValueError("Start date is mandatory")
-        if not end_date:
-            raise ValueError("End date is mandatory")
-        if price is None:
-            raise ValueError("Price is mandatory")
-
-        # Validate price range
-        if price < 0 or price > 10000:
-            raise ValueError("Price must be between 0 and 10,000")
-
-        # Validate dates
-        if end_date < start_date:
-            raise ValueError("End date cannot be earlier than start date")
-
-        # Validate that start_date is not in the past
-        today = date.today()
-        if start_date < today:
-            raise ValueError("Past dates cannot be selected for vacation period")
+        validate_new_vacation(description, start_date, end_date, price)
 
         # Validate country exists
         country = self._country_dao.get_by_id(country_id)
@@ -110,6 +426,9 @@ class VacationService:
         }
 
         vacation_id = self._vacation_dao.insert(vacation_data)
+        run_after_commit(self._catalog_cache.invalidate_all)
+        if vacation_data["image_name"]:
+            run_after_commit(lambda: self._image_pipeline.submit(vacation_data["image_name"]))
 
         return VacationDTO(
             id=vacation_id,
@@ -121,6 +440,7 @@ class VacationService:
             image_name=vacation_data["image_name"],
         )
 
+    @transactional
     def update_vacation(
         self,
         vacation_id: int,
@@ -212,6 +532,14 @@ class VacationService:
         rows_affected = self._vacation_dao.update_by_id(vacation_id, update_data)
         if rows_affected == 0:
             raise ValueError(f"Failed to update vacation with ID {vacation_id}")
+        run_after_commit(self._catalog_cache.invalidate_all)
+        new_image = update_data["image_name"]
+        old_image = existing_vacation.get("image_name")
+        if new_image and new_image != old_image:
+            run_after_commit(lambda: self._image_pipeline.submit(new_image))
+        if old_image and old_image != new_image:
+            # Removed once committed, unless another vacation shares the file
+            run_after_commit(lambda: self._image_gc.schedule([old_image]))
 
         # Return updated vacation
         updated_vacation = self._vacation_dao.get_by_id(vacation_id)
@@ -225,6 +553,20 @@ class VacationService:
             image_name=updated_vacation.get("image_name"),
         )
 
+    @transactional
+    def reconcile_likes_count(self) -> int:
+        """
+        Rebuild every vacation's denormalized likes_count from the likes table.
+        
+        Returns:
+            int: Number of vacations whose count was corrected
+        """
+        corrected = self._vacation_dao.reconcile_likes_count()
+        if corrected:
+            run_after_commit(self._catalog_cache.invalidate_all)
+        return corrected
+
+    @transactional
     def delete_vacation(self, vacation_id: int) -> None:
         """
         Delete an existing vacation.
@@ -245,5 +587,8 @@ class VacationService:
         rows_affected = self._vacation_dao.delete_by_id(vacation_id)
         if rows_affected == 0:
             raise ValueError(f"Failed to delete vacation with ID {vacation_id}")
+        run_after_commit(self._catalog_cache.invalidate_all)
+        if existing_vacation.get("image_name"):
+            run_after_commit(lambda: self._image_gc.schedule([existing_vacation["image_name"]]))
 
 
@@ -0,0 +1,9 @@
+"""Shared pytest configuration."""
+
+import os
+import tempfile
+
+# Services write and delete image files (uploads, variants, garbage
+# collection). Point them at a scratch directory before any of them is
+# built, so the test suite never touches the tracked images/ directory.
+os.environ["IMAGES_DIR"] = tempfile.mkdtemp(prefix="vacation-images-")
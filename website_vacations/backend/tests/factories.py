@@ -0,0 +1,26 @@
+"""Builders for test data shared across test modules."""
+
+from datetime import date, timedelta
+
+from src.models.dtos import CatalogVacationDTO
+
+
+def make_catalog_item(
+    vacation_id: int = 1, likes_count: int = 0, is_liked=None, **fields
+) -> CatalogVacationDTO:
+    """Build a catalog row; ``fields`` override any other column."""
+    start = date(2030, 1, 1) + timedelta(days=vacation_id)
+    values = dict(
+        id=vacation_id,
+        country_id=1,
+        country_name="France",
+        description=f"Vacation {vacation_id}",
+        start_date=start,
+        end_date=start + timedelta(days=7),
+        price=1000.0,
+        image_name=None,
+        likes_count=likes_count,
+        is_liked=is_liked,
+    )
+    values.update(fields)
+    return CatalogVacationDTO(**values)
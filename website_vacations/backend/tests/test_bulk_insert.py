@@ -0,0 +1,108 @@
+"""Tests for the bulk insert methods on the DAOs."""
+
+import pytest
+import psycopg2
+from datetime import date
+
+from src.dal.country_dao import CountryDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.user_dao import UserDAO
+from src.dal.vacation_dao import VacationDAO
+from tests.test_db_init import init_test_db
+
+
+@pytest.fixture(autouse=True)
+def setup_test_db():
+    """Initialize test database before each test."""
+    init_test_db()
+
+
+def make_vacation(index: int, **overrides) -> dict:
+    """Build vacation data for bulk tests."""
+    data = {
+        "country_id": 1,
+        "description": f"Bulk vacation {index}\twith a tab",
+        "start_date": date(2030, 1, 1),
+        "end_date": date(2030, 1, 8),
+        "price": 1000 + index,
+        "image_name": None,
+    }
+    data.update(overrides)
+    return data
+
+
+class TestBulkInsert:
+    """Test suite for insert_many and copy_from_iter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.vacation_dao = VacationDAO()
+        self.country_dao = CountryDAO()
+        self.user_dao = UserDAO()
+        self.like_dao = LikeDAO()
+
+    def test_insert_many_vacations_returns_ids_in_order(self):
+        """Positive test: insert_many returns one ID per row, in input order."""
+        ids = self.vacation_dao.insert_many(make_vacation(i) for i in range(2500))
+        assert len(ids) == 2500
+        assert ids == sorted(ids)
+        first = self.vacation_dao.get_by_id(ids[0])
+        assert first["description"] == "Bulk vacation 0\twith a tab"
+
+    def test_insert_many_is_atomic(self):
+        """Negative test: One bad row rolls back the whole batch."""
+        before = len(list(self.vacation_dao.list_all()))
+        rows = [make_vacation(i) for i in range(1500)] + [make_vacation(0, price=20000)]
+        with pytest.raises(psycopg2.IntegrityError):
+            self.vacation_dao.insert_many(rows)
+        assert len(list(self.vacation_dao.list_all())) == before
+
+    def test_insert_many_empty(self):
+        """Edge case: An empty iterable inserts nothing."""
+        assert self.country_dao.insert_many([]) == []
+
+    def test_copy_vacations(self):
+        """Positive test: copy_from_iter streams rows in with COPY."""
+        before = len(list(self.vacation_dao.list_all()))
+        assert self.vacation_dao.copy_from_iter(make_vacation(i) for i in range(3000)) == 3000
+        assert len(list(self.vacation_dao.list_all())) == before + 3000
+
+    def test_copy_countries_and_users(self):
+        """Positive test: Countries and users can be copied in bulk."""
+        assert self.country_dao.copy_from_iter({"name": f"Bulkland {i}"} for i in range(50)) == 50
+        users = (
+            {
+                "first_name": "Bulk",
+                "last_name": f"User {i}",
+                "email": f"bulk{i}@example.com",
+                "password": "1234",
+                "username": None,
+                "role_id": 2,
+            }
+            for i in range(100)
+        )
+        ids = self.user_dao.insert_many(users)
+        assert len(ids) == 100
+
+    def test_bulk_likes_update_counts(self):
+        """Positive test: Bulk likes keep vacations.likes_count in step."""
+        vacation_id = self.vacation_dao.insert(make_vacation(0))
+        user_ids = self.user_dao.insert_many(
+            {
+                "first_name": "Bulk",
+                "last_name": f"Liker {i}",
+                "email": f"liker{i}@example.com",
+                "password": "1234",
+                "role_id": 2,
+            }
+            for i in range(20)
+        )
+        keys = self.like_dao.insert_many(
+            {"user_id": user_id, "vacation_id": vacation_id} for user_id in user_ids[:10]
+        )
+        assert len(keys) == 10
+        copied = self.like_dao.copy_from_iter(
+            {"user_id": user_id, "vacation_id": vacation_id} for user_id in user_ids[10:]
+        )
+        assert copied == 10
+        assert self.like_dao.count_by_vacation(vacation_id) == 20
@@ -0,0 +1,96 @@
+"""Tests for the in-process catalog cache."""
+
+from src.config import CacheConfig
+from src.services.catalog_cache import CachedPayload, CatalogCache, CatalogEntry
+from tests.factories import make_catalog_item
+
+
+def make_entry(user_id=None, liked_only=False, *items) -> CatalogEntry:
+    """Build a cache entry holding the given rows."""
+    return CatalogEntry(items=list(items), next_cursor=None, user_id=user_id, liked_only=liked_only)
+
+
+class TestCatalogCache:
+    """Test suite for CatalogCache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache = CatalogCache(CacheConfig(enabled=True, max_entries=2, ttl=60.0))
+
+    def test_hit_and_miss_counters(self):
+        """Positive test: A stored entry is served and counted as a hit."""
+        assert self.cache.get("k") is None
+        entry = make_entry(None, False, make_catalog_item(1))
+        assert self.cache.put("k", entry, self.cache.version)
+        assert self.cache.get("k") is entry
+        stats = self.cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Positive test: The least recently used entry is evicted past max size."""
+        version = self.cache.version
+        self.cache.put("a", make_entry(), version)
+        self.cache.put("b", make_entry(), version)
+        self.cache.get("a")
+        self.cache.put("c", make_entry(), version)
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") is not None
+        assert self.cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Positive test: Entries past their TTL are not served."""
+        cache = CatalogCache(CacheConfig(enabled=True, max_entries=2, ttl=0.0))
+        cache.put("k", make_entry(), cache.version)
+        assert cache.get("k") is None
+
+    def test_stale_put_is_rejected(self):
+        """Negative test: A result read before a write is not stored after it."""
+        version = self.cache.version
+        self.cache.invalidate_all()
+        assert not self.cache.put("k", make_entry(), version)
+        assert self.cache.get("k") is None
+
+    def test_like_change_drops_results_showing_the_vacation(self):
+        """Positive test: A like drops every result showing the vacation, and only those."""
+        version = self.cache.version
+        self.cache.put("anon", make_entry(None, False, make_catalog_item(1, 3), make_catalog_item(2)), version)
+        self.cache.put("other", make_entry(7, False, make_catalog_item(2)), version)
+        self.cache.invalidate_like_change(7, 1)
+        assert self.cache.get("anon") is None
+        assert self.cache.get("other") is not None
+
+    def test_like_change_drops_liked_only_results(self):
+        """Positive test: The acting user's liked-only results are dropped."""
+        self.cache.put("liked", make_entry(7, True, make_catalog_item(2, 1, True)), self.cache.version)
+        self.cache.invalidate_like_change(7, 1)
+        assert self.cache.get("liked") is None
+
+    def test_result_read_after_commit_is_not_counted_twice(self):
+        """Negative test: A result that already includes the like is rebuilt, not bumped again."""
+        self.cache.put("anon", make_entry(None, False, make_catalog_item(1, 4)), self.cache.version)
+        self.cache.invalidate_like_change(7, 1)
+        assert self.cache.get("anon") is None
+
+    def test_validator_follows_writes(self):
+        """Positive test: The validator holds until a write and differs between processes."""
+        before = self.cache.validator()
+        assert self.cache.validator() == before
+        self.cache.invalidate_like_change(7, 1)
+        assert self.cache.validator() != before
+        other = CatalogCache(CacheConfig(enabled=True, max_entries=2, ttl=60.0))
+        assert other.validator()[0] != before[0]
+
+    def test_stale_payload_not_attached(self):
+        """Edge case: A payload built from items that were since replaced is dropped."""
+        entry = make_entry(None, False, make_catalog_item(1))
+        self.cache.put("k", entry, self.cache.version)
+        items = entry.items
+        entry.items = list(items)
+        self.cache.attach_payload(entry, items, CachedPayload(b"[]"))
+        assert entry.payload is None
+
+    def test_disabled_cache_stores_nothing(self):
+        """Negative test: A disabled cache never stores entries."""
+        cache = CatalogCache(CacheConfig(enabled=False, max_entries=2, ttl=60.0))
+        assert not cache.put("k", make_entry(), cache.version)
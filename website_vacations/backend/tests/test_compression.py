@@ -0,0 +1,104 @@
+"""Tests for response compression."""
+
+import gzip
+
+import pytest
+from flask import Flask
+
+from src.api import compression
+from src.api.compression import Compressor, init_compression
+from src.config import CompressionConfig
+
+BODY = b'{"items":[' + b",".join(b'{"id":%d}' % i for i in range(200)) + b"]}"
+
+
+class TestCompressor:
+    """Test suite for Compressor."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.app = Flask(__name__)
+        self.compressor = init_compression(
+            self.app, CompressionConfig(enabled=True, min_size=256, gzip_level=6, brotli_quality=5)
+        )
+
+        @self.app.route("/json")
+        def json_body():
+            return self.app.response_class(BODY, mimetype="application/json")
+
+        @self.app.route("/small")
+        def small_body():
+            return self.app.response_class(b"{}", mimetype="application/json")
+
+        @self.app.route("/stream")
+        def stream_body():
+            return self.app.response_class(iter([BODY]), mimetype="application/json")
+
+        self.client = self.app.test_client()
+
+    def test_gzip_when_accepted(self):
+        """Positive test: JSON bodies are gzipped for clients that accept it."""
+        response = self.client.get("/json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert gzip.decompress(response.data) == BODY
+
+    def test_brotli_preferred_when_installed(self):
+        """Positive test: Brotli wins over gzip when both are accepted and brotli is installed."""
+        brotli = pytest.importorskip("brotli")
+        response = self.client.get("/json", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["Content-Encoding"] == "br"
+        assert brotli.decompress(response.data) == BODY
+
+    @pytest.mark.skipif(compression.brotli is not None, reason="brotli is installed")
+    def test_gzip_without_brotli(self):
+        """Edge case: Without the brotli package only gzip is offered."""
+        response = self.client.get("/json", headers={"Accept-Encoding": "br, gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    def test_identity_without_accept_encoding(self):
+        """Negative test: Clients that did not ask for compression get plain bytes."""
+        response = self.client.get("/json")
+        assert "Content-Encoding" not in response.headers
+        assert response.data == BODY
+
+    def test_refused_encoding(self):
+        """Negative test: An encoding with q=0 is never chosen."""
+        response = self.client.get("/json", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "Content-Encoding" not in response.headers
+
+    def test_small_body_not_compressed(self):
+        """Edge case: Bodies under the size threshold are sent as they are."""
+        response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert response.data == b"{}"
+
+    def test_streamed_body_not_compressed(self):
+        """Edge case: Streamed responses are left alone."""
+        response = self.client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert response.data == BODY
+
+    def test_encode_reuses_cache_and_tags_etag(self):
+        """Positive test: Cached compressed bytes are reused and the ETag names the encoding."""
+        cache = {"gzip": b"cached"}
+        with self.app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+            response = self.app.response_class(mimetype="application/json")
+            response.set_etag("abc")
+            assert self.compressor.encode(response, BODY, cache) == "gzip"
+            assert response.get_data() == b"cached"
+            assert response.get_etag() == ("abc-gzip", False)
+
+    def test_encode_fills_cache(self):
+        """Positive test: A missing encoding is compressed once and stored."""
+        cache = {}
+        with self.app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+            response = self.app.response_class(mimetype="application/json")
+            self.compressor.encode(response, BODY, cache)
+        assert gzip.decompress(cache["gzip"]) == BODY
+
+    def test_disabled(self):
+        """Negative test: A disabled compressor never compresses."""
+        compressor = Compressor(CompressionConfig(enabled=False, min_size=0, gzip_level=6, brotli_quality=5))
+        with self.app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+            assert compressor.choose(len(BODY)) is None
@@ -0,0 +1,95 @@
+"""Tests for the pooled connections behind BaseDAO."""
+
+import time
+
+import pytest
+
+from src.config import PoolConfig, get_connection_kwargs
+from src.dal.connection_pool import ConnectionPool, PoolTimeoutError, get_pool
+from src.dal.country_dao import CountryDAO
+from src.dal.vacation_dao import VacationDAO
+from tests.test_db_init import init_test_db
+
+
+@pytest.fixture(autouse=True)
+def setup_test_db():
+    """Initialize test database before each test."""
+    init_test_db()
+
+
+def make_pool(**overrides) -> ConnectionPool:
+    """Build a standalone pool against the test database."""
+    settings = {
+        "min_size": 0,
+        "max_size": 2,
+        "idle_timeout": 300.0,
+        "checkout_timeout": 0.2,
+        "health_check_interval": 30.0,
+    }
+    settings.update(overrides)
+    return ConnectionPool(get_connection_kwargs(), PoolConfig(**settings))
+
+
+class TestConnectionPool:
+    """Test suite for ConnectionPool."""
+
+    def test_connection_is_reused(self):
+        """Positive test: A returned connection is handed out again."""
+        pool = make_pool()
+        conn = pool.getconn()
+        pool.putconn(conn)
+        assert pool.getconn() is conn
+        stats = pool.stats()
+        assert stats.created == 1
+        assert stats.in_use == 1
+        assert stats.checkouts == 2
+        pool.close()
+
+    def test_checkout_times_out_when_exhausted(self):
+        """Negative test: Checkout fails once max size is reached."""
+        pool = make_pool(max_size=1)
+        pool.getconn()
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn()
+        pool.close()
+
+    def test_broken_connection_is_replaced(self):
+        """Positive test: A closed idle connection is discarded on checkout."""
+        pool = make_pool()
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.close()
+        fresh = pool.getconn()
+        assert fresh is not conn
+        assert pool.stats().discarded == 1
+        pool.close()
+
+    def test_idle_connections_are_reaped(self):
+        """Positive test: Idle connections past the timeout are closed without further pool use."""
+        pool = make_pool(idle_timeout=0.01)
+        first = pool.getconn()
+        second = pool.getconn()
+        pool.putconn(first)
+        pool.putconn(second)
+        for _ in range(100):
+            if pool.stats().idle == 0:
+                break
+            time.sleep(0.01)
+        assert pool.stats().idle == 0
+        assert pool.stats().size == 0
+        pool.close()
+
+    def test_invalid_sizes(self):
+        """Negative test: Min size larger than max size."""
+        with pytest.raises(ValueError, match="min size"):
+            make_pool(min_size=3, max_size=2)
+
+    def test_daos_share_process_pool(self):
+        """Positive test: Consecutive DAO calls do not open new connections."""
+        VacationDAO().list_all()
+        pool = get_pool(get_connection_kwargs())
+        created = pool.stats().created
+        CountryDAO().list_all()
+        VacationDAO().get_by_id(1)
+        assert pool.stats().created == created
+        assert pool.stats().in_use == 0
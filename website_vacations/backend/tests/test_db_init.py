@@ -4,11 +4,15 @@ import os
 import psycopg2
 from pathlib import Path
 
+from src.services.catalog_cache import get_catalog_cache
+
 
 def init_test_db() -> None:
     """
     Initialize the test database by executing the schema SQL script.
     This should be called at the beginning of each test run.
+    Also empties the in-process catalog cache, which would otherwise
+    keep serving rows from the previous test's database.
     """
     # Read the schema SQL file
     schema_path = Path(__file__).parent.parent / "sql" / "schema.sql"
@@ -32,4 +36,5 @@ def init_test_db() -> None:
         conn.commit()
     finally:
         conn.close()
+    get_catalog_cache().clear()
 
@@ -0,0 +1,61 @@
+"""Tests for the precompiled API encoders."""
+
+import dataclasses
+
+import pytest
+
+from src.api.encoders import CATALOG_VACATION_ENCODER, COUNTRY_ENCODER, DtoEncoder
+from src.api.json_provider import to_camel
+from src.models.dtos import CountryDTO
+from tests.factories import make_catalog_item
+
+
+class TestEncoders:
+    """Test suite for DtoEncoder."""
+
+    def test_catalog_dto_to_camel_case(self):
+        """Positive test: Fields become camelCase and dates ISO strings."""
+        assert CATALOG_VACATION_ENCODER.from_dto(make_catalog_item(7, 3, True)) == {
+            "id": 7,
+            "countryId": 1,
+            "countryName": "France",
+            "description": "Vacation 7",
+            "startDate": "2030-01-08",
+            "endDate": "2030-01-15",
+            "price": 1000.0,
+            "imageName": None,
+            "likesCount": 3,
+            "isLiked": True,
+        }
+
+    def test_omit_none(self):
+        """Positive test: isLiked is left out when there is no viewing user."""
+        assert "isLiked" not in CATALOG_VACATION_ENCODER.from_dto(make_catalog_item(7, 3))
+
+    def test_placeholder_only_when_present(self):
+        """Positive test: imagePlaceholder is sent inline once the image has one."""
+        item = dataclasses.replace(make_catalog_item(7, 3), image_placeholder="data:image/webp;base64,AAAA")
+        assert CATALOG_VACATION_ENCODER.from_dto(item)["imagePlaceholder"] == "data:image/webp;base64,AAAA"
+        assert "imagePlaceholder" not in CATALOG_VACATION_ENCODER.from_dto(make_catalog_item(7, 3))
+
+    def test_row_matches_dto(self):
+        """Positive test: A tuple row in field order encodes like its DTO."""
+        item = make_catalog_item(7, 3, False)
+        assert CATALOG_VACATION_ENCODER.from_row(dataclasses.astuple(item)) == \
+            CATALOG_VACATION_ENCODER.from_dto(item)
+        assert COUNTRY_ENCODER.from_row((1, "Greece")) == {"id": 1, "name": "Greece"}
+
+    def test_unknown_omit_field(self):
+        """Negative test: omit_none must name real fields."""
+        with pytest.raises(ValueError):
+            DtoEncoder(CountryDTO, omit_none=("missing",))
+
+    def test_dtos_are_frozen(self):
+        """Negative test: DTOs cannot be changed after creation."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            make_catalog_item(7, 3).likes_count = 4
+
+    def test_to_camel(self):
+        """Edge case: Single-word names are unchanged."""
+        assert to_camel("id") == "id"
+        assert to_camel("start_date") == "startDate"
@@ -0,0 +1,113 @@
+"""Tests for the orphaned image garbage collector."""
+
+import os
+
+from src.config import ImageConfig
+from src.services.image_gc import ImageGarbageCollector
+from src.services.image_pipeline import VARIANTS_DIR
+
+OLD = 1_000_000_000
+
+
+class FakeVacationDAO:
+    """Answers image reference queries from a set instead of the database."""
+
+    def __init__(self, referenced: set[str]) -> None:
+        self.referenced = referenced
+
+    def list_image_names(self):
+        return sorted(self.referenced)
+
+    def list_referenced_image_names(self, image_names):
+        return [name for name in image_names if name in self.referenced]
+
+
+def write(path, old: bool = True) -> None:
+    """Create a file, backdated past any grace period unless ``old`` is False."""
+    path.write_bytes(b"image bytes")
+    if old:
+        os.utime(path, (OLD, OLD))
+
+
+class TestImageGarbageCollector:
+    """Test suite for ImageGarbageCollector."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.removed = []
+        self.dao = FakeVacationDAO({"paris.jpg"})
+
+    def make_gc(self, directory) -> ImageGarbageCollector:
+        """Build a collector over ``directory`` with a one-hour grace period."""
+        config = ImageConfig(
+            directory=str(directory), variants_enabled=False, variant_workers=1,
+            cache_max_bytes=0, cache_item_max_bytes=0, gc_grace_period=3600, upload_max_bytes=0,
+        )
+        return ImageGarbageCollector(config, vacation_dao=self.dao, on_removed=self.removed.append)
+
+    def test_collect_removes_orphans_and_variants(self, tmp_path):
+        """Positive test: Unreferenced old files and their variants are deleted."""
+        write(tmp_path / "paris.jpg")
+        write(tmp_path / "brazil.jpg")
+        (tmp_path / VARIANTS_DIR / "brazil.jpg").mkdir(parents=True)
+        report = self.make_gc(tmp_path).collect()
+        assert report.orphans == ["brazil.jpg"]
+        assert sorted(os.listdir(tmp_path)) == ["paris.jpg", VARIANTS_DIR]
+        assert os.listdir(tmp_path / VARIANTS_DIR) == []
+        assert self.removed == ["brazil.jpg"]
+
+    def test_dry_run_deletes_nothing(self, tmp_path):
+        """Positive test: A dry run only reports what it would delete."""
+        write(tmp_path / "brazil.jpg")
+        report = self.make_gc(tmp_path).collect(dry_run=True)
+        assert report.orphans == ["brazil.jpg"]
+        assert report.freed_bytes == len(b"image bytes")
+        assert os.listdir(tmp_path) == ["brazil.jpg"]
+
+    def test_grace_period_protects_new_files(self, tmp_path):
+        """Negative test: Files newer than the grace period are kept."""
+        write(tmp_path / "upload.jpg", old=False)
+        report = self.make_gc(tmp_path).collect()
+        assert report.orphans == []
+        assert report.recent == 1
+        assert self.make_gc(tmp_path).collect(grace_period=0).orphans == ["upload.jpg"]
+
+    def test_abandoned_uploads_and_variant_dirs(self, tmp_path):
+        """Edge case: Stale temp uploads and variants without an original are swept."""
+        write(tmp_path / ".upload-abc")
+        (tmp_path / VARIANTS_DIR / "gone.jpg").mkdir(parents=True)
+        os.utime(tmp_path / VARIANTS_DIR / "gone.jpg", (OLD, OLD))
+        report = self.make_gc(tmp_path).collect()
+        assert report.orphans == [".upload-abc", "gone.jpg"]
+        assert not (tmp_path / VARIANTS_DIR / "gone.jpg").exists()
+
+    def test_release_keeps_shared_files(self, tmp_path):
+        """Positive test: Released files go only when no vacation still uses them."""
+        write(tmp_path / "paris.jpg")
+        write(tmp_path / "brazil.jpg")
+        gc = self.make_gc(tmp_path)
+        assert gc.schedule(["paris.jpg", "brazil.jpg"]).result() == ["brazil.jpg"]
+        assert os.listdir(tmp_path) == ["paris.jpg"]
+        assert gc.stats()["removed"] == 1
+        gc.shutdown()
+
+    def test_release_skips_recent_uploads(self, tmp_path):
+        """Edge case: A just-written file may be about to be referenced and is kept."""
+        write(tmp_path / "brazil.jpg", old=False)
+        assert self.make_gc(tmp_path).release(["brazil.jpg", "../etc/passwd"]) == []
+        assert os.listdir(tmp_path) == ["brazil.jpg"]
+
+    def test_collect_rechecks_before_unlinking(self, tmp_path):
+        """Negative test: A file re-uploaded after the listing is kept."""
+        write(tmp_path / "brazil.jpg")
+        gc = self.make_gc(tmp_path)
+
+        def list_image_names():
+            # The racing upload touches the object while references are read
+            os.utime(tmp_path / "brazil.jpg")
+            return []
+
+        self.dao.list_image_names = list_image_names
+        report = gc.collect()
+        assert report.orphans == []
+        assert os.listdir(tmp_path) == ["brazil.jpg"]
@@ -0,0 +1,109 @@
+"""Tests for the image variant pipeline."""
+
+import base64
+import io
+import os
+
+from PIL import Image
+
+from src.config import ImageConfig
+from src.services.image_pipeline import (
+    PLACEHOLDER_MAX_LENGTH,
+    PLACEHOLDER_SIZES,
+    ImagePipeline,
+    read_manifest,
+    render_placeholder,
+    render_variants,
+    variant_dir,
+)
+
+
+def write_image(directory, name: str, width: int, height: int) -> None:
+    """Save a solid JPEG original."""
+    Image.new("RGB", (width, height), (200, 120, 40)).save(os.path.join(directory, name), "JPEG")
+
+
+class TestImagePipeline:
+    """Test suite for ImagePipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.ready = []
+
+    def make_pipeline(self, directory, enabled: bool = True) -> ImagePipeline:
+        """Build a pipeline over ``directory`` that records finished images."""
+        config = ImageConfig(
+            directory=str(directory), variants_enabled=enabled, variant_workers=1,
+            cache_max_bytes=0, cache_item_max_bytes=0, gc_grace_period=0, upload_max_bytes=0,
+        )
+        return ImagePipeline(config, on_ready=self.ready.append)
+
+    def test_render_variants(self, tmp_path):
+        """Positive test: Every size and format is written, never wider than the original."""
+        write_image(tmp_path, "beach.jpg", 1600, 900)
+        manifest = render_variants(str(tmp_path), "beach.jpg")
+        assert manifest["sizes"]["card"]["width"] == 480
+        assert manifest["sizes"]["card"]["height"] == 270
+        assert manifest["sizes"]["detail"]["width"] == 1280
+        assert manifest["sizes"]["retina"]["width"] == 1600
+        for entry in manifest["sizes"].values():
+            assert os.path.isfile(os.path.join(variant_dir(str(tmp_path), "beach.jpg"), entry["webp"]))
+        assert read_manifest(str(tmp_path), "beach.jpg") == manifest
+
+    def test_placeholder_in_manifest(self, tmp_path):
+        """Positive test: The manifest carries an inline thumbnail under 1 KB."""
+        Image.effect_noise((1600, 900), 80).convert("RGB").save(tmp_path / "noise.jpg", "JPEG")
+        placeholder = render_variants(str(tmp_path), "noise.jpg")["placeholder"]
+        assert placeholder.startswith("data:image/")
+        assert len(placeholder) <= PLACEHOLDER_MAX_LENGTH
+
+    def test_placeholder_keeps_aspect_ratio(self):
+        """Edge case: Very tall images shrink to fit within the placeholder size."""
+        thumb = Image.open(io.BytesIO(base64.b64decode(
+            render_placeholder(Image.new("RGB", (100, 2000), (10, 20, 30))).split(",", 1)[1]
+        )))
+        assert thumb.height == PLACEHOLDER_SIZES[0]
+        assert thumb.width == 1
+
+    def test_small_original_shares_files(self, tmp_path):
+        """Edge case: Sizes wider than a small original reuse one rendering."""
+        write_image(tmp_path, "small.jpg", 300, 200)
+        sizes = render_variants(str(tmp_path), "small.jpg")["sizes"]
+        assert sizes["card"] == sizes["detail"] == sizes["retina"]
+        assert sizes["card"]["width"] == 300
+
+    def test_urls_fall_back_to_original(self, tmp_path):
+        """Positive test: Until variants exist only the original is offered."""
+        write_image(tmp_path, "beach.jpg", 800, 600)
+        pipeline = self.make_pipeline(tmp_path)
+        assert pipeline.urls("beach.jpg") == {"original": "/images/beach.jpg"}
+
+    def test_submit_renders_in_pool(self, tmp_path):
+        """Positive test: Submitted images get variants and variant URLs."""
+        write_image(tmp_path, "beach.jpg", 800, 600)
+        pipeline = self.make_pipeline(tmp_path)
+        try:
+            future = pipeline.submit("beach.jpg")
+            assert future.result(timeout=60)["source"] == "beach.jpg"
+        finally:
+            pipeline.shutdown()
+        assert self.ready == ["beach.jpg"]
+        urls = pipeline.urls("beach.jpg")
+        assert urls["card"]["webp"] == "/images/variants/beach.jpg/card.webp"
+        assert urls["card"]["width"] == 480
+        assert pipeline.stats()["completed"] == 1
+
+    def test_submit_rejects_unsafe_or_missing_names(self, tmp_path):
+        """Negative test: Paths and missing files are never queued."""
+        pipeline = self.make_pipeline(tmp_path)
+        assert pipeline.submit("../etc/passwd") is None
+        assert pipeline.submit("missing.jpg") is None
+        assert pipeline.submit(None) is None
+
+    def test_disabled_pipeline(self, tmp_path):
+        """Negative test: A disabled pipeline queues nothing and serves originals."""
+        write_image(tmp_path, "beach.jpg", 800, 600)
+        render_variants(str(tmp_path), "beach.jpg")
+        pipeline = self.make_pipeline(tmp_path, enabled=False)
+        assert pipeline.submit("beach.jpg") is None
+        assert pipeline.urls("beach.jpg") == {"original": "/images/beach.jpg"}
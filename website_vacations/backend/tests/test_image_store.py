@@ -0,0 +1,87 @@
+"""Tests for content-addressed image storage."""
+
+import hashlib
+import io
+import os
+
+from src.services.image_store import ImageStore, content_name, is_content_name
+
+DATA = b"\xff\xd8\xff" + bytes(range(256)) * 600
+
+
+class TestImageStore:
+    """Test suite for ImageStore."""
+
+    def test_save_names_file_by_content(self, tmp_path):
+        """Positive test: An upload is stored under the sha256 of its bytes."""
+        store = ImageStore(str(tmp_path))
+        name = store.save(io.BytesIO(DATA), "Beach Photo.JPG")
+        assert name == hashlib.sha256(DATA).hexdigest() + ".jpg"
+        assert is_content_name(name)
+        with open(tmp_path / name, "rb") as f:
+            assert f.read() == DATA
+
+    def test_identical_uploads_share_one_file(self, tmp_path):
+        """Positive test: Uploading the same bytes twice keeps one file."""
+        store = ImageStore(str(tmp_path))
+        first = store.save(io.BytesIO(DATA), "a.jpg")
+        second = store.save(io.BytesIO(DATA), "b.jpg")
+        assert first == second
+        assert os.listdir(tmp_path) == [first]
+
+    def test_failed_upload_leaves_nothing(self, tmp_path):
+        """Negative test: A stream that fails midway leaves no file behind."""
+
+        class Broken(io.BytesIO):
+            def read(self, size=-1):
+                raise OSError("connection reset")
+
+        store = ImageStore(str(tmp_path))
+        try:
+            store.save(Broken(), "a.jpg")
+        except OSError:
+            pass
+        assert os.listdir(tmp_path) == []
+
+    def test_unsafe_extension_dropped(self):
+        """Edge case: Extensions that could not be part of a content name are dropped."""
+        assert content_name("ab" * 32, "../x.j/pg") == "ab" * 32
+        assert content_name("ab" * 32, None) == "ab" * 32
+        assert not is_content_name("brazil_1765280969.jpg")
+
+    def test_plan_migration_groups_copies(self, tmp_path):
+        """Positive test: Byte-identical legacy files map to one content name."""
+        for name in ("brazil.jpg", "brazil_1765280969.jpg"):
+            (tmp_path / name).write_bytes(DATA)
+        (tmp_path / "paris.jpg").write_bytes(b"other")
+        (tmp_path / "variants").mkdir()
+        store = ImageStore(str(tmp_path))
+        plan = store.plan_migration()
+        assert plan[content_name(hashlib.sha256(DATA).hexdigest(), "brazil.jpg")] == [
+            "brazil.jpg", "brazil_1765280969.jpg",
+        ]
+        assert len(plan) == 2
+
+    def test_adopt_is_idempotent(self, tmp_path):
+        """Edge case: Migrated objects are skipped when the migration runs again."""
+        (tmp_path / "brazil.jpg").write_bytes(DATA)
+        store = ImageStore(str(tmp_path))
+        (image_name, names), = store.plan_migration().items()
+        store.adopt(image_name, names[0])
+        store.adopt(image_name, names[0])
+        assert store.remove("brazil.jpg")
+        assert store.plan_migration() == {}
+        assert os.listdir(tmp_path) == [image_name]
+
+    def test_failed_background_step_is_logged(self, tmp_path, caplog):
+        """Negative test: A failure after placement is counted and logged with the image name."""
+        def fail(image_name):
+            raise RuntimeError("pipeline down")
+
+        store = ImageStore(str(tmp_path), on_stored=fail)
+        name = store.save(io.BytesIO(b"abc"), "a.png")
+        store.persist_async(name)
+        store.shutdown()
+        assert store.stats()["errors"] == 1
+        assert name in caplog.text
+        assert (tmp_path / name).read_bytes() == b"abc"
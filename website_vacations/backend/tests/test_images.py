@@ -0,0 +1,107 @@
+"""Tests for image serving."""
+
+import hashlib
+import os
+
+from flask import Flask
+
+from src.api.images import IMMUTABLE, REVALIDATE, init_images, is_immutable
+from src.config import ImageConfig
+
+DATA = bytes(range(256)) * 40
+DIGEST = hashlib.sha256(DATA).hexdigest()
+
+
+class TestImageServer:
+    """Test suite for ImageServer."""
+
+    def make_client(self, directory, cache_max_bytes: int = 1 << 20, cache_item_max_bytes: int = 1 << 16):
+        """Serve ``directory`` from a new app and return its test client."""
+        config = ImageConfig(
+            directory=str(directory), variants_enabled=False, variant_workers=1,
+            cache_max_bytes=cache_max_bytes, cache_item_max_bytes=cache_item_max_bytes,
+            gc_grace_period=0, upload_max_bytes=0,
+        )
+        app = Flask(__name__)
+        self.server = init_images(app, config)
+        return app.test_client()
+
+    def test_content_name_is_immutable(self, tmp_path):
+        """Positive test: Content-addressed files are cached for a year and tagged by hash."""
+        (tmp_path / f"{DIGEST}.jpg").write_bytes(DATA)
+        response = self.make_client(tmp_path).get(f"/images/{DIGEST}.jpg")
+        assert response.status_code == 200
+        assert response.data == DATA
+        assert response.headers["Cache-Control"] == IMMUTABLE
+        assert response.headers["Content-Type"] == "image/jpeg"
+        assert response.get_etag() == (DIGEST, False)
+
+    def test_legacy_name_revalidates(self, tmp_path):
+        """Positive test: Other names must revalidate, and a matching ETag gets a 304."""
+        (tmp_path / "paris.jpg").write_bytes(DATA)
+        client = self.make_client(tmp_path)
+        first = client.get("/images/paris.jpg")
+        assert first.headers["Cache-Control"] == REVALIDATE
+        second = client.get("/images/paris.jpg", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_byte_range(self, tmp_path):
+        """Positive test: Range requests get 206 with just the requested bytes."""
+        (tmp_path / "paris.jpg").write_bytes(DATA)
+        for client in (self.make_client(tmp_path), self.make_client(tmp_path, cache_max_bytes=0)):
+            response = client.get("/images/paris.jpg", headers={"Range": "bytes=10-19"})
+            assert response.status_code == 206
+            assert response.data == DATA[10:20]
+            assert response.headers["Content-Range"] == f"bytes 10-19/{len(DATA)}"
+
+    def test_unsatisfiable_range(self, tmp_path):
+        """Negative test: A range past the end of the file is refused."""
+        (tmp_path / "paris.jpg").write_bytes(DATA)
+        response = self.make_client(tmp_path).get("/images/paris.jpg", headers={"Range": "bytes=999999-"})
+        assert response.status_code == 416
+
+    def test_small_files_served_from_memory(self, tmp_path):
+        """Positive test: A cached immutable file is served even after the disk copy is gone."""
+        (tmp_path / f"{DIGEST}.jpg").write_bytes(DATA)
+        client = self.make_client(tmp_path)
+        client.get(f"/images/{DIGEST}.jpg")
+        os.unlink(tmp_path / f"{DIGEST}.jpg")
+        assert client.get(f"/images/{DIGEST}.jpg").data == DATA
+        assert self.server.stats()["hits"] == 1
+        self.server.forget(f"{DIGEST}.jpg")
+        assert client.get(f"/images/{DIGEST}.jpg").status_code == 404
+
+    def test_lru_evicts_oldest(self, tmp_path):
+        """Edge case: The cache never holds more than its byte budget."""
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            (tmp_path / name).write_bytes(DATA)
+        client = self.make_client(tmp_path, cache_max_bytes=2 * len(DATA), cache_item_max_bytes=len(DATA))
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            client.get(f"/images/{name}")
+        assert self.server.stats()["entries"] == 2
+        assert self.server.stats()["bytes"] == 2 * len(DATA)
+
+    def test_modified_legacy_file_reloaded(self, tmp_path):
+        """Edge case: A cached file with a mutable name is re-read after it changes."""
+        path = tmp_path / "paris.jpg"
+        path.write_bytes(DATA)
+        client = self.make_client(tmp_path)
+        client.get("/images/paris.jpg")
+        path.write_bytes(b"new bytes")
+        os.utime(path, ns=(1, 1))
+        assert client.get("/images/paris.jpg").data == b"new bytes"
+
+    def test_path_traversal_and_hidden_files(self, tmp_path):
+        """Negative test: Paths outside the directory, hidden and missing files are 404."""
+        (tmp_path / ".upload-abc").write_bytes(DATA)
+        client = self.make_client(tmp_path)
+        assert client.get("/images/../secret.txt").status_code == 404
+        assert client.get("/images/.upload-abc").status_code == 404
+        assert client.get("/images/missing.jpg").status_code == 404
+
+    def test_is_immutable(self):
+        """Edge case: Variants of content-addressed originals are immutable, the manifest is not."""
+        assert is_immutable(f"variants/{DIGEST}.jpg/card.avif")
+        assert not is_immutable(f"variants/{DIGEST}.jpg/manifest.json")
+        assert not is_immutable("variants/paris.jpg/card.avif")
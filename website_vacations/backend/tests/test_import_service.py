@@ -0,0 +1,102 @@
+"""Tests for ImportService."""
+
+import io
+import json
+import pytest
+from datetime import date, timedelta
+
+from src.dal.vacation_dao import VacationDAO
+from src.services.import_service import ImportService
+from tests.test_db_init import init_test_db
+
+
+@pytest.fixture(autouse=True)
+def setup_test_db():
+    """Initialize test database before each test."""
+    init_test_db()
+
+
+class TestImportService:
+    """Test suite for ImportService."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = ImportService()
+        self.start = date.today() + timedelta(days=30)
+        self.end = self.start + timedelta(days=7)
+
+    def write_csv(self, tmp_path, rows: list[str]):
+        """Write a vacations CSV with the given data lines."""
+        path = tmp_path / "vacations.csv"
+        path.write_text(
+            "country_id,description,start_date,end_date,price\n" + "\n".join(rows) + "\n",
+            encoding="utf-8",
+        )
+        return path
+
+    def test_import_vacations_csv(self, tmp_path):
+        """Positive test: Valid rows are bulk-loaded across several batches."""
+        before = len(list(VacationDAO().list_all()))
+        rows = [f"1,Imported {i},{self.start},{self.end},{100 + i}" for i in range(25)]
+        report = self.service.import_file("vacations", self.write_csv(tmp_path, rows), batch_size=10)
+        assert report.rows_read == 25
+        assert report.imported == 25
+        assert report.rejected == 0
+        assert report.batches == 3
+        assert len(list(VacationDAO().list_all())) == before + 25
+
+    def test_import_vacations_rejects(self, tmp_path):
+        """Negative test: Invalid rows go to the reject file with their error."""
+        rows = [
+            f"1,Good,{self.start},{self.end},100",
+            f"1,Too expensive,{self.start},{self.end},20000",
+            f"1,Backwards,{self.end},{self.start},100",
+            f"99999,Nowhere,{self.start},{self.end},100",
+        ]
+        rejects = io.StringIO()
+        report = self.service.import_file("vacations", self.write_csv(tmp_path, rows), rejects)
+        assert report.imported == 1
+        assert report.rejected == 3
+        errors = [json.loads(line) for line in rejects.getvalue().splitlines()]
+        assert [e["line"] for e in errors] == [3, 4, 5]
+        assert errors[0]["error"] == "Price must be between 0 and 10,000"
+        assert errors[1]["error"] == "End date cannot be earlier than start date"
+        assert errors[2]["error"] == "Country with ID 99999 does not exist"
+
+    def test_import_vacations_by_country_name(self, tmp_path):
+        """Positive test: JSONL rows may name the country instead of its ID."""
+        path = tmp_path / "vacations.jsonl"
+        path.write_text(json.dumps({
+            "country": "france",
+            "description": "Named country",
+            "startDate": self.start.isoformat(),
+            "endDate": self.end.isoformat(),
+            "price": 500,
+        }) + "\n", encoding="utf-8")
+        report = self.service.import_file("vacations", path)
+        assert report.imported == 1
+
+    def test_import_countries_and_users(self, tmp_path):
+        """Positive test: Countries and users import, duplicates are rejected."""
+        countries = tmp_path / "countries.csv"
+        countries.write_text("name\nAtlantis\nAtlantis\nFrance\n", encoding="utf-8")
+        report = self.service.import_file("countries", countries)
+        assert report.imported == 1
+        assert report.rejected == 2
+
+        users = tmp_path / "users.jsonl"
+        users.write_text(
+            json.dumps({"first_name": "Ann", "last_name": "Lee", "email": "ann@example.com", "password": "1234"})
+            + "\n"
+            + json.dumps({"first_name": "Ann", "last_name": "Lee", "email": "bad-email", "password": "1234"})
+            + "\n",
+            encoding="utf-8",
+        )
+        report = self.service.import_file("users", users)
+        assert report.imported == 1
+        assert report.rejected == 1
+
+    def test_import_invalid_kind(self, tmp_path):
+        """Negative test: Unknown import kinds are refused."""
+        with pytest.raises(ValueError, match="Import kind"):
+            self.service.import_file("likes", tmp_path / "likes.csv")
@@ -0,0 +1,55 @@
+"""Tests for the fast JSON provider."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify, request
+
+from src.api.json_provider import dumps_bytes, init_json, loads
+from src.models.dtos import LikeDTO
+
+
+@dataclass
+class SampleDTO:
+    """A dataclass without a registered encoder."""
+
+    vacation_id: int
+    start_date: date
+
+
+class TestJsonProvider:
+    """Test suite for FastJSONProvider."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.app = Flask(__name__)
+        init_json(self.app)
+
+    def test_dates_and_decimals(self):
+        """Positive test: Dates are ISO strings and Decimals numbers."""
+        data = dumps_bytes({"day": date(2030, 1, 2), "at": datetime(2030, 1, 2, 3, 4, 5), "price": Decimal("12.50")})
+        assert loads(data) == {"day": "2030-01-02", "at": "2030-01-02T03:04:05", "price": 12.5}
+
+    def test_dataclasses_use_camel_case(self):
+        """Positive test: Dataclasses serialize as camelCase objects."""
+        assert loads(dumps_bytes([LikeDTO(user_id=1, vacation_id=2), SampleDTO(3, date(2030, 1, 1))])) == [
+            {"userId": 1, "vacationId": 2},
+            {"vacationId": 3, "startDate": "2030-01-01"},
+        ]
+
+    def test_jsonify_and_get_json(self):
+        """Positive test: jsonify and request.get_json go through the provider."""
+        @self.app.route("/echo", methods=["POST"])
+        def echo():
+            return jsonify(received=request.get_json(), day=date(2030, 1, 1))
+
+        response = self.app.test_client().post("/echo", json={"a": [1, 2]})
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"received": {"a": [1, 2]}, "day": "2030-01-01"}
+
+    def test_unsupported_type(self):
+        """Negative test: Unknown types still fail loudly."""
+        with pytest.raises(TypeError):
+            dumps_bytes({"value": object()})
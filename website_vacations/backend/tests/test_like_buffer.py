@@ -0,0 +1,148 @@
+"""Tests for the write-behind like buffer."""
+
+import time
+
+import pytest
+
+from src.config import LikeBufferConfig
+from src.dal.unit_of_work import run_after_commit
+from src.services.catalog_cache import CatalogEntry, get_catalog_cache
+from src.services.like_buffer import LikeBuffer
+from tests.factories import make_catalog_item
+
+
+class FakeLikeDAO:
+    """Records the pairs a flush writes instead of touching the database."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.liked: list[tuple[int, int]] = []
+        self.unliked: list[tuple[int, int]] = []
+        self.on_write = None
+
+    def insert_pairs(self, pairs):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.liked.extend(pairs)
+        return list(pairs)
+
+    def delete_pairs(self, pairs):
+        if self.on_write is not None:
+            self.on_write()
+        self.unliked.extend(pairs)
+        return list(pairs)
+
+
+class TestLikeBuffer:
+    """Test suite for LikeBuffer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.dao = FakeLikeDAO()
+        # A huge interval keeps the background flusher out of the way
+        self.buffer = LikeBuffer(
+            LikeBufferConfig(enabled=True, max_pending=100, flush_interval=3600.0), self.dao
+        )
+
+    def teardown_method(self):
+        """Stop the background flusher."""
+        self.buffer.stop()
+
+    def test_coalesces_per_user_and_vacation(self):
+        """Positive test: Repeated changes to one pair keep only the last state."""
+        assert self.buffer.record(1, 10, stored=False, liked=True)
+        assert not self.buffer.record(1, 10, stored=False, liked=True)
+        assert self.buffer.effective_state(1, 10) is True
+        assert self.buffer.pending_delta(10) == 1
+        assert self.buffer.stats()["depth"] == 1
+
+    def test_toggle_back_cancels_write(self):
+        """Positive test: Liking then unliking leaves nothing to write."""
+        self.buffer.record(1, 10, stored=False, liked=True)
+        self.buffer.record(1, 10, stored=False, liked=False)
+        assert self.buffer.effective_state(1, 10) is None
+        assert self.buffer.pending_delta(10) == 0
+        assert self.buffer.flush() == 0
+        assert self.dao.liked == [] and self.dao.unliked == []
+        assert self.buffer.stats()["cancelled"] == 1
+
+    def test_flush_writes_batch(self):
+        """Positive test: A flush writes likes and unlikes and clears the buffer."""
+        self.buffer.record(1, 10, stored=False, liked=True)
+        self.buffer.record(2, 10, stored=False, liked=True)
+        self.buffer.record(3, 11, stored=True, liked=False)
+        assert self.buffer.flush() == 3
+        assert self.dao.liked == [(1, 10), (2, 10)]
+        assert self.dao.unliked == [(3, 11)]
+        assert not self.buffer.has_pending()
+        assert self.buffer.pending_delta(10) == 0
+        stats = self.buffer.stats()
+        assert stats["flushes"] == 1
+        assert stats["flushed"] == 3
+
+    def test_flush_retires_batch_with_the_commit(self):
+        """Edge case: Cached results showing a flushed vacation are gone once its delta is."""
+        cache = get_catalog_cache()
+        cache.put("flushed", CatalogEntry([make_catalog_item(10, likes_count=5)], None, None, False), cache.version)
+        self.buffer.record(1, 10, stored=False, liked=True)
+        self.buffer.flush()
+        assert self.buffer.pending_delta(10) == 0
+        assert cache.get("flushed") is None
+        # A count read after the commit already includes the like
+        assert self.buffer.overlay([make_catalog_item(10, likes_count=6)], user_id=1)[0].likes_count == 6
+
+    def test_committing_batch_is_counted_once(self):
+        """Edge case: While a batch commits, only counts read before it began get its delta."""
+        seen = {}
+
+        def during_commit():
+            seen["before"] = self.buffer.pending_delta(10, since=mark)
+            seen["during"] = self.buffer.pending_delta(10, since=self.buffer.watermark())
+            # Readers and writers are not blocked by the commit
+            seen["recorded"] = self.buffer.record(2, 10, stored=False, liked=True)
+
+        self.dao.on_write = lambda: run_after_commit(during_commit)
+        self.buffer.record(1, 10, stored=False, liked=True)
+        mark = self.buffer.watermark()
+        self.buffer.flush()
+        assert seen == {"before": 1, "during": 0, "recorded": True}
+        assert self.buffer.pending_delta(10) == 1
+
+    def test_overlay_applies_pending_changes(self):
+        """Positive test: Readers see buffered counts and their own likes."""
+        self.buffer.record(1, 10, stored=False, liked=True)
+        self.buffer.record(2, 10, stored=False, liked=True)
+        items = [make_catalog_item(10, likes_count=5), make_catalog_item(11, likes_count=2)]
+        overlaid = self.buffer.overlay(items, user_id=1)
+        assert overlaid[0].likes_count == 7
+        assert overlaid[0].is_liked is True
+        assert overlaid[1] is items[1]
+        assert items[0].likes_count == 5
+
+    def test_failed_flush_requeues(self):
+        """Negative test: A failed flush keeps the changes for the next attempt."""
+        self.dao.fail = True
+        self.buffer.record(1, 10, stored=False, liked=True)
+        with pytest.raises(RuntimeError):
+            self.buffer.flush()
+        assert self.buffer.effective_state(1, 10) is True
+        assert self.buffer.pending_delta(10) == 1
+        assert self.buffer.stats()["errors"] == 1
+
+        self.dao.fail = False
+        assert self.buffer.flush() == 1
+        assert self.dao.liked == [(1, 10)]
+
+    def test_size_trigger_flushes_in_background(self):
+        """Positive test: Reaching max_pending wakes the flusher."""
+        buffer = LikeBuffer(LikeBufferConfig(enabled=True, max_pending=2, flush_interval=3600.0), self.dao)
+        try:
+            buffer.record(1, 10, stored=False, liked=True)
+            buffer.record(1, 11, stored=False, liked=True)
+            for _ in range(100):
+                if buffer.stats()["flushes"]:
+                    break
+                time.sleep(0.01)
+            assert self.dao.liked == [(1, 10), (1, 11)]
+        finally:
+            buffer.stop()
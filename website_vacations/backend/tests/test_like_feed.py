@@ -0,0 +1,180 @@
+"""Tests for the Server-Sent Events like feed."""
+
+import json
+import threading
+
+import pytest
+
+from src.config import LikeBufferConfig, LikeFeedConfig
+from src.services.like_buffer import LikeBuffer
+from src.services.like_feed import HEARTBEAT_FRAME, RESYNC_FRAME, RETRY_FRAME, FeedFullError, LikeFeed
+
+
+class FakeVacationDAO:
+    """Serves like counts from a dict instead of the database."""
+
+    def __init__(self, counts: dict[int, int]) -> None:
+        self.counts = counts
+        self.queries: list[list[int]] = []
+        self.fail = False
+
+    def get_likes_counts(self, vacation_ids):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.queries.append(list(vacation_ids))
+        return [(v, self.counts[v]) for v in vacation_ids if v in self.counts]
+
+
+class NullLikeDAO:
+    """Accepts like-buffer flushes without a database."""
+
+    def insert_pairs(self, pairs):
+        return list(pairs)
+
+    def delete_pairs(self, pairs):
+        return list(pairs)
+
+
+def events(frame: bytes) -> list[dict]:
+    """Decode the data of every "likes" event in a chunk of frames."""
+    return [
+        json.loads(line[len("data: "):])
+        for line in frame.decode().splitlines()
+        if line.startswith("data: {\"changes\"")
+    ]
+
+
+class TestLikeFeed:
+    """Test suite for LikeFeed."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.dao = FakeVacationDAO({1: 3, 2: 7})
+        self.buffer = LikeBuffer(
+            LikeBufferConfig(enabled=True, max_pending=100, flush_interval=60.0), NullLikeDAO()
+        )
+        # A long interval keeps the dispatcher thread out of the way; tests dispatch by hand
+        self.feed = LikeFeed(
+            LikeFeedConfig(enabled=True, interval=60.0, heartbeat=0.01, history=2, max_subscribers=2),
+            vacation_dao=self.dao,
+            like_buffer=self.buffer,
+        )
+
+    def teardown_method(self):
+        """Stop the dispatcher and the buffer's flusher."""
+        self.feed.stop()
+        self.buffer.stop()
+
+    def test_disabled_on_plain_threads(self):
+        """Negative test: Without greenlet workers the feed stays off, whatever the config says."""
+        assert not self.feed.enabled
+        assert self.feed.stats()["enabled"] is False
+
+    def test_publish_without_subscribers_is_free(self):
+        """Edge case: Nothing is queued while no client listens."""
+        self.feed.publish(1)
+        assert not self.feed.dispatch()
+        assert self.dao.queries == []
+
+    def test_changes_are_coalesced(self):
+        """Positive test: Repeated changes become one event with one query."""
+        stream = self.feed.stream()
+        assert next(stream) == RETRY_FRAME
+        for vacation_id in (1, 2, 1, 1):
+            self.feed.publish(vacation_id)
+        assert self.feed.dispatch()
+        assert self.dao.queries == [[1, 2]]
+        assert events(next(stream)) == [{"changes": [
+            {"vacationId": 1, "likesCount": 3},
+            {"vacationId": 2, "likesCount": 7},
+        ]}]
+        stream.close()
+        assert self.feed.stats()["subscribers"] == 0
+
+    def test_all_subscribers_get_the_same_bytes(self):
+        """Positive test: One encoded event fans out to every client."""
+        first, second = self.feed.stream(), self.feed.stream()
+        next(first), next(second)
+        self.feed.publish(2)
+        self.feed.dispatch()
+        assert next(first) == next(second)
+        assert self.feed.stats()["events"] == 1
+
+    def test_subscribers_are_capped(self):
+        """Negative test: Past max_subscribers a stream is refused until one closes."""
+        first, second = self.feed.stream(), self.feed.stream()
+        with pytest.raises(FeedFullError):
+            self.feed.stream()
+        # Closed before its first frame, it still gives its slot back
+        first.close()
+        assert next(self.feed.stream()) == RETRY_FRAME
+        second.close()
+
+    def test_heartbeat_when_idle(self):
+        """Positive test: Idle streams send a comment to keep the connection open."""
+        stream = self.feed.stream()
+        next(stream)
+        assert next(stream) == HEARTBEAT_FRAME
+
+    def test_replay_after_reconnect(self):
+        """Positive test: A client reconnecting with Last-Event-ID gets what it missed."""
+        stream = self.feed.stream()
+        next(stream)
+        self.feed.publish(1)
+        self.feed.dispatch()
+        stream.close()
+
+        resumed = self.feed.stream(last_event_id=0)
+        next(resumed)
+        assert events(next(resumed))[0]["changes"][0]["vacationId"] == 1
+
+    def test_resync_when_history_overflows(self):
+        """Negative test: Missing more events than the history holds asks for a reload."""
+        stream = self.feed.stream()
+        next(stream)
+        for _ in range(3):
+            self.feed.publish(1)
+            self.feed.dispatch()
+        resumed = self.feed.stream(last_event_id=0)
+        next(resumed)
+        assert next(resumed).startswith(RESYNC_FRAME)
+
+    def test_resync_after_restart(self):
+        """Edge case: An ID from before a restart triggers a reload at once."""
+        assert next(self.feed.stream(last_event_id=42)) == RETRY_FRAME + RESYNC_FRAME
+
+    def test_buffered_likes_are_included(self):
+        """Positive test: Counts include likes still waiting in the buffer."""
+        stream = self.feed.stream()
+        next(stream)
+        self.buffer.record(5, 1, stored=False, liked=True)
+        self.feed.publish(1)
+        self.feed.dispatch()
+        assert events(next(stream))[0]["changes"] == [{"vacationId": 1, "likesCount": 4}]
+
+    def test_failed_dispatch_keeps_changes(self):
+        """Negative test: Vacations stay dirty when the count query fails."""
+        stream = self.feed.stream()
+        next(stream)
+        self.feed.publish(1)
+        self.dao.fail = True
+        with pytest.raises(RuntimeError):
+            self.feed.dispatch()
+        self.dao.fail = False
+        assert self.feed.dispatch()
+        assert self.feed.stats()["errors"] == 1
+
+    def test_stop_ends_streams(self):
+        """Positive test: Stopping the feed ends open streams."""
+        stream = self.feed.stream()
+        next(stream)
+        done = threading.Event()
+
+        def drain():
+            for _ in stream:
+                pass
+            done.set()
+
+        threading.Thread(target=drain, daemon=True).start()
+        self.feed.stop()
+        assert done.wait(1)
@@ -0,0 +1,79 @@
+"""Tests for the request-scoped unit of work."""
+
+import pytest
+from datetime import date, timedelta
+
+from src.config import get_connection_kwargs
+from src.dal.connection_pool import get_pool
+from src.dal.unit_of_work import UnitOfWork, current_unit_of_work, unit_of_work
+from src.dal.vacation_dao import VacationDAO
+from src.services.vacation_service import VacationService
+from tests.test_db_init import init_test_db
+
+
+@pytest.fixture(autouse=True)
+def setup_test_db():
+    """Initialize test database before each test."""
+    init_test_db()
+
+
+class TestUnitOfWork:
+    """Test suite for unit_of_work."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.dao = VacationDAO()
+        self.today = date.today()
+
+    def _vacation_data(self, description: str) -> dict:
+        return {
+            "country_id": 1,
+            "description": description,
+            "start_date": self.today + timedelta(days=10),
+            "end_date": self.today + timedelta(days=15),
+            "price": 1000.0,
+            "image_name": None,
+        }
+
+    def test_daos_share_one_connection(self):
+        """Positive test: All DAO calls in a unit of work use one checkout."""
+        pool = get_pool(get_connection_kwargs())
+        with unit_of_work() as uow:
+            checkouts = pool.stats().checkouts
+            self.dao.list_all()
+            self.dao.get_by_id(1)
+            VacationService().update_vacation(1, description="Shared")
+            assert pool.stats().checkouts == checkouts + 1
+            assert uow.is_open
+        assert current_unit_of_work() is None
+        assert self.dao.get_by_id(1)["description"] == "Shared"
+
+    def test_commits_once_at_end(self):
+        """Positive test: Writes become visible to other connections on exit."""
+        with unit_of_work():
+            vacation_id = self.dao.insert(self._vacation_data("Pending"))
+        assert VacationDAO().get_by_id(vacation_id) is not None
+
+    def test_rolls_back_on_error(self):
+        """Negative test: An exception discards every write in the unit."""
+        with pytest.raises(RuntimeError):
+            with unit_of_work():
+                vacation_id = self.dao.insert(self._vacation_data("Discarded"))
+                raise RuntimeError("boom")
+        assert self.dao.get_by_id(vacation_id) is None
+
+    def test_failed_service_call_is_atomic(self):
+        """Negative test: A failed update leaves no partial changes."""
+        service = VacationService()
+        with pytest.raises(ValueError, match="does not exist"):
+            service.update_vacation(1, description="Partial", country_id=9999)
+        assert self.dao.get_by_id(1)["description"] != "Partial"
+
+    def test_commit_runs_callbacks_once(self):
+        """Edge case: Committing early runs the callbacks, and completing later does not repeat them."""
+        calls = []
+        uow = UnitOfWork()
+        uow.on_commit(lambda: calls.append("committed"))
+        uow.commit()
+        uow.complete()
+        assert calls == ["committed"]
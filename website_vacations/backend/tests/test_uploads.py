@@ -0,0 +1,86 @@
+"""Tests for streaming image uploads."""
+
+import hashlib
+import io
+import os
+
+from flask import Flask, jsonify, request
+from werkzeug.exceptions import HTTPException
+
+from src.api.uploads import accept_upload, init_uploads
+from src.config import ImageConfig
+from src.services.image_store import ImageStore, sniff_image
+
+JPEG = b"\xff\xd8\xff\xe0" + bytes(range(256)) * 8
+
+
+class TestUploads:
+    """Test suite for streaming uploads."""
+
+    def make_client(self, directory, max_bytes: int = 4096):
+        """Build an app with an upload route storing into ``directory``."""
+        app = Flask(__name__)
+        config = ImageConfig(
+            directory=str(directory), variants_enabled=False, variant_workers=1,
+            cache_max_bytes=0, cache_item_max_bytes=0, gc_grace_period=0, upload_max_bytes=max_bytes,
+        )
+        self.stored = []
+        self.store = ImageStore(str(directory), on_stored=self.stored.append)
+        init_uploads(app, config, self.store)
+
+        @app.route("/upload", methods=["POST"])
+        def upload():
+            try:
+                return jsonify({"imageName": accept_upload(request.files["image"])}), 201
+            except HTTPException as e:
+                return jsonify({"error": e.description}), e.code
+
+        return app.test_client()
+
+    def post(self, client, data: bytes, filename: str = "photo.png"):
+        """Upload ``data`` as the "image" field."""
+        return client.post(
+            "/upload", data={"image": (io.BytesIO(data), filename)}, content_type="multipart/form-data"
+        )
+
+    def test_upload_is_hashed_and_placed(self, tmp_path):
+        """Positive test: The stored name is the hash plus the sniffed, not claimed, extension."""
+        response = self.post(self.make_client(tmp_path), JPEG)
+        assert response.status_code == 201
+        image_name = response.get_json()["imageName"]
+        assert image_name == hashlib.sha256(JPEG).hexdigest() + ".jpg"
+        self.store.shutdown()
+        assert self.stored == [image_name]
+        assert os.listdir(tmp_path) == [image_name]
+        assert (tmp_path / image_name).read_bytes() == JPEG
+
+    def test_too_large_upload_refused(self, tmp_path):
+        """Negative test: Uploads over the limit get 413 and leave nothing on disk."""
+        response = self.post(self.make_client(tmp_path, max_bytes=1024), JPEG)
+        assert response.status_code == 413
+        assert os.listdir(tmp_path) == []
+
+    def test_non_image_refused(self, tmp_path):
+        """Negative test: Content that is not an accepted image format gets 415."""
+        response = self.post(self.make_client(tmp_path), b"<?php system($_GET['c']); ?>", "x.jpg")
+        assert response.status_code == 415
+        assert os.listdir(tmp_path) == []
+
+    def test_unused_upload_removed(self, tmp_path):
+        """Edge case: A streamed file the handler never accepts is deleted with the request."""
+        client = self.make_client(tmp_path)
+        client.application.add_url_rule(
+            "/ignore", "ignore", lambda: (str(len(request.files)), 200), methods=["POST"]
+        )
+        client.post(
+            "/ignore", data={"image": (io.BytesIO(JPEG), "a.jpg")}, content_type="multipart/form-data"
+        )
+        assert os.listdir(tmp_path) == []
+
+    def test_sniff_image(self):
+        """Edge case: Formats are recognised from their leading bytes."""
+        assert sniff_image(b"\x89PNG\r\n\x1a\n\0\0\0\0") == ".png"
+        assert sniff_image(b"RIFF\0\0\0\0WEBP") == ".webp"
+        assert sniff_image(b"\0\0\0\x1cftypavif") == ".avif"
+        assert sniff_image(b"GIF89a") == ".gif"
+        assert sniff_image(b"%PDF-1.7") is None
@@ -2,6 +2,8 @@
 
 import pytest
 
+from src.config import LikeBufferConfig
+from src.services.like_buffer import LikeBuffer
 from src.services.user_service import UserService
 from tests.test_db_init import init_test_db
 
@@ -151,6 +153,43 @@ class TestUserService:
         with pytest.raises(ValueError, match="already liked"):
             self.service.like_vacation(user.id, 1)
 
+    def test_like_vacation_returns_count(self):
+        """Positive test: Liking reports the vacation's new likes count."""
+        first = self.service.register_user("Count", "One", "count1@example.com", "pass1234")
+        second = self.service.register_user("Count", "Two", "count2@example.com", "pass1234")
+        assert self.service.like_vacation(first.id, 1).likes_count == 1
+        result = self.service.like_vacation(second.id, 1)
+        assert result.liked is True
+        assert result.changed is True
+        assert result.likes_count == 2
+
+    def test_like_vacation_not_found(self):
+        """Negative test: Like a vacation that does not exist."""
+        user = self.service.register_user("Missing", "User", "missing@example.com", "pass1234")
+        with pytest.raises(ValueError, match="does not exist"):
+            self.service.like_vacation(user.id, 99999)
+
+    def test_set_like_is_idempotent(self):
+        """Positive test: Repeating a like or unlike reports no change."""
+        user = self.service.register_user("Idem", "User", "idem@example.com", "pass1234")
+        assert self.service.set_like(user.id, 1, True).changed is True
+        repeat = self.service.set_like(user.id, 1, True)
+        assert repeat.changed is False
+        assert repeat.likes_count == 1
+        assert self.service.set_like(user.id, 1, False).changed is True
+        repeat = self.service.set_like(user.id, 1, False)
+        assert repeat.changed is False
+        assert repeat.likes_count == 0
+
+    def test_buffered_like_unknown_user(self):
+        """Negative test: A buffered like by a missing user fails like an unbuffered one."""
+        self.service._like_buffer = LikeBuffer(
+            LikeBufferConfig(enabled=True, max_pending=100, flush_interval=3600.0)
+        )
+        with pytest.raises(ValueError, match="User with ID 99999 does not exist"):
+            self.service.set_like(99999, 1, True)
+        assert not self.service._like_buffer.has_pending()
+
     # ========== Unlike Vacation Tests ==========
 
     def test_unlike_vacation_success(self):
@@ -167,3 +206,35 @@ class TestUserService:
         user = self.service.register_user("NoLike", "User", "nolike@example.com", "pass1234")
         with pytest.raises(ValueError, match="has not liked"):
             self.service.unlike_vacation(user.id, 1)
+
+    # ========== Batch Like Tests ==========
+
+    def test_apply_like_batch_success(self):
+        """Positive test: Batch applies likes and unlikes with per-item results."""
+        user = self.service.register_user("Batch", "User", "batch@example.com", "pass1234")
+        self.service.like_vacation(user.id, 3)
+        results = self.service.apply_like_batch(
+            user.id, [(1, True), (2, True), (3, False), (4, False), (99999, True)]
+        )
+        assert [r.status for r in results] == [
+            "liked", "liked", "unliked", "not_liked", "not_found"
+        ]
+        assert results[0].likes_count == 1
+        assert results[2].likes_count == 0
+
+    def test_apply_like_batch_last_operation_wins(self):
+        """Positive test: Repeated vacations resolve to the last operation."""
+        user = self.service.register_user("Last", "Wins", "lastwins@example.com", "pass1234")
+        results = self.service.apply_like_batch(user.id, [(1, True), (1, False), (1, True)])
+        assert [r.status for r in results] == ["superseded", "superseded", "liked"]
+
+    def test_apply_like_batch_empty(self):
+        """Negative test: Empty batch."""
+        with pytest.raises(ValueError, match="At least one"):
+            self.service.apply_like_batch(1, [])
+
+    def test_apply_like_batch_unknown_user(self):
+        """Negative test: Batch for a user that does not exist."""
+        with pytest.raises(ValueError, match="does not exist"):
+            self.service.apply_like_batch(99999, [(1, True)])
+
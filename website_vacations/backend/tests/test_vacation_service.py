@@ -49,6 +49,95 @@ class TestVacationService:
         vacations = list(self.service.list_vacations())
         assert any(v.description == "Past vacation" for v in vacations)
 
+    def test_iter_vacations_matches_list(self):
+        """Positive test: Streaming yields the same vacations in the same order."""
+        listed = [v.id for v in self.service.list_vacations()]
+        streamed = [v.id for v in self.service.iter_vacations(itersize=5)]
+        assert streamed == listed
+
+    def test_iter_vacations_inside_unit_of_work(self):
+        """Positive test: Streaming shares the unit of work's connection."""
+        from src.dal.unit_of_work import unit_of_work
+        with unit_of_work() as uow:
+            first = next(self.service.iter_vacations(itersize=2))
+            assert uow.is_open
+        assert first.id is not None
+
+    def test_iter_catalog_matches_list_catalog(self):
+        """Positive test: Streaming the catalog yields the cached catalog's rows."""
+        listed = list(self.service.list_catalog())
+        streamed = list(self.service.iter_catalog(itersize=4))
+        assert streamed == listed
+
+    def test_iter_catalog_invalid_filters(self):
+        """Negative test: Filters are validated before any row is read."""
+        from src.models.dtos import VacationFilters
+        with pytest.raises(ValueError):
+            self.service.iter_catalog(filters=VacationFilters(status="past"))
+
+    def test_iter_vacations_invalid_itersize(self):
+        """Negative test: itersize must be positive."""
+        with pytest.raises(ValueError):
+            list(self.service.iter_vacations(itersize=0))
+
+    # ========== Catalog Tests ==========
+
+    def test_list_catalog_success(self):
+        """Positive test: Catalog includes country names and likes counts."""
+        catalog = list(self.service.list_catalog())
+        assert len(catalog) >= 12
+        paris = next(v for v in catalog if v.image_name == "paris.jpg")
+        assert paris.country_name == "France"
+        assert paris.likes_count == 0
+        assert paris.is_liked is None
+        for i in range(len(catalog) - 1):
+            assert catalog[i].start_date <= catalog[i + 1].start_date
+
+    def test_list_catalog_user_likes(self):
+        """Positive test: Catalog flags vacations liked by the given user."""
+        from src.services.user_service import UserService
+        user_service = UserService()
+        user = user_service.register_user("Catalog", "User", "catalog@example.com", "pass1234")
+        user_service.like_vacation(user.id, 1)
+        catalog = {v.id: v for v in self.service.list_catalog(user.id)}
+        assert catalog[1].is_liked is True
+        assert catalog[1].likes_count == 1
+        assert catalog[2].is_liked is False
+
+    def test_list_catalog_page_walks_all_rows(self):
+        """Positive test: Following next_cursor visits every vacation once."""
+        seen = []
+        cursor = None
+        while True:
+            page = self.service.list_catalog_page(cursor=cursor, limit=5)
+            seen.extend(v.id for v in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        all_ids = [v.id for v in self.service.list_catalog()]
+        assert seen == all_ids
+
+    def test_list_catalog_filters(self):
+        """Positive test: Country, price and status filters run server-side."""
+        from src.models.dtos import VacationFilters
+        france = self.service.list_catalog(filters=VacationFilters(country_id=2))
+        assert [v.country_name for v in france] == ["France"]
+        cheap = self.service.list_catalog(filters=VacationFilters(max_price=1800.0))
+        assert cheap and all(v.price <= 1800.0 for v in cheap)
+        ongoing = self.service.list_catalog(filters=VacationFilters(status="ongoing"))
+        assert ongoing == []
+
+    def test_list_catalog_page_invalid_cursor(self):
+        """Negative test: Malformed cursor."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.service.list_catalog_page(cursor="not-a-cursor")
+
+    def test_list_catalog_liked_requires_user(self):
+        """Negative test: Liked filter without a user."""
+        from src.models.dtos import VacationFilters
+        with pytest.raises(ValueError, match="User ID is required"):
+            self.service.list_catalog(filters=VacationFilters(liked_only=True))
+
     # ========== Add Vacation Tests ==========
 
     def test_add_vacation_success(self):
@@ -264,7 +353,65 @@ class TestVacationService:
         with pytest.raises(ValueError, match="has not liked"):
             user_service.unlike_vacation(user.id, vacation.id)
 
+    # ========== Likes Counter Tests ==========
+
+    def test_likes_count_follows_likes(self):
+        """Positive test: The likes_count counter tracks likes and unlikes."""
+        from src.dal.like_dao import LikeDAO
+        from src.services.user_service import UserService
+        user_service = UserService()
+        like_dao = LikeDAO()
+        user = user_service.register_user("Counter", "User", "counter@example.com", "pass1234")
+        user_service.like_vacation(user.id, 3)
+        assert like_dao.count_by_vacation(3) == 1
+        user_service.unlike_vacation(user.id, 3)
+        assert like_dao.count_by_vacation(3) == 0
+
+    def test_reconcile_likes_count(self):
+        """Positive test: Reconciliation repairs a drifted counter."""
+        from src.dal.like_dao import LikeDAO
+        from src.dal.vacation_dao import VacationDAO
+        dao = VacationDAO()
+        with dao._cursor() as cur:
+            cur.execute("UPDATE vacations SET likes_count = 5 WHERE id = 4")
+        assert self.service.reconcile_likes_count() == 1
+        assert LikeDAO().count_by_vacation(4) == 0
+        assert self.service.reconcile_likes_count() == 0
+
     def test_delete_vacation_not_found(self):
         """Negative test: Delete non-existent vacation."""
         with pytest.raises(ValueError, match="does not exist"):
             self.service.delete_vacation(99999)
+
+    # ========== Catalog Changes Tests ==========
+
+    def test_catalog_changes_full_sync(self):
+        """Positive test: since=0 returns the whole catalog and no deletions."""
+        changes = self.service.get_catalog_changes()
+        assert len(changes.items) == len(list(self.service.list_catalog()))
+        assert changes.deleted_ids == []
+        assert changes.version > 0
+
+    def test_catalog_changes_since_version(self):
+        """Positive test: Only rows written after the version are returned."""
+        from src.services.user_service import UserService
+        user_service = UserService()
+        user = user_service.register_user("Delta", "User", "delta@example.com", "pass1234")
+        version = self.service.get_catalog_changes().version
+
+        user_service.like_vacation(user.id, 2)
+        self.service.delete_vacation(5)
+        changes = self.service.get_catalog_changes(user.id, version)
+        assert [v.id for v in changes.items] == [2]
+        assert changes.items[0].likes_count == 1
+        assert changes.items[0].is_liked is True
+        assert changes.deleted_ids == [5]
+
+        later = self.service.get_catalog_changes(user.id, changes.version)
+        assert later.items == []
+        assert later.deleted_ids == []
+
+    def test_catalog_changes_negative_since(self):
+        """Negative test: A negative version is rejected."""
+        with pytest.raises(ValueError, match="Since"):
+            self.service.get_catalog_changes(since=-1)
@@ -1,12 +1,11 @@
 import { useEffect, useState } from "react";
 import "./Homepage.scss";
-import { api, Vacation, Country } from "../../utils/api";
+import { api, Vacation } from "../../utils/api";
 import { useAppSelector } from "../../hooks/useAppSelector";
 import { useNavigate } from "react-router-dom";
 
 const Homepage = () => {
   const [vacations, setVacations] = useState<Vacation[]>([]);
-  const [countries, setCountries] = useState<Country[]>([]);
   const [likedVacations, setLikedVacations] = useState<Set<number>>(new Set());
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string>("");
@@ -20,28 +19,12 @@ const Homepage = () => {
   const loadData = async () => {
     try {
       setIsLoading(true);
-      const [vacationsData, countriesData] = await Promise.all([
-        api.getVacations(),
-        api.getCountries(),
-      ]);
-      // Sort vacations by start date ascending
-      const sortedVacations = [...vacationsData].sort((a, b) => {
-        const dateA = new Date(a.startDate).getTime();
-        const dateB = new Date(b.startDate).getTime();
-        return dateA - dateB;
-      });
-      setVacations(sortedVacations);
-      setCountries(countriesData);
-
-      // Load user likes if logged in
-      if (user) {
-        try {
-          const likes = await api.getUserLikes(user.id);
-          setLikedVacations(new Set(likes.likedVacationIds));
-        } catch (err) {
-          console.error("Failed to load likes:", err);
-        }
-      }
+      // One request returns country names, like counts and the user's likes
+      const vacationsData = await api.getVacations(user?.id);
+      setVacations(vacationsData);
+      setLikedVacations(
+        new Set(vacationsData.filter((v) => v.isLiked).map((v) => v.id))
+      );
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load vacations");
     } finally {
@@ -49,11 +32,6 @@ const Homepage = () => {
     }
   };
 
-  const getCountryName = (countryId: number): string => {
-    const country = countries.find((c) => c.id === countryId);
-    return country?.name || "Unknown";
-  };
-
   const handleLike = async (vacationId: number) => {
     if (!user) {
       navigate("/login");
@@ -62,25 +40,24 @@ const Homepage = () => {
 
     try {
       const isLiked = likedVacations.has(vacationId);
-      if (isLiked) {
-        await api.unlikeVacation(user.id, vacationId);
-        setLikedVacations((prev) => {
-          const newSet = new Set(prev);
+      const result = isLiked
+        ? await api.unlikeVacation(user.id, vacationId)
+        : await api.likeVacation(user.id, vacationId);
+      setLikedVacations((prev) => {
+        const newSet = new Set(prev);
+        if (result.liked) {
+          newSet.add(vacationId);
+        } else {
           newSet.delete(vacationId);
-          return newSet;
-        });
-      } else {
-        await api.likeVacation(user.id, vacationId);
-        setLikedVacations((prev) => new Set(prev).add(vacationId));
-      }
-      // Reload vacations to update likes count
-      const vacationsData = await api.getVacations();
-      const sortedVacations = [...vacationsData].sort((a, b) => {
-        const dateA = new Date(a.startDate).getTime();
-        const dateB = new Date(b.startDate).getTime();
-        return dateA - dateB;
+        }
+        return newSet;
       });
-      setVacations(sortedVacations);
+      // The response carries the new count, so no catalog refetch is needed
+      setVacations((prev) =>
+        prev.map((v) =>
+          v.id === vacationId ? { ...v, likesCount: result.likesCount } : v
+        )
+      );
     } catch (err) {
       alert(err instanceof Error ? err.message : "Failed to update like");
     }
@@ -143,20 +120,40 @@ const Homepage = () => {
             vacations.map((vacation) => (
               <div key={vacation.id} className="homepage__vacation-card">
                 {vacation.imageName && (
-                  <div className="homepage__image-container">
-                    <img
-                      src={`http://localhost:5000/images/${vacation.imageName}`}
-                      alt={vacation.description}
-                      className="homepage__image"
-                      onError={(e) => {
-                        (e.target as HTMLImageElement).style.display = "none";
-                      }}
-                    />
+                  <div
+                    className="homepage__image-container"
+                    style={
+                      vacation.imagePlaceholder
+                        ? { backgroundImage: `url(${vacation.imagePlaceholder})` }
+                        : undefined
+                    }
+                  >
+                    <picture>
+                      {(["avif", "webp"] as const).map((format) => {
+                        const card = vacation.images?.card?.[format];
+                        // The detail size is roughly twice the card's width
+                        const double = vacation.images?.detail?.[format];
+                        if (!card) return null;
+                        const srcSet = double && double !== card
+                          ? `http://localhost:5000${card} 1x, http://localhost:5000${double} 2x`
+                          : `http://localhost:5000${card}`;
+                        return <source key={format} type={`image/${format}`} srcSet={srcSet} />;
+                      })}
+                      <img
+                        src={`http://localhost:5000/images/${vacation.imageName}`}
+                        alt={vacation.description}
+                        className="homepage__image"
+                        loading="lazy"
+                        onError={(e) => {
+                          (e.target as HTMLImageElement).style.display = "none";
+                        }}
+                      />
+                    </picture>
                   </div>
                 )}
                 <div className="homepage__content">
                   <h2 className="homepage__country">
-                    {getCountryName(vacation.countryId)}
+                    {vacation.countryName || "Unknown"}
                   </h2>
                   <p className="homepage__description">{vacation.description}</p>
                   <div className="homepage__details">
@@ -9,6 +9,21 @@ export interface User {
   isAdmin?: boolean;
 }
 
+export interface ImageVariant {
+  width: number;
+  height: number;
+  avif?: string;
+  webp?: string;
+}
+
+// "original" is always present; sizes appear once their variants are ready
+export interface VacationImages {
+  original: string;
+  card?: ImageVariant;
+  detail?: ImageVariant;
+  retina?: ImageVariant;
+}
+
 export interface Vacation {
   id: number;
   countryId: number;
@@ -18,6 +33,43 @@ export interface Vacation {
   price: number;
   imageName?: string;
   likesCount?: number;
+  countryName?: string;
+  isLiked?: boolean;
+  images?: VacationImages;
+  // data: URI of a tiny thumbnail (under 1 KB) painted until the image loads
+  imagePlaceholder?: string;
+}
+
+export interface VacationFilters {
+  liked?: boolean;
+  status?: "ongoing" | "upcoming";
+  countryId?: number;
+  minPrice?: number;
+  maxPrice?: number;
+}
+
+export interface VacationPage {
+  items: Vacation[];
+  nextCursor: string | null;
+}
+
+export interface VacationChanges {
+  version: number;
+  items: Vacation[];
+  deletedIds: number[];
+}
+
+export interface LikeCountChange {
+  vacationId: number;
+  likesCount: number;
+}
+
+export interface LikeResult {
+  message: string;
+  vacationId: number;
+  liked: boolean;
+  changed: boolean;
+  likesCount: number;
 }
 
 export interface Country {
@@ -99,14 +151,14 @@ class ApiService {
     });
   }
 
-  async likeVacation(userId: number, vacationId: number): Promise<void> {
-    return this.request<void>(`/users/${userId}/likes/${vacationId}`, {
+  async likeVacation(userId: number, vacationId: number): Promise<LikeResult> {
+    return this.request<LikeResult>(`/users/${userId}/likes/${vacationId}`, {
       method: "POST",
     });
   }
 
-  async unlikeVacation(userId: number, vacationId: number): Promise<void> {
-    return this.request<void>(`/users/${userId}/likes/${vacationId}`, {
+  async unlikeVacation(userId: number, vacationId: number): Promise<LikeResult> {
+    return this.request<LikeResult>(`/users/${userId}/likes/${vacationId}`, {
       method: "DELETE",
     });
   }
@@ -118,8 +170,32 @@ class ApiService {
   }
 
   // Vacation endpoints
-  async getVacations(): Promise<Vacation[]> {
-    return this.request<Vacation[]>("/vacations");
+  async getVacations(userId?: number): Promise<Vacation[]> {
+    const query = userId !== undefined ? `?userId=${userId}` : "";
+    return this.request<Vacation[]>(`/vacations${query}`);
+  }
+
+  async getVacationsPage(
+    userId?: number,
+    filters: VacationFilters = {},
+    cursor?: string,
+    limit: number = 20
+  ): Promise<VacationPage> {
+    const params = new URLSearchParams({ limit: limit.toString() });
+    if (userId !== undefined) params.set("userId", userId.toString());
+    if (cursor) params.set("cursor", cursor);
+    if (filters.liked) params.set("liked", "true");
+    if (filters.status) params.set("status", filters.status);
+    if (filters.countryId !== undefined) params.set("countryId", filters.countryId.toString());
+    if (filters.minPrice !== undefined) params.set("minPrice", filters.minPrice.toString());
+    if (filters.maxPrice !== undefined) params.set("maxPrice", filters.maxPrice.toString());
+    return this.request<VacationPage>(`/vacations?${params.toString()}`);
+  }
+
+  async getVacationChanges(since: number = 0, userId?: number): Promise<VacationChanges> {
+    const params = new URLSearchParams({ since: since.toString() });
+    if (userId !== undefined) params.set("userId", userId.toString());
+    return this.request<VacationChanges>(`/vacations/changes?${params.toString()}`);
   }
 
   async getVacation(vacationId: number): Promise<Vacation> {
@@ -201,6 +277,19 @@ class ApiService {
   async getCountries(): Promise<Country[]> {
     return this.request<Country[]>("/countries");
   }
+
+  // Live like counts (Server-Sent Events). Returns a function that closes the stream.
+  subscribeToLikeCounts(
+    onChange: (changes: LikeCountChange[]) => void,
+    onResync?: () => void
+  ): () => void {
+    const source = new EventSource(`${API_BASE_URL}/likes/stream`);
+    source.addEventListener("likes", (event) => {
+      onChange(JSON.parse((event as MessageEvent).data).changes);
+    });
+    if (onResync) source.addEventListener("resync", onResync);
+    return () => source.close();
+  }
 }
 
 export const api = new ApiService();